@@ -0,0 +1,78 @@
+"""
+adaptive_monte_carlo_benchmark.py
+
+Listen up, brother! This script compares estimating every cell of the class by boss win rate matrix with a
+fixed number of fights against estimating it adaptively to a margin with monte_carlo.py, and prints the
+fights and time each takes, the widest confidence interval left, and how the adaptive fights were spread
+over easy and close matchups. A run with a time budget is added to show the best estimate in that time.
+
+Run it from the repository root:
+
+    python benchmarks/adaptive_monte_carlo_benchmark.py [MARGIN] [TIME_BUDGET]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import math
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import fight_engine
+import monte_carlo
+
+
+def _report(label, estimates, seconds):
+    """_report Print the fights, the time and the widest interval of a run.
+    """
+    fights = sum(estimate.samples for estimate in estimates)
+    widest = max((estimate.high - estimate.low) / 2 for estimate in estimates)
+    converged = sum(estimate.converged for estimate in estimates)
+    print(f'{label.ljust(24)} {fights:>11,} fights {seconds:8.3f}s  widest +-{widest:.2%}  '
+          f'{converged}/{len(estimates)} within the margin')
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    margin = float(sys.argv[1]) if len(sys.argv) > 1 else 0.005
+    time_budget = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    matchups = [(player, fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor))
+                for _, _, entry in monte_carlo.boss_rows() for player in monte_carlo.class_fighters()]
+    # Estimate a fight first so importing NumPy is not timed.
+    monte_carlo.estimate_win_rate(*matchups[0], seed=0)
+
+    # The fixed number of fights a 50/50 matchup needs to reach the margin.
+    z = statistics.NormalDist().inv_cdf(0.975)
+    fixed = math.ceil(z * z / (4 * margin * margin))
+
+    print('-' * 96)
+    start = time.perf_counter()
+    rates = monte_carlo.win_rates(matchups, fixed, seed=42)
+    seconds = time.perf_counter() - start
+    estimates = [monte_carlo.Estimate(rate, *monte_carlo.wilson_interval(round(rate * fixed), fixed),
+                                      fixed, True) for rate in rates]
+    _report(f'fixed {fixed} per cell', estimates, seconds)
+
+    start = time.perf_counter()
+    estimates = monte_carlo.estimate_win_rates(matchups, margin, seed=42)
+    _report(f'adaptive +-{margin:.2%}', estimates, time.perf_counter() - start)
+
+    easy = [estimate.samples for estimate in estimates if not 0.05 < estimate.win_rate < 0.95]
+    close = [estimate.samples for estimate in estimates if 0.05 < estimate.win_rate < 0.95]
+    print(f'{"":24} easy cells {sum(easy) / max(len(easy), 1):9,.0f} fights on average, '
+          f'close calls {sum(close) / max(len(close), 1):9,.0f}')
+
+    start = time.perf_counter()
+    estimates = monte_carlo.estimate_win_rates(matchups, margin, time_budget=time_budget, seed=42)
+    _report(f'budget {time_budget * 1000:.0f}ms', estimates, time.perf_counter() - start)
+    print('-' * 96)
+
+
+if __name__ == "__main__":
+    main()
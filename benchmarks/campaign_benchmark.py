@@ -0,0 +1,47 @@
+"""
+campaign_benchmark.py
+
+Listen up, brother! This script measures how many whole headless campaigns per second campaign.py can
+play, first in a single process and then across a pool with one worker per CPU, so the scaling across
+cores can be checked on any machine.
+
+Run it from the repository root:
+
+    python benchmarks/campaign_benchmark.py [NUMBER_OF_CAMPAIGNS]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import campaign
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    campaigns = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cpus = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, 'campaigns.csv')
+        print('-' * 72)
+        for players in (1, 2, 3):
+            single = campaign.simulate(campaigns, players=players, jobs=1, output=output, seed=42)
+            pooled = campaign.simulate(campaigns, players=players, jobs=cpus, output=output, seed=42)
+            single_rate = single['campaigns'] / single['seconds']
+            pooled_rate = pooled['campaigns'] / pooled['seconds']
+            print(f'{players} player(s): {single_rate:10,.0f} campaigns/s on 1 job, '
+                  f'{pooled_rate:10,.0f} campaigns/s on {cpus} jobs '
+                  f'({pooled_rate / single_rate:.2f}x)')
+        print('-' * 72)
+
+
+if __name__ == "__main__":
+    main()
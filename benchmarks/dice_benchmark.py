@@ -0,0 +1,76 @@
+"""
+dice_benchmark.py
+
+Listen up, brother! This script compares how many d20 and d10 rolls per second each dice backend in
+dice.py can make, against the old approach of creating a new secrets.SystemRandom() for every roll.
+It also measures the vectorized backend's advantage rolls and its bulk NumPy arrays of rolls.
+
+Run it from the repository root:
+
+    python benchmarks/dice_benchmark.py
+
+Functions:
+    rolls_per_second(func, number) -> float:
+        Returns how many times func can be called per second, brother!
+
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import secrets
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import dice
+
+
+ROLLS = 200000
+
+
+def rolls_per_second(func, number=ROLLS):
+    """rolls_per_second Return how many times func can be called per second.
+
+    Args:
+        func (callable): The roll to time.
+        number (int, optional): The number of rolls per measurement.
+        Defaults to ROLLS.
+
+    Returns:
+        float: The best number of rolls per second.
+    """
+    return number / min(timeit.repeat(func, number=number, repeat=5))
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    print('-' * 60)
+    baseline = rolls_per_second(lambda: secrets.SystemRandom().randrange(1, 21))
+    print(f'{"new SystemRandom() per d20 (old)".ljust(34)} {baseline:14,.0f} rolls/s')
+
+    for backend in dice.BACKENDS:
+        dice.set_backend(backend, seed=42)
+        d20 = rolls_per_second(dice.roll_d20)
+        d10 = rolls_per_second(dice.roll_d10)
+        print(f'{(backend + " d20").ljust(34)} {d20:14,.0f} rolls/s ({d20 / baseline:5.1f}x)')
+        print(f'{(backend + " d10").ljust(34)} {d10:14,.0f} rolls/s ({d10 / baseline:5.1f}x)')
+
+    dice.set_backend('vectorized', seed=42)
+    advantage = rolls_per_second(lambda: dice.roll_d20(advantage=True))
+    print(f'{"vectorized d20 with advantage".ljust(34)} {advantage:14,.0f} rolls/s '
+          f'({advantage / baseline:5.1f}x)')
+
+    stream = dice.DiceStream(seed=42)
+    for label, kwargs in (('d20', {}), ('d20 with advantage', {'advantage': True})):
+        bulk = rolls_per_second(lambda: stream.rolls(20, dice.BLOCK_SIZE, **kwargs),
+                                number=20) * dice.BLOCK_SIZE
+        print(f'{("DiceStream.rolls() " + label).ljust(34)} {bulk:14,.0f} rolls/s '
+              f'({bulk / baseline:5.1f}x)')
+    print('-' * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+exact_solver_benchmark.py
+
+Listen up, brother! This script compares solving a fight exactly with exact_solver.py against estimating
+it by resolving fights one at a time with fight_engine.py, for a boss of every tier and every party size,
+and prints the win probability and expected rounds of both so they can be checked against each other.
+
+Run it from the repository root:
+
+    python benchmarks/exact_solver_benchmark.py [NUMBER_OF_FIGHTS]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import character
+import exact_solver
+import fight_engine
+import game_data
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = random.Random(42)
+    party = [fight_engine.from_character(character.Character.create(name, name))
+             for name in ('Vagabond', 'Samurai', 'Hero')]
+    roster = game_data.get_boss_roster()
+    # Solve a fight first so importing NumPy is not timed.
+    exact_solver.solve_fight(party[:1], fight_engine.Fighter('Dummy', 1, 1, 1))
+
+    print('-' * 96)
+    for tier in game_data.BOSS_TIERS:
+        # Fight the first boss of each tier so runs can be compared.
+        entry = roster.bosses(tier)[0]
+        boss_fighter = fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor)
+        for size in (1, 2, 3):
+            players = party[:size]
+            start = time.perf_counter()
+            solution = exact_solver.solve_fight(players, boss_fighter)
+            solved = time.perf_counter() - start
+
+            start = time.perf_counter()
+            results = [fight_engine.resolve_fight(players, boss_fighter, rng) for _ in range(fights)]
+            simulated = time.perf_counter() - start
+            wins = sum(result.won for result in results) / fights
+            rounds = sum(result.rounds for result in results) / fights
+
+            print(f'{tier.ljust(5)} {size} player(s) {entry.name[:20].ljust(20)} '
+                  f'exact {solution.win_probability:6.1%} {solution.expected_rounds:6.2f} rounds '
+                  f'{solved * 1000:7.1f}ms | {fights} fights {wins:6.1%} {rounds:6.2f} rounds '
+                  f'{simulated * 1000:7.1f}ms')
+    print('-' * 96)
+
+
+if __name__ == "__main__":
+    main()
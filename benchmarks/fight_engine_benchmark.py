@@ -0,0 +1,56 @@
+"""
+fight_engine_benchmark.py
+
+Listen up, brother! This script measures how many whole boss fights per second fight_engine.py can
+resolve in one process, for every boss tier and party size, with no prompts, printing or pauses.
+
+Run it from the repository root:
+
+    python benchmarks/fight_engine_benchmark.py [NUMBER_OF_FIGHTS]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import boss
+import character
+import fight_engine
+import game_data
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(42)
+    party = [fight_engine.from_character(character.Character.create(name, name))
+             for name in ('Samurai', 'Vagabond', 'Astrologer')]
+    roster = game_data.get_boss_roster()
+
+    print('-' * 72)
+    for tier in ('tutorial', 'field', 'mini', 'main'):
+        # Fight the first boss of each tier so runs can be compared.
+        boss_name = roster.bosses(tier)[0].name if tier != 'tutorial' else None
+        boss_obj = boss.Boss.create(tier, boss_name)
+        boss_fighter = fight_engine.from_boss(boss_obj)
+        for size in (1, 2, 3):
+            players = party[:size]
+            start = time.perf_counter()
+            wins = sum(fight_engine.resolve_fight(players, boss_fighter, rng).won
+                       for _ in range(fights))
+            elapsed = time.perf_counter() - start
+            print(f'{tier.ljust(8)} {size} player(s) {boss_fighter.name[:28].ljust(28)} '
+                  f'{fights / elapsed:10,.0f} fights/s  win {wins / fights:6.1%}')
+    print('-' * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+headless_factory_benchmark.py
+
+Listen up, brother! This script measures how many Characters and Bosses can be created per second with
+the headless Character.create() and Boss.create() factories, which skip the prompts, screen clears and
+pauses of the interactive flow.
+
+Run it from the repository root:
+
+    python benchmarks/headless_factory_benchmark.py
+
+Functions:
+    per_second(func, number) -> float:
+        Returns how many times func can be called per second, brother!
+
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import boss
+import character
+
+
+def per_second(func, number):
+    """per_second Return how many times func can be called per second.
+
+    Args:
+        func (callable): The function to time.
+        number (int): The number of times to call func per measurement.
+
+    Returns:
+        float: The best number of calls per second.
+    """
+    return number / min(timeit.repeat(func, number=number, repeat=5))
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    character.Character.load_templates()    # Parse the classes before timing.
+    boss.Boss.create('main')                # Load the boss roster before timing.
+
+    print('-' * 60)
+    results = [
+        ("Character.create('Samurai', ...)",
+         lambda: character.Character.create('Samurai', 'Tarnished')),
+        ("Character.create(..., stats={'Vig': 20})",
+         lambda: character.Character.create('Samurai', 'Tarnished', stats={'Vig': 20})),
+        ("Boss.create('tutorial')", boss.Boss.create),
+        ("Boss.create('main')", lambda: boss.Boss.create('main')),
+    ]
+    for label, func in results:
+        print(f'{label.ljust(42)} {per_second(func, 20000):12,.0f} /s')
+    print('-' * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+level_up_benchmark.py
+
+Listen up, brother! This script compares spending a big rune budget one level at a time with
+Character.level_up(), which updates the stats after every level, against buying every affordable level in
+one step with Character.level_up_stats(), which finds the levels in the rune cost table and updates the
+stats once. Both follow the 'balanced' level-up policy of campaign.py and must end with the same player.
+
+Run it from the repository root:
+
+    python benchmarks/level_up_benchmark.py [RUNES] [NUMBER_OF_PLAYERS]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import campaign
+import character
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    runes = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    players = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    character.Character.load_templates()
+
+    def fresh():
+        player = character.Character.create('Vagabond', 'Vagabond')
+        player.add_runes(runes)
+        return player
+
+    print('-' * 96)
+    start = time.perf_counter()
+    for _ in range(players):
+        one_at_a_time = fresh()
+        stat = campaign.level_up_stat('balanced', one_at_a_time.get_stats())
+        while one_at_a_time.level_up(stat):
+            stat = campaign.level_up_stat('balanced', one_at_a_time.get_stats())
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(players):
+        in_bulk = fresh()
+        levels = character.affordable_levels(in_bulk.get_level(), in_bulk.get_runes())
+        in_bulk.level_up_stats(campaign.level_up_plan('balanced', in_bulk.get_stats(), levels))
+    bulk = time.perf_counter() - start
+
+    same = (one_at_a_time.get_stats() == in_bulk.get_stats()
+            and one_at_a_time.get_runes() == in_bulk.get_runes()
+            and one_at_a_time.get_attack() == in_bulk.get_attack())
+    print(f'{players} players with {runes:,} runes each reach level {in_bulk.get_level()}')
+    print(f'one level at a time {single * 1000:9.2f}ms')
+    print(f'in one step         {bulk * 1000:9.2f}ms  ({single / bulk:.0f}x faster, '
+          f'{"same" if same else "DIFFERENT"} player)')
+    print('-' * 96)
+
+
+if __name__ == "__main__":
+    main()
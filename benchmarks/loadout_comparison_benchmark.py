@@ -0,0 +1,74 @@
+"""
+loadout_comparison_benchmark.py
+
+Listen up, brother! This script compares two loadouts of the first starting class against the boss where
+its win rate is closest to 50/50, a close call where the difference between loadouts is hardest to see. The
+difference in win rate is estimated from two separate estimates, on common random numbers, and on common
+random numbers with antithetic pairs, and the script prints the width of each confidence interval, how
+many times the fights each would need to match the precision of the common random numbers, and the
+exact difference from exact_solver.py to check them against.
+
+Run it from the repository root:
+
+    python benchmarks/loadout_comparison_benchmark.py [NUMBER_OF_FIGHTS] [ATTACK_DIFFERENCE]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import math
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import character
+import exact_solver
+import fight_engine
+import monte_carlo
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    attack = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    first = monte_carlo.class_fighters()[0]
+    second = first._replace(attack=first.attack + attack)
+    bosses = [fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor)
+              for _, _, entry in monte_carlo.boss_rows()]
+    boss_fighter = min(bosses, key=lambda fighter: abs(
+        exact_solver.solve_fight([first], fighter).win_probability - 0.5))
+    exact = (exact_solver.solve_fight([second], boss_fighter).win_probability
+             - exact_solver.solve_fight([first], boss_fighter).win_probability)
+
+    print('-' * 96)
+    print(f'{character.CLASSES[0]} attack {first.attack} VS {first.attack + attack} against '
+          f'{boss_fighter.name}, exact difference {exact:+.2%}')
+
+    start = time.perf_counter()
+    rates = monte_carlo.win_rates([(first, boss_fighter), (second, boss_fighter)], fights, seed=42)
+    seconds = time.perf_counter() - start
+    z = statistics.NormalDist().inv_cdf(0.975)
+    separate = z * math.sqrt(sum(rate * (1 - rate) for rate in rates) / fights)
+    results = [('separate estimates', rates[1] - rates[0], separate, seconds)]
+
+    for label, antithetic in (('common random numbers', False), ('with antithetic pairs', True)):
+        start = time.perf_counter()
+        comparison = monte_carlo.compare_fighters(first, second, boss_fighter, fights, antithetic,
+                                                  seed=42)
+        seconds = time.perf_counter() - start
+        results.append((label, comparison.difference, (comparison.high - comparison.low) / 2,
+                        seconds))
+
+    for label, difference, spread, seconds in results:
+        print(f'{label.ljust(24)} {difference:+7.2%} +-{spread:.2%}  {seconds:7.3f}s  '
+              f'{(spread / results[1][2]) ** 2:5.1f}x the fights of common random numbers')
+    print('-' * 96)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+mmap_catalog_benchmark.py
+
+Listen up, brother! This script builds a synthetic community data pack with hundreds of thousands of
+weapons and bosses, then compares the time and resident memory of loading it into memory against opening
+it as memory-mapped catalog files with mmap_catalog.py. Each approach runs in its own process so their
+memory use does not mix.
+
+Run it from the repository root:
+
+    python benchmarks/mmap_catalog_benchmark.py [NUMBER_OF_WEAPONS]
+
+Functions:
+    build_synthetic_pack(source_path, pack_path, weapons) -> None:
+        Writes synthetic weapon and boss files and builds their catalog files, brother!
+
+    resident_memory() -> float:
+        Returns the resident memory of this process in MB.
+
+    measure(mode, source_path, pack_path) -> None:
+        Loads the data pack with the given approach and prints the time and memory used.
+
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import game_data
+import mmap_catalog
+
+
+LOOKUPS = 100000
+
+
+def build_synthetic_pack(source_path, pack_path, weapons):
+    """build_synthetic_pack Write synthetic weapon and boss files with the
+    given number of weapons per weapon file and build their catalog files.
+
+    Args:
+        source_path (str): The directory to write the weapon and boss files to.
+        pack_path (str): The directory to write the data pack to.
+        weapons (int): The number of weapons in each weapon file.
+    """
+    os.makedirs(os.path.join(source_path, 'weapons'), exist_ok=True)
+    os.makedirs(os.path.join(source_path, 'bosses'), exist_ok=True)
+
+    # The game's own weapons are kept so the starting weapons of every class
+    # are still in the pack.
+    catalog = game_data.get_weapon_catalog()
+    for prefix, name, own in (('', 'unupgraded-weapons.csv', catalog.unupgraded()),
+                              ('(MAX) ', 'full-upgraded-weapons.csv', catalog.upgraded())):
+        with open(os.path.join(source_path, 'weapons', name), 'w', encoding='UTF-8') as file:
+            file.write('Name;Type;Attack\n')
+            for weapon in own:
+                file.write(f'{weapon.name};{weapon.type};{weapon.attack}\n')
+            for number in range(weapons):
+                file.write(f'{prefix}Modded Weapon {number:07d};Straight Sword;{number % 300}\n')
+
+    for tier in game_data.BOSS_TIERS.values():
+        with open(os.path.join(source_path, 'bosses', tier['file']), 'w', encoding='UTF-8') as file:
+            file.write('Name;Health;Runes\n')
+            for number in range(weapons // 5):
+                file.write(f'Modded Boss {number:07d};{1000 + number % 9000};{number % 50000}\n')
+
+    mmap_catalog.build_data_pack(source_path, pack_path)
+
+
+def resident_memory():
+    """resident_memory Return the resident memory of this process.
+
+    Returns:
+        float: The resident memory in MB.
+    """
+    with open('/proc/self/statm', 'r', encoding='UTF-8') as file:
+        return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def measure(mode, source_path, pack_path):
+    """measure Load the weapons and bosses with the given approach, perform
+    random lookups and draws, and print the time and memory used.
+
+    Args:
+        mode (str): 'memory' to read the files into lists and dictionaries, or
+        'mmap' to open the catalog files.
+        source_path (str): The directory holding the weapon and boss files.
+        pack_path (str): The directory holding the data pack.
+    """
+    before = resident_memory()
+    start = time.perf_counter()
+    if mode == 'mmap':
+        weapons = mmap_catalog.MmapWeaponCatalog(pack_path)
+        bosses = mmap_catalog.MmapBossRoster(pack_path)
+    else:
+        data = game_data.data_bundle.build_bundle(source_path, bundle_path=None)
+        weapons = game_data.WeaponCatalog(data['weapons']['unupgraded-weapons.csv'],
+                                          data['weapons']['full-upgraded-weapons.csv'])
+        bosses = game_data.BossRoster(data['bosses'])
+    load_time = time.perf_counter() - start
+
+    unupgraded = weapons.unupgraded()
+    names = [unupgraded[random.randrange(len(unupgraded))].name for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    for name in names:
+        weapons.get(name)
+    lookup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        bosses.random_boss('main')
+    draw_time = time.perf_counter() - start
+
+    print(f'{mode.ljust(7)} load {load_time * 1000:9.2f} ms | '
+          f'lookup {lookup_time / LOOKUPS * 1e6:6.2f} us | '
+          f'draw {draw_time / LOOKUPS * 1e6:6.2f} us | '
+          f'RSS +{resident_memory() - before:8.2f} MB')
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    if len(sys.argv) == 4:
+        # Called by the benchmark itself to measure one approach.
+        measure(*sys.argv[1:])
+        return
+
+    weapons = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, 'source')
+        pack_path = os.path.join(directory, 'pack')
+        print(f'Building a data pack with {weapons} weapons per weapon file '
+              f'and {weapons // 5} bosses per tier...')
+        build_synthetic_pack(source_path, pack_path, weapons)
+
+        print('-' * 80)
+        for mode in ('memory', 'mmap'):
+            subprocess.run([sys.executable, __file__, mode, source_path, pack_path], check=True)
+        print('-' * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+monte_carlo_benchmark.py
+
+Listen up, brother! This script compares how many solo fights per second the NumPy simulator in
+monte_carlo.py can run against resolving them one at a time with fight_engine.py, then times a full
+class x boss win rate matrix.
+
+Run it from the repository root:
+
+    python benchmarks/monte_carlo_benchmark.py [NUMBER_OF_FIGHTS]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import fight_engine
+import monte_carlo
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    player = monte_carlo.class_fighters()[0]
+    _, _, entry = monte_carlo.boss_rows()[0]
+    boss_fighter = fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor)
+
+    print('-' * 60)
+    rng = random.Random(42)
+    start = time.perf_counter()
+    engine_wins = sum(fight_engine.resolve_fight([player], boss_fighter, rng).won
+                      for _ in range(fights // 10))
+    engine_rate = fights // 10 / (time.perf_counter() - start)
+    print(f'{"fight_engine.resolve_fight()".ljust(32)} {engine_rate:12,.0f} fights/s '
+          f'win {engine_wins / (fights // 10):6.2%}')
+
+    start = time.perf_counter()
+    won = monte_carlo.simulate_fights(player.health, player.attack, player.armor,
+                                      [boss_fighter.health] * fights, boss_fighter.attack,
+                                      boss_fighter.armor, seed=42).won
+    simulator_rate = fights / (time.perf_counter() - start)
+    print(f'{"monte_carlo.simulate_fights()".ljust(32)} {simulator_rate:12,.0f} fights/s '
+          f'win {won.mean():6.2%} ({simulator_rate / engine_rate:.1f}x)')
+
+    start = time.perf_counter()
+    matrix = monte_carlo.win_matrix(samples=1000, seed=42)
+    print(f'{"win_matrix(samples=1000)".ljust(32)} {time.perf_counter() - start:12.2f} s '
+          f'for {len(matrix)} bosses')
+    print('-' * 60)
+
+
+if __name__ == "__main__":
+    main()
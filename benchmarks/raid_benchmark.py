@@ -0,0 +1,57 @@
+"""
+raid_benchmark.py
+
+Listen up, brother! This script times world boss raids of growing size with the vectorized rounds in
+raid.py against resolving the same party one attack at a time with fight_engine.py.
+
+Run it from the repository root:
+
+    python benchmarks/raid_benchmark.py [LARGEST_RAID]
+
+Functions:
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import fight_engine
+import raid
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(42)
+
+    print('-' * 72)
+    count = 100
+    while count <= largest:
+        health, attack, armor = raid.raiders(count, seed=42)
+        # The first main boss, scaled for the raid so runs can be compared.
+        boss_fighter = raid.world_boss('Astel, Naturalborn of the Void', count)
+
+        start = time.perf_counter()
+        result = raid.simulate_raid(health, attack, armor, boss_fighter, seed=42, leader=True)
+        vectorized = time.perf_counter() - start
+
+        players = [fight_engine.Fighter('Raider', *stats)
+                   for stats in zip(health.tolist(), attack.tolist(), armor.tolist())]
+        start = time.perf_counter()
+        fight_engine.resolve_fight(players, boss_fighter, rng)
+        engine = time.perf_counter() - start
+
+        print(f'{count:7} raiders {result.rounds:4} rounds  raid.py {vectorized * 1000:8.1f}ms  '
+              f'fight_engine.py {engine * 1000:8.1f}ms')
+        count *= 10
+    print('-' * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+startup_benchmark.py
+
+Listen up, brother! This script measures how long elden_ring.py takes before the first prompt shows up
+in the terminal, and how much of that time each imported module costs. The target is to reach the first
+prompt in under 100 ms.
+
+Run it from the repository root:
+
+    python benchmarks/startup_benchmark.py
+
+Functions:
+    time_to_first_prompt(runs) -> float:
+        Returns the median time in milliseconds until elden_ring.py shows its first prompt, brother!
+
+    import_times() -> list:
+        Returns the cumulative import time of each top-level module imported by the game.
+
+    loaded_modules() -> set:
+        Returns the names of every module loaded by importing the game modules.
+
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+GAME_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring'))
+FIRST_PROMPT = b'Enter the number of players'
+TARGET_MS = 100
+
+
+def time_to_first_prompt(runs=5):
+    """time_to_first_prompt Start elden_ring.py and time how long it takes for
+    the number of players prompt to be printed.
+
+    Args:
+        runs (int, optional): The number of times to start the game.
+        Defaults to 5.
+
+    Returns:
+        float: The median time to the first prompt in milliseconds.
+    """
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        with subprocess.Popen([sys.executable, '-u', 'elden_ring.py'], cwd=GAME_PATH,
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as process:
+            output = b''
+            while FIRST_PROMPT not in output:
+                chunk = os.read(process.stdout.fileno(), 1024)
+                if not chunk:
+                    raise RuntimeError('elden_ring.py exited before the first prompt.')
+                output += chunk
+            results.append((time.perf_counter() - start) * 1000)
+            process.kill()
+    return statistics.median(results)
+
+
+def interpreter_startup(runs=5):
+    """interpreter_startup Time how long it takes to start the Python
+    interpreter without importing anything from the game.
+
+    Args:
+        runs (int, optional): The number of times to start the interpreter.
+        Defaults to 5.
+
+    Returns:
+        float: The median startup time in milliseconds.
+    """
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        results.append((time.perf_counter() - start) * 1000)
+    return statistics.median(results)
+
+
+def import_times():
+    """import_times Import the game modules with -X importtime and collect the
+    cumulative import time of each top-level module.
+
+    Returns:
+        list: List of (module name, cumulative time in ms) tuples, slowest first.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             'import pyinputplus, character, boss, battles'],
+                            cwd=GAME_PATH, capture_output=True, text=True, check=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Only keep the modules imported directly by the game or by Python's
+        # startup, not the modules they import themselves.
+        if not name.startswith('  '):
+            times.append((name.strip(), int(cumulative) / 1000))
+    return sorted(times, key=lambda item: item[1], reverse=True)
+
+
+def loaded_modules():
+    """loaded_modules Import the game modules and collect the names of every
+    module that ends up loaded.
+
+    Returns:
+        set: The names of the loaded modules.
+    """
+    result = subprocess.run([sys.executable, '-c',
+                             'import sys, pyinputplus, character, boss, battles\n'
+                             'print("\\n".join(sys.modules))'],
+                            cwd=GAME_PATH, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    print('-' * 50)
+    print('Import time per top-level module (cumulative):')
+    for name, cumulative in import_times():
+        if cumulative >= 0.5:
+            print(f'    {name.ljust(30)} {cumulative:8.2f} ms')
+
+    print('-' * 50)
+    startup = interpreter_startup()
+    first_prompt = time_to_first_prompt()
+    print(f'Python interpreter startup:  {startup:8.2f} ms')
+    print(f'Time to first prompt:        {first_prompt:8.2f} ms')
+    print(f'Target:                      {TARGET_MS:8.2f} ms '
+          f'({"PASS" if first_prompt < TARGET_MS else "FAIL"})')
+    modules = loaded_modules()
+    for module in ('pandas', 'numpy'):
+        if module in modules:
+            print(f'WARNING: {module} is imported on the interactive path.')
+    print('-' * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+weapon_lookup_benchmark.py
+
+Listen up, brother! This script measures how long it takes to look up the weapons in a player's hands
+and update their stats. It compares the old approach of parsing the weapon CSV with pandas and scanning
+the Name column against the in-memory weapon catalog from game_data.py.
+
+Run it from the repository root:
+
+    python benchmarks/weapon_lookup_benchmark.py
+
+Functions:
+    time_call(func, number) -> float:
+        Returns the average time per call of func in microseconds, brother!
+
+    main():
+        Runs the benchmark and prints the results.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import game_data
+import character
+
+
+def time_call(func, number):
+    """time_call Return the average time per call of func in microseconds.
+
+    Args:
+        func (callable): The function to time.
+        number (int): The number of times to call func per measurement.
+
+    Returns:
+        float: The best average time per call in microseconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    """main Run the benchmark and print the results.
+    """
+    right_hand = 'Uchigatana'
+    left_hand = 'Red Thorn Roundshield'
+
+    # Build a player without the interactive prompts so update_stats can be
+    # called directly.
+    player = character.Character.__new__(character.Character)
+    player._stats = {'Vig': 12, 'Mnd': 11, 'End': 13, 'Str': 12, 'Dex': 15,
+                     'Int': 9, 'Fth': 8, 'Arc': 8}
+    player._equipment = {'Right Hand': right_hand, 'Left Hand': left_hand}
+    player._player_armor = 11
+
+    catalog = game_data.get_weapon_catalog()   # Load the catalog before timing.
+
+    print('-' * 50)
+    try:
+        import pandas as pd
+
+        def pandas_lookup():
+            weapons_df = pd.read_csv(game_data.UNUPGRADED_WEAPONS_FILE, sep=';')
+            weapons_df[weapons_df["Name"] == right_hand].iloc[0, 2]
+            weapons_df = pd.read_csv(game_data.UNUPGRADED_WEAPONS_FILE, sep=';')
+            weapons_df[weapons_df["Name"] == left_hand].iloc[0, 1]
+
+        print(f'pd.read_csv + Name scan (2 hands): {time_call(pandas_lookup, 20):10.2f} us')
+    except ImportError:
+        print('pandas is not installed, skipping the pd.read_csv baseline.')
+
+    def catalog_lookup():
+        catalog.get(right_hand)
+        catalog.get(left_hand)
+
+    print(f'Weapon catalog lookup (2 hands):   {time_call(catalog_lookup, 100000):10.2f} us')
+    print(f'Character.update_stats():          {time_call(player.update_stats, 100000):10.2f} us')
+    print('-' * 50)
+
+
+if __name__ == "__main__":
+    main()
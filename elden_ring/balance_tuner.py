@@ -0,0 +1,365 @@
+"""
+balance_tuner.py
+
+Listen up, brother! This module tunes the difficulty knobs of the bosses so every tier lands in a target
+win rate band, instead of hand-tuning them by playing for days. The knobs are the health divisor, attack
+and armor of the tutorial boss and of the field, mini and main boss tiers, kept in the boss parameter
+file that game_data.py and the Boss class load.
+
+A tier's win rate is the average chance of a fresh character of every starting class felling every boss
+in the tier, simulated with monte_carlo.py. The search starts from the current parameters and takes one
+step at a time on the knob that brings the win rate closest to the target band, making the bosses harder
+while the tier is too easy and easier while it is too hard, until the win rate is in the band or no step
+gets it any closer. Every point is simulated with the same seed, so neighbouring points fight on the same
+dice and their difference is not lost in the noise.
+
+Every parameter point worked out is kept in a cache file on disk with the hash of the game data files,
+so running the tuner again, e.g. with a different band, only simulates the points it has not seen.
+
+Run it from the elden_ring directory to tune every tier and write the parameter file:
+
+    python balance_tuner.py [--tiers TIER ...] [--band TIER=LOW:HIGH ...] [--samples SAMPLES]
+                            [--seed SEED] [--output FILE] [--dry-run]
+
+NumPy is only needed for this module, it is never imported by the game itself.
+
+Classes:
+    TuneResult:
+        A named tuple holding the outcome of tuning a single tier.
+
+Functions:
+    tier_win_rate(tier, params, samples=SAMPLES, seed=SEED) -> float:
+        Returns the average win rate of every starting class against a tier, brother!
+
+    tune_tier(tier, band, params, evaluate, max_steps=MAX_STEPS) -> TuneResult:
+        Searches the difficulty knobs of a tier for a win rate in the target band, brother!
+
+    tune(bands=None, tiers=None, samples=SAMPLES, seed=SEED, params_path=BOSS_PARAMS_FILE,
+         cache_path=CACHE_PATH) -> tuple:
+        Tunes every tier against its target band, reusing the cached points, brother!
+
+    save_boss_params(params, params_path=BOSS_PARAMS_FILE):
+        Writes the difficulty parameters to the parameter file.
+
+    main():
+        Tunes the tiers, prints the results and writes the parameter file.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import namedtuple
+import data_bundle
+import fight_engine
+import game_data
+import monte_carlo
+
+
+CACHE_PATH = os.path.join(data_bundle.DATA_PATH, 'balance-tuner.cache')
+CACHE_VERSION = 1   # Increase when the fight rules change, so every point is worked out again.
+SAMPLES = 500       # Fights simulated for every class and boss at each point.
+SEED = 1            # Seed every point is simulated with.
+MAX_STEPS = 100     # Most steps the search takes for a tier.
+TIERS = ['tutorial'] + list(game_data.BOSS_TIERS)
+
+# The target win rate band of every tier, from the tutorial boss almost every
+# class fells to the main bosses only a few fresh characters can handle.
+TARGET_BANDS = {
+    'tutorial': (0.90, 0.99),
+    'field': (0.70, 0.85),
+    'mini': (0.50, 0.65),
+    'main': (0.25, 0.40)
+}
+
+# The lowest and highest value of every knob. An armor of 21 or more could
+# never be hit by a d20.
+LIMITS = {'health_divisor': (1, 32), 'attack': (1, 100), 'armor': (1, 20)}
+
+# The step of every knob that makes the bosses harder.
+HARDER = {'health_divisor': -1, 'attack': 1, 'armor': 1}
+
+# tier: the tier tuned. before and after: the tier's parameters before and
+# after tuning. before_rate and after_rate: the tier's win rate at each.
+# in_band: True if the win rate is in the target band. evaluated: the number
+# of points simulated, not counting the ones read from the cache.
+TuneResult = namedtuple('TuneResult', ['tier', 'before', 'after', 'before_rate', 'after_rate',
+                                       'in_band', 'evaluated'])
+
+
+def tier_win_rate(tier, params, samples=SAMPLES, seed=SEED):
+    """tier_win_rate Return the average chance of a fresh character of every
+    starting class felling every boss in a tier, with the given parameters.
+
+    Args:
+        tier (str): 'tutorial', 'field', 'mini' or 'main'.
+        params (dict): The parameters of every tier, see
+        game_data.load_boss_params().
+        samples (int, optional): The number of fights simulated for every
+        class and boss. Defaults to SAMPLES.
+        seed (int, optional): The seed to roll with. Defaults to SEED.
+
+    Returns:
+        float: The tier's win rate.
+    """
+    if tier == 'tutorial':
+        bosses = [game_data.tutorial_boss(params)]
+    else:
+        roster = game_data.BossRoster(game_data.load_game_data()['bosses'],
+                                      game_data.boss_tiers(params))
+        bosses = roster.bosses(tier)
+    matchups = [(player, fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor))
+                for entry in bosses for player in monte_carlo.class_fighters()]
+    rates = monte_carlo.win_rates(matchups, samples, seed)
+    return sum(rates) / len(rates)
+
+
+def _miss(rate, band):
+    """_miss Return how far a win rate is outside a band, 0 if it is inside.
+    """
+    low, high = band
+    return max(low - rate, rate - high, 0.0)
+
+
+def tune_tier(tier, band, params, evaluate, max_steps=MAX_STEPS):
+    """tune_tier Search the health divisor, attack and armor of a tier for a
+    win rate in the target band. Each step tries moving every knob by one in
+    the direction the win rate has to go and takes the move that brings the
+    win rate closest to the band, doubling the moves while none of them gets
+    any closer. The search stops when the win rate is in the band, or when the
+    knobs are at their limits.
+
+    Args:
+        tier (str): 'tutorial', 'field', 'mini' or 'main'.
+        band (tuple): The lowest and highest target win rate.
+        params (dict): The parameters of every tier to start from, see
+        game_data.load_boss_params(). They are not changed.
+        evaluate (function): Called with the tier and the parameters of every
+        tier, returns the tier's win rate.
+        max_steps (int, optional): The most steps to take. Defaults to
+        MAX_STEPS.
+
+    Returns:
+        TuneResult: The parameters and win rate of the tier before and after.
+    """
+    current = dict(params[tier])
+    rate = before_rate = evaluate(tier, dict(params, **{tier: current}))
+
+    for _ in range(max_steps):
+        if _miss(rate, band) == 0.0:
+            break
+
+        # Make the bosses harder if the tier is too easy, easier if too hard.
+        # If no move of one gets any closer, e.g. when every class wins every
+        # fight either way, the moves are doubled until one does.
+        direction = 1 if rate > band[1] else -1
+        best = None
+        stride = 1
+        while best is None and stride <= max(high - low for low, high in LIMITS.values()):
+            moves = []
+            for key, step in HARDER.items():
+                low, high = LIMITS[key]
+                value = min(max(current[key] + direction * step * stride, low), high)
+                if value != current[key]:
+                    point = dict(current, **{key: value})
+                    moves.append((evaluate(tier, dict(params, **{tier: point})), point))
+            if moves:
+                move = min(moves, key=lambda move: (_miss(move[0], band),
+                                                    abs(move[0] - sum(band) / 2)))
+                if _miss(move[0], band) < _miss(rate, band):
+                    best = move
+            stride *= 2
+        if best is None:
+            break
+        rate, current = best
+
+    return TuneResult(tier, dict(params[tier]), current, before_rate, rate,
+                      _miss(rate, band) == 0.0, 0)
+
+
+def _data_hash():
+    """_data_hash Return the hash of every game data file, so the cache is
+    dropped when any of them changes.
+    """
+    sources = game_data.load_game_data()['sources']
+    return hashlib.sha256(json.dumps(sources, sort_keys=True).encode('UTF-8')).hexdigest()
+
+
+def _load_cache(cache_path, data_hash):
+    """_load_cache Return the cached win rates of every point, or an empty
+    cache if the file is missing, damaged, from an older version or from
+    other game data files.
+    """
+    try:
+        with open(cache_path, 'r', encoding='UTF-8') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION
+            or cache.get('data') != data_hash):
+        return {}
+    return cache.get('points', {})
+
+
+def _save_json(path, content):
+    """_save_json Write JSON to a file through a temporary file, so a half
+    written file is never read.
+    """
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'w', encoding='UTF-8') as file:
+            json.dump(content, file, indent=4)
+            file.write('\n')
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def tune(bands=None, tiers=None, samples=SAMPLES, seed=SEED,
+         params_path=game_data.BOSS_PARAMS_FILE, cache_path=CACHE_PATH):
+    """tune Tune the difficulty parameters of every tier against its target
+    band, starting from the parameter file. Only the points that are not in
+    the cache are simulated, then the cache is updated.
+
+    Args:
+        bands (dict, optional): A dictionary of tiers to their lowest and
+        highest target win rate, in place of the ones in TARGET_BANDS.
+        Defaults to None.
+        tiers (list, optional): The tiers to tune. Tunes every tier if None.
+        Defaults to None.
+        samples (int, optional): The number of fights simulated for every
+        class and boss at each point. Defaults to SAMPLES.
+        seed (int, optional): The seed every point is simulated with.
+        Defaults to SEED.
+        params_path (str, optional): Path of the parameter file to start
+        from. Defaults to game_data.BOSS_PARAMS_FILE.
+        cache_path (str, optional): Path of the cache file, or None to
+        simulate every point without a cache. Defaults to CACHE_PATH.
+
+    Raises:
+        FileNotFoundError: If one of the game data files does not exist.
+        data_bundle.DataValidationError: If any of the game data files or the
+        parameter file are invalid.
+
+    Returns:
+        tuple: The tuned parameters of every tier, and a TuneResult for every
+        tier tuned.
+    """
+    bands = dict(TARGET_BANDS, **(bands or {}))
+    params = game_data.load_boss_params(params_path)
+    data_hash = _data_hash()
+    points = _load_cache(cache_path, data_hash) if cache_path is not None else {}
+    evaluated = 0
+
+    def evaluate(tier, point_params):
+        nonlocal evaluated
+        settings = point_params[tier]
+        key = ':'.join(str(value) for value in [tier, samples, seed] +
+                       [settings[knob] for knob in game_data.BOSS_PARAMS])
+        if key not in points:
+            points[key] = tier_win_rate(tier, point_params, samples, seed)
+            evaluated += 1
+        return points[key]
+
+    results = []
+    for tier in tiers or TIERS:
+        evaluated = 0
+        result = tune_tier(tier, bands[tier], params, evaluate)
+        results.append(result._replace(evaluated=evaluated))
+        params[tier] = result.after
+
+    if cache_path is not None and any(result.evaluated for result in results):
+        try:
+            _save_json(cache_path, {'version': CACHE_VERSION, 'data': data_hash,
+                                    'points': points})
+        except OSError:
+            # The parameters are still returned if the cache cannot be
+            # written, e.g. from a read-only install.
+            pass
+    return params, results
+
+
+def save_boss_params(params, params_path=game_data.BOSS_PARAMS_FILE):
+    """save_boss_params Write the difficulty parameters of every tier to the
+    parameter file the Boss class loads.
+
+    Args:
+        params (dict): The parameters of every tier, see
+        game_data.load_boss_params().
+        params_path (str, optional): Path of the parameter file. Defaults to
+        game_data.BOSS_PARAMS_FILE.
+    """
+    _save_json(params_path, {tier: {knob: params[tier][knob] for knob in game_data.BOSS_PARAMS}
+                             for tier in TIERS})
+
+
+def _band(text):
+    """_band Parse a TIER=LOW:HIGH target band from the command line.
+    """
+    try:
+        tier, limits = text.split('=')
+        low, high = (float(limit) for limit in limits.split(':'))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f'{text} is not TIER=LOW:HIGH') from error
+    if tier not in TIERS or not 0.0 <= low <= high <= 1.0:
+        raise argparse.ArgumentTypeError(f'{text} is not a tier with 0 <= LOW <= HIGH <= 1')
+    return tier, (low, high)
+
+
+def main():
+    """main Tune the difficulty parameters of the tiers, print the results and
+    write the parameter file.
+    """
+    parser = argparse.ArgumentParser(
+        description='Tune the boss tiers to target win rate bands, brother!')
+    parser.add_argument('--tiers', nargs='+', choices=TIERS, help='tiers to tune, all by default')
+    parser.add_argument('--band', type=_band, action='append', default=[],
+                        help='target win rate band of a tier, e.g. field=0.7:0.85')
+    parser.add_argument('--samples', type=int, default=SAMPLES,
+                        help=f'fights simulated per class and boss at each point '
+                             f'(default {SAMPLES})')
+    parser.add_argument('--seed', type=int, default=SEED,
+                        help=f'seed every point is simulated with (default {SEED})')
+    parser.add_argument('--output', default=game_data.BOSS_PARAMS_FILE,
+                        help='parameter file to write, the one the game loads by default')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print the tuned parameters without writing them')
+    arguments = parser.parse_args()
+
+    try:
+        params, results = tune(dict(arguments.band), arguments.tiers, arguments.samples,
+                               arguments.seed)
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        sys.exit(1)
+    except data_bundle.DataValidationError as error:
+        print(f'\n{error}\nExiting...')
+        sys.exit(1)
+
+    bands = dict(TARGET_BANDS, **dict(arguments.band))
+    print(f'{"Tier".ljust(9)} {"Divisor".ljust(9)} {"Attack".ljust(9)} {"Armor".ljust(9)} '
+          f'{"Win rate".ljust(17)} Target')
+    for result in results:
+        knobs = [f'{result.before[knob]} -> {result.after[knob]}'.ljust(9)
+                 for knob in game_data.BOSS_PARAMS]
+        low, high = bands[result.tier]
+        print(f'{result.tier.ljust(9)} {" ".join(knobs)} '
+              f'{result.before_rate:6.1%} -> {result.after_rate:6.1%} {low:.0%}-{high:.0%}'
+              f'{"" if result.in_band else " (missed)"}')
+    print(f'{sum(result.evaluated for result in results)} points simulated, the rest read from '
+          f'the cache.')
+
+    if arguments.dry_run:
+        return
+    try:
+        save_boss_params(params, arguments.output)
+    except OSError as error:
+        print(f'\nCould not write {arguments.output}: {error.strerror}')
+        sys.exit(1)
+    print(f'Parameters written to {arguments.output}')
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,28 @@ battles.py
 Listen up, brother! This module contains the functions to handle all the epic battles in the Elden Ring CLI game.
 We're talking player and boss attack phases, and different types of boss fights like tutorial, field, mini,
 and main boss fights.
-Whether you're going solo or teaming up with your buddies (up to three players), this module has got you covered!
+Whether you're going solo or teaming up with your buddies, this module has got you covered! Every fight, for a
+party of any size, goes through the single boss_fight() loop, and the solo, two and three player functions are
+kept as shortcuts to it.
+The rolls and the turn order of every fight are resolved by fight_engine.py, this module shows them to the players.
+Type 'auto' at any prompt of a fight to skip ahead: the rest of the fight is resolved at once by the fight engine
+from everyone's current health, and a summary is shown before the loot and runes.
 
 Functions:
     roll_d20(advantage=False, disadvantage=False) -> int:
         Generates a random number between 1 and 20, with optional advantage or disadvantage, brother!
 
-    player_attack_phase(player_obj, boss_obj):
-        Handles the player's attack phase against the boss, brother!
+    player_attack_phase(player_obj, boss_obj, attack=None) -> bool:
+        Shows the player's attack phase against the boss, brother!
 
-    boss_attack_phase(player_obj, boss_obj):
-        Handles the boss's attack phase against the player, brother!
+    boss_attack_phase(player_obj, boss_obj, attack=None) -> bool:
+        Shows the boss's attack phase against the player, brother!
+
+    auto_resolve(player_list, boss_obj, turn=0):
+        Finishes the rest of a fight at once with the fight engine and shows a summary, brother!
+
+    boss_fight(player_list, boss_obj, tier):
+        Manages a boss fight of the given tier for a party of any size, brother!
 
     tutorial_boss_fight(player_obj, boss_obj):
         Manages the tutorial boss fight for a single player, brother!
@@ -53,9 +64,19 @@ Functions:
         Manages a main boss fight for three players, brother!
 """
 
-import time
-import secrets
 import sys
+import dice
+import fight_engine
+import pacing
+
+
+# The boss fight tiers in the order they are fought, with the chance of the
+# boss dropping a fully upgraded weapon ("1 in chance"). The main boss drops
+# no weapon.
+BOSS_TIERS = ['tutorial', 'field', 'mini', 'main']
+DROP_CHANCES = {'tutorial': 10, 'field': 5, 'mini': 1, 'main': None}
+
+AUTO_RESOLVE = 'auto'   # Typed at a fight prompt to resolve the rest of the fight at once.
 
 
 def roll_d20(advantage=False, disadvantage=False):
@@ -74,16 +95,11 @@ def roll_d20(advantage=False, disadvantage=False):
         int: The number to determine if the player/boss successfully land an
         attack.
     """
-    if advantage:
-        return max(secrets.SystemRandom().randrange(1,21), secrets.SystemRandom().randrange(1,21))
-
-    if disadvantage:
-        return min(secrets.SystemRandom().randrange(1,21), secrets.SystemRandom().randrange(1,21))
+    # Roll through the shared dice backend, see dice.py.
+    return dice.roll_d20(advantage, disadvantage)
 
-    return secrets.SystemRandom().randrange(1,21)
 
-
-def player_attack_phase(player_obj, boss_obj):
+def player_attack_phase(player_obj, boss_obj, attack=None):
     """player_attack_phase Allows the player to perform an attack on the boss.
     Uses input() so the fight is more interactive for the user.
 
@@ -91,929 +107,346 @@ def player_attack_phase(player_obj, boss_obj):
         player_obj (character.Character): Object of the player performing
         the attack.
         boss_obj (boss.Boss): Object of the boss being targeted by the attack.
+        attack (fight_engine.Attack, optional): The attack as resolved by the
+        fight engine. The attack is rolled now if None. Defaults to None.
+
+    Returns:
+        bool: True if the player typed 'auto' to resolve the rest of the
+        fight at once, in which case the attack is not made.
     """
+    if attack is None:
+        attack = fight_engine.roll_attack(player_obj.get_attack(), boss_obj.get_armor())
+
     print(f'\n{player_obj.get_name()} attack phase.')
-    input("Press 'ENTER' to roll for attack...")
-    if roll_d20() < boss_obj.get_armor():    # Attack roll fails if the boss'
+    if input(f"Press 'ENTER' to roll for attack ('{AUTO_RESOLVE}' to skip ahead)..."
+             ).strip().lower() == AUTO_RESOLVE:
+        return True
+    if not attack.hit:                      # Attack roll fails if the boss'
         print('Attack roll failed!')        # armor is higher than the roll.
-        time.sleep(1.5)   # Pause for the player to read the roll result.
+        pacing.sleep(1.5)   # Pause for the player to read the roll result.
     else:
         print('Attack roll success!')
-        time.sleep(0.5)
+        pacing.sleep(0.5)
         input("\nPress 'ENTER' to roll for damage...")
-        time.sleep(0.5)
-        # Get the damage done to the boss, reduce the boss' health, and let
-        # the player know how much damage was done to the boss.
-        dmg = player_obj.attack()
-        boss_obj.reduce_health(dmg)
-        print(f'Hit {boss_obj.get_name()} for {dmg} damage!')
-        time.sleep(1.5)
+        pacing.sleep(0.5)
+        # Reduce the boss' health by the damage done, and let the player know
+        # how much damage was done to the boss.
+        boss_obj.reduce_health(attack.damage)
+        print(f'Hit {boss_obj.get_name()} for {attack.damage} damage!')
+        pacing.sleep(1.5)
+    return False
 
 
-def boss_attack_phase(player_obj, boss_obj):
+def boss_attack_phase(player_obj, boss_obj, attack=None):
     """boss_attack_phase Allows the boss to perform an attack on the player.
 
     Args:
         player_obj (character.Character): Object of the player being targeted by
         the attack.
         boss_obj (boss.Boss): Object of the boss performing the attack.
+        attack (fight_engine.Attack, optional): The attack as resolved by the
+        fight engine. The attack is rolled now if None. Defaults to None.
+
+    Returns:
+        bool: True if the player typed 'auto' to resolve the rest of the
+        fight at once.
     """
+    if attack is None:
+        attack = fight_engine.roll_attack(boss_obj.get_attack(), player_obj.get_armor())
+
     print('\nBoss attack phase.')
-    if roll_d20() < player_obj.get_armor():  # Attack roll fails if the
+    if not attack.hit:                      # Attack roll fails if the
         print('Attack roll failed!')        # player's armor is higher than
-        time.sleep(1.5)                       # the roll result.
+        pacing.sleep(1.5)                       # the roll result.
     else:
         # Let the player know what steps are happening.
         print('Attack roll success!')
-        time.sleep(0.5)
+        pacing.sleep(0.5)
         print('\nRolling for damage...')
-        time.sleep(0.5)
-        # Get the damage done to the player, reduce the player's health, and
-        # let the player know how much damage was done to the player.
-        dmg = boss_obj.attack()
-        player_obj.reduce_health(dmg)
-        print(f'Hit {player_obj.get_name()} for {dmg} damage!')
+        pacing.sleep(0.5)
+        # Reduce the player's health by the damage done, and let the player
+        # know how much damage was done to the player.
+        player_obj.reduce_health(attack.damage)
+        print(f'Hit {player_obj.get_name()} for {attack.damage} damage!')
         # Allow the player to interactively proceed to the next phase.
-        input("\nPress 'ENTER' to continue...")
+        return input(f"\nPress 'ENTER' to continue ('{AUTO_RESOLVE}' to skip ahead)..."
+                     ).strip().lower() == AUTO_RESOLVE
+    return False
 
 
-def tutorial_boss_fight(player_obj, boss_obj):
-    """tutorial_boss_fight Function to fight the tutorial boss
-    "Soldier of Godrick". This should be the first fight performed by the player
-    and should only occur once in the program. This version is to be used for
-    one player.
+def auto_resolve(player_list, boss_obj, turn=0):
+    """auto_resolve Finish the rest of a fight at once with the fight engine,
+    from the players' and boss' current health, and show a summary. The
+    players' and boss' health is updated to the end of the fight.
 
     Args:
-        player_obj (character.Character): Object of the player in the fight.
+        player_list (list): List of player objects in the fight, with the host
+        first.
+        boss_obj (boss.Boss): Object of the boss in the fight.
+        turn (int, optional): The index of the player whose turn is next in
+        the current round. Defaults to 0.
+    """
+    players = [fight_engine.from_character(player_obj) for player_obj in player_list]
+    if players[0].health <= 0 or boss_obj.get_health() <= 0:
+        return      # The fight is already over.
+
+    # Skip the summons with no health left, starting the next round at the
+    # host if nobody is left in the current round.
+    while turn < len(players) and players[turn].health <= 0:
+        turn += 1
+    result = fight_engine.resolve_fight(players, fight_engine.from_boss(boss_obj),
+                                        turn=turn % len(players))
+
+    for player_obj, health in zip(player_list, result.player_health):
+        player_obj.reduce_health(player_obj.get_health() - health)
+    boss_obj.reduce_health(boss_obj.get_health() - result.boss_health)
+
+    # Show what happened in the rounds that were skipped.
+    print('\n' + ('-' * 30))
+    print(f'Skipped ahead {result.rounds} round(s)...')
+    for player_obj, dealt, taken in zip(player_list, result.damage_dealt, result.damage_taken):
+        print(f'{player_obj.get_name()} dealt {dealt} damage and took {taken} damage.')
+    for player_obj in player_list:
+        player_obj.print_health()   # Display each player's final hp.
+    boss_obj.print_stats()          # Display the boss' final hp.
+    pacing.sleep(1.5)
+
+
+def _fight(player_list, boss_obj):
+    """_fight Play out a fight with the fight engine, showing every round and
+    attack to the players. The engine decides the turn order and the rolls,
+    and the players' and boss' health is updated as each attack is shown. If
+    a player types 'auto' at a prompt, the rest of the fight is resolved at
+    once with auto_resolve().
+
+    Args:
+        player_list (list): List of player objects in the fight, with the host
+        first.
+        boss_obj (boss.Boss): Object of the boss in the fight.
+    """
+    players = [fight_engine.from_character(player_obj) for player_obj in player_list]
+    current_round = 0
+    for attack in fight_engine.fight_events(players, fight_engine.from_boss(boss_obj)):
+        if attack.round != current_round:
+            current_round = attack.round
+            # Separate the attack phases for easier readability.
+            print('\n' + ('-' * 30))
+            for player_obj in player_list:
+                player_obj.print_health()   # Display each player's current hp.
+            boss_obj.print_stats()          # Display the boss' current hp.
+            pacing.sleep(0.75)
+
+        if attack.target == fight_engine.BOSS:
+            # Skipping ahead at a player's attack starts with that attack.
+            if player_attack_phase(player_list[attack.attacker], boss_obj, attack):
+                auto_resolve(player_list, boss_obj, attack.attacker)
+                return
+        elif boss_attack_phase(player_list[attack.target], boss_obj, attack):
+            # Skipping ahead after the boss' attack starts with the next player.
+            auto_resolve(player_list, boss_obj, attack.target + 1)
+            return
+
+
+def boss_fight(player_list, boss_obj, tier):
+    """boss_fight Function to fight a boss of the given tier with a party of
+    any size. The tutorial boss "Soldier of Godrick" should be the first fight
+    and should only occur once in the program. The field, mini and main bosses
+    are random bosses from their boss list files. Exits the program if the
+    host reaches 0 hp.
+
+    Args:
+        player_list (list): List of player objects in the fight, with the host
+        first.
         boss_obj (boss.Boss): Object of the boss in the fight.
+        tier (str): One of BOSS_TIERS.
+
+    Raises:
+        ValueError: If the tier is not known.
     """
-    # Set the boss' runes and weapon to drop if defeated.
-    runes = boss_obj.get_runes()
-    dropped_weapon = boss_obj.drop_weapon(chance=10)
+    if tier not in DROP_CHANCES:
+        raise ValueError(f'Unknown boss tier: {tier}')
+    host_obj = player_list[0]
+
+    # Set the boss stats to the stats appropriate for the tier.
+    set_tier_boss = {'field': boss_obj.set_field_boss, 'mini': boss_obj.set_mini_boss,
+                     'main': boss_obj.set_main_boss}.get(tier)
+    if set_tier_boss is not None:
+        set_tier_boss()
+    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
+    dropped_weapon = None           # Set the boss' dropped weapon, if any.
+    if DROP_CHANCES[tier] is not None:
+        dropped_weapon = boss_obj.drop_weapon(chance=DROP_CHANCES[tier])
 
     # Introduce the boss to the player and begin the boss fight.
     print('\nA CHALLENGER APPROACHES\n')
     print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while player_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        player_obj.print_health()   # Display the player's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(player_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(player_obj, boss_obj)
-
-    # If the player has no hp, then show a defeat screen and exit the program.
-    if player_obj.get_health() <= 0:
+    pacing.sleep(1)
+
+    # Play out the fight, showing every round and attack to the players.
+    _fight(player_list, boss_obj)
+
+    # If the host has no hp, then show a defeat screen and exit the program.
+    if host_obj.get_health() <= 0:
         print('\nYOU DIED\n')
-        time.sleep(1)
+        pacing.sleep(1)
         sys.exit(0)
 
     # If the boss has no hp, then show a victory screen and proceed.
     print('\nENEMY FELLED\n')
-    time.sleep(1)
+    pacing.sleep(1)
 
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    player_obj.change_weapon(dropped_weapon)
+    # Give the players the chance to equip the dropped weapon.
+    if dropped_weapon is not None:
+        print(f'Boss dropped {dropped_weapon.name}!')
+        pacing.sleep(1.5)
+        for player_obj in player_list:
+            player_obj.change_weapon(dropped_weapon)
 
-    # Update the player's runes value.
+    # Update the players' runes value.
     print(f'You gained {runes} runes.\n')
-    player_obj.add_runes(runes)
-    print(f'You currently have {player_obj.get_runes()} runes.')
-    time.sleep(1)
+    for player_obj in player_list:
+        player_obj.add_runes(runes)
+    if len(player_list) == 1:
+        print(f'You currently have {host_obj.get_runes()} runes.')
+    else:
+        for player_obj in player_list:
+            print(f'{player_obj.get_name()} currently has {player_obj.get_runes()} runes.')
+    pacing.sleep(1)
 
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    # Make the rest or exit action interactive for the player.
+    if tier == 'main':
+        input("\nPress'ENTER' to end journey...")
+    else:
+        input("\nPress'ENTER' to rest...")
 
 
-def two_player_tutorial_boss_fight(player_list, boss_obj):
-    """two_player_tutorial_boss_fight Function fight the tutorial boss
-    "Soldier of Godrick". This should be the first fight performed by the player
-    and should only occur once in the program. This version is to be used for
-    two players.
+def tutorial_boss_fight(player_obj, boss_obj):
+    """tutorial_boss_fight Function to fight the tutorial boss
+    "Soldier of Godrick" with one player. See boss_fight().
 
     Args:
-        player_list (list): List of player objects in the fight.
+        player_obj (character.Character): Object of the player in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-
-    # Set the boss' runes and weapon to drop if defeated.
-    runes = boss_obj.get_runes()
-    dropped_weapon = boss_obj.drop_weapon(chance=10)
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin host attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break from the loop if the boss dies from the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
+    boss_fight([player_obj], boss_obj, 'tutorial')
 
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    host_obj.change_weapon(dropped_weapon)
-    summon_one.change_weapon(dropped_weapon)
 
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    time.sleep(1)
+def two_player_tutorial_boss_fight(player_list, boss_obj):
+    """two_player_tutorial_boss_fight Function to fight the tutorial boss
+    "Soldier of Godrick" with two players. See boss_fight().
 
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    Args:
+        player_list (list): List of player objects in the fight.
+        boss_obj (boss.Boss): Object of the boss in the fight.
+    """
+    boss_fight(player_list, boss_obj, 'tutorial')
 
 
 def three_player_tutorial_boss_fight(player_list, boss_obj):
     """three_player_tutorial_boss_fight Function to fight the tutorial boss
-    "Soldier of Godrick". This should be the first fight performed by the player
-    and should only occur once in the program. This version is to be used for
-    three players.
+    "Soldier of Godrick" with three players. See boss_fight().
 
     Args:
         player_list (list): List of player objects in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-    summon_two = player_list[2]
-
-    # Set the boss' runes and weapon to drop if defeated.
-    runes = boss_obj.get_runes()
-    dropped_weapon = boss_obj.drop_weapon(chance=10)
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's hp.
-        summon_two.print_health()   # Display the second summon's hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin host attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break from the loop if the boss dies from the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-        # Begin second summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_two.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_two, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_two, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    host_obj.change_weapon(dropped_weapon)
-    summon_one.change_weapon(dropped_weapon)
-    summon_two.change_weapon(dropped_weapon)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    summon_two.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    print(f'{summon_two.get_name()} currently has {summon_two.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    boss_fight(player_list, boss_obj, 'tutorial')
 
 
 def field_boss_fight(player_obj, boss_obj):
-    """field_boss_fight Function to fight a random field boss from the field
-    boss list file. This version is to be used for one player.
+    """field_boss_fight Function to fight a random field boss with one
+    player. See boss_fight().
 
     Args:
         player_obj (character.Character): Object of the player in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the boss stats to the stats appropriate for a field boss.
-    boss_obj.set_field_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-    dropped_weapon = boss_obj.drop_weapon(chance=5) # Set the boss' dropped weapon.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while player_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        player_obj.print_health()   # Display the player's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(player_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(player_obj, boss_obj)
-
-    # If the player has no hp, then show a defeat screen and exit the program.
-    if player_obj.get_health() <= 0:
-        print('\nYOU DIED\n')
-        time.sleep(1)
-        sys.exit(0)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    player_obj.change_weapon(dropped_weapon)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    player_obj.add_runes(runes)
-    print(f'You currently have {player_obj.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    boss_fight([player_obj], boss_obj, 'field')
 
 
 def two_player_field_boss_fight(player_list, boss_obj):
-    """two_player_field_boss_fight Function to fight a random field boss from the
-    field boss list file. This version is to be used for two players.
+    """two_player_field_boss_fight Function to fight a random field boss
+    with two players. See boss_fight().
 
     Args:
-        player_list (list): List of the player objects in the fight.
+        player_list (list): List of player objects in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-
-    # Set the boss stats to the stats appropriate for a field boss.
-    boss_obj.set_field_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-    dropped_weapon = boss_obj.drop_weapon(chance=5) # Set the boss' dropped weapon.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break out of the loop if the boss dies to the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    host_obj.change_weapon(dropped_weapon)
-    summon_one.change_weapon(dropped_weapon)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    boss_fight(player_list, boss_obj, 'field')
 
 
 def three_player_field_boss_fight(player_list, boss_obj):
-    """three_player_field_boss_fight Function to fight a random field boss from the
-    field boss list file. This version is to be used for three players.
+    """three_player_field_boss_fight Function to fight a random field boss
+    with three players. See boss_fight().
 
     Args:
-        player_list (list): List of the player objects in the fight.
+        player_list (list): List of player objects in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-    summon_two = player_list[2]
-
-    # Set the boss stats to the stats appropriate for a field boss.
-    boss_obj.set_field_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-    dropped_weapon = boss_obj.drop_weapon(chance=5) # Set the boss' dropped weapon.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's current hp.
-        summon_two.print_health()   # Display the second summon's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break out of the loop if the boss dies to the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-        # Begin the second summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_two.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_two, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_two, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    host_obj.change_weapon(dropped_weapon)
-    summon_one.change_weapon(dropped_weapon)
-    summon_two.change_weapon(dropped_weapon)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    summon_two.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    print(f'{summon_two.get_name()} currently has {summon_two.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    boss_fight(player_list, boss_obj, 'field')
 
 
 def mini_boss_fight(player_obj, boss_obj):
-    """mini_boss_fight Function to fight a random mini boss from the mini boss
-    list file. This version is to be used for one player.
+    """mini_boss_fight Function to fight a random mini boss with one player.
+    See boss_fight().
 
     Args:
         player_obj (character.Character): Object of the player in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the boss stats to the stats appropriate for a mini boss.
-    boss_obj.set_mini_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-    dropped_weapon = boss_obj.drop_weapon(chance=1) # Set the boss' dropped weapon.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while player_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        player_obj.print_health()   # Display the player's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(player_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(player_obj, boss_obj)
-
-    # If the player has no hp, then show a defeat screen and exit the program.
-    if player_obj.get_health() <= 0:
-        print('\nYOU DIED\n')
-        time.sleep(1)
-        sys.exit(0)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    player_obj.change_weapon(dropped_weapon)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    player_obj.add_runes(runes)
-    print(f'You currently have {player_obj.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    boss_fight([player_obj], boss_obj, 'mini')
 
 
 def two_player_mini_boss_fight(player_list, boss_obj):
-    """two_player_mini_boss_fight Function to fight a random mini boss from the
-    mini boss list file. This version is to be used for two players.
+    """two_player_mini_boss_fight Function to fight a random mini boss with
+    two players. See boss_fight().
 
     Args:
         player_list (list): List of player objects in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-
-    # Set the boss stats to the stats appropriate for a mini boss.
-    boss_obj.set_mini_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-    dropped_weapon = boss_obj.drop_weapon(chance=1) # Set the boss' dropped weapon.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break from the loop if the boss dies from the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    host_obj.change_weapon(dropped_weapon)
-    summon_one.change_weapon(dropped_weapon)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    boss_fight(player_list, boss_obj, 'mini')
 
 
 def three_player_mini_boss_fight(player_list, boss_obj):
-    """three_player_mini_boss_fight Function to fight a random mini boss from
-    the mini boss list file. This version is to be used for three players.
+    """three_player_mini_boss_fight Function to fight a random mini boss
+    with three players. See boss_fight().
 
     Args:
         player_list (list): List of player objects in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-    summon_two = player_list[2]
-
-    # Set the boss stats to the stats appropriate for a mini boss.
-    boss_obj.set_mini_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-    dropped_weapon = boss_obj.drop_weapon(chance=1) # Set the boss' dropped weapon.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's current hp.
-        summon_two.print_health()   # Display the second summon's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break from the loop if the boss dies from the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-        # Begin second summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_two.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_two, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_two, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Give the player the chance to equip the dropped weapon.
-    print(f'Boss dropped {dropped_weapon.iloc[0,0]}!')
-    time.sleep(1.5)
-    host_obj.change_weapon(dropped_weapon)
-    summon_one.change_weapon(dropped_weapon)
-    summon_two.change_weapon(dropped_weapon)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    summon_two.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    print(f'{summon_two.get_name()} currently has {summon_two.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to rest...")
+    boss_fight(player_list, boss_obj, 'mini')
 
 
 def main_boss_fight(player_obj, boss_obj):
-    """main_boss_fight Function to fight a random main boss from the main boss
-    list file. This version is to be used for one player.
+    """main_boss_fight Function to fight a random main boss with one player.
+    See boss_fight().
 
     Args:
         player_obj (character.Character): Object of the player in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the boss stats to the stats appropriate for a main boss.
-    boss_obj.set_main_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while player_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        player_obj.print_health()   # Display the player's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(player_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(player_obj, boss_obj)
-
-    # If the player has no hp, then show a defeat screen and exit the program.
-    if player_obj.get_health() <= 0:
-        print('\nYOU DIED\n')
-        time.sleep(1)
-        sys.exit(0)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    player_obj.add_runes(runes)
-    print(f'You currently have {player_obj.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the exit action interactive for the player.
-    input("\nPress'ENTER' to end journey...")
+    boss_fight([player_obj], boss_obj, 'main')
 
 
 def two_player_main_boss_fight(player_list, boss_obj):
-    """two_player_main_boss_fight Function to fight a random main boss from the
-    main boss list file. This version is to be used for two players.
+    """two_player_main_boss_fight Function to fight a random main boss with
+    two players. See boss_fight().
 
     Args:
         player_list (list): List of player objects in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-
-    # Set the boss stats to the stats appropriate for a main boss.
-    boss_obj.set_main_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break from the loop if the boss dies from the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to end journey...")
+    boss_fight(player_list, boss_obj, 'main')
 
 
 def three_player_main_boss_fight(player_list, boss_obj):
-    """three_player_main_boss_fight Function to fight a random boss from the
-    main boss list file. This version is to be used for three players.
+    """three_player_main_boss_fight Function to fight a random main boss
+    with three players. See boss_fight().
 
     Args:
-        player_list (list): List of players in the fight.
+        player_list (list): List of player objects in the fight.
         boss_obj (boss.Boss): Object of the boss in the fight.
     """
-    # Set the players from the list to separate variables.
-    host_obj = player_list[0]
-    summon_one = player_list[1]
-    summon_two = player_list[2]
-
-    # Set the boss stats to the stats appropriate for a main boss.
-    boss_obj.set_main_boss()
-    runes = boss_obj.get_runes()    # Set the boss' runes to drop if defeated.
-
-    # Introduce the boss to the player and begin the boss fight.
-    print('\nA CHALLENGER APPROACHES\n')
-    print(f'Begin fight VS {boss_obj.get_name()}')
-    time.sleep(1)
-
-    # Loop until either the player or the boss run out of health.
-    while host_obj.get_health() > 0 and boss_obj.get_health() > 0:
-        # Separate the attack phases for easier readability.
-        print('\n' + ('-' * 30))
-        host_obj.print_health()     # Display the player's current hp.
-        summon_one.print_health()   # Display the first summon's current hp.
-        summon_two.print_health()   # Display the second summon's current hp.
-        boss_obj.print_stats()      # Display the boss' current hp.
-        time.sleep(0.75)
-
-        # Begin player attack phase.
-        player_attack_phase(host_obj, boss_obj)
-        if boss_obj.get_health() > 0:
-            # Begin boss attack phase if the boss is still alive.
-            boss_attack_phase(host_obj, boss_obj)
-        else:
-            # Break from the loop if the boss dies from the host's attack.
-            break
-
-        # If the host has no hp, then show a defeat screen and exit the program.
-        if host_obj.get_health() == 0:
-            print('\nYOU DIED\n')
-            time.sleep(1)
-            sys.exit(0)
-
-        # Begin first summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_one.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_one, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_one, boss_obj)
-
-        # Begin second summon attack phase.
-        # If the summon's hp reaches 0 or the boss' hp reaches 0,
-        # then skip this phase.
-        if summon_two.get_health() != 0 and boss_obj.get_health() > 0:
-            player_attack_phase(summon_two, boss_obj)
-            if boss_obj.get_health() > 0:
-                # Begin boss attack phase if the boss is still alive.
-                boss_attack_phase(summon_two, boss_obj)
-
-    # If the boss has no hp, then show a victory screen and proceed.
-    print('\nENEMY FELLED\n')
-    time.sleep(1)
-
-    # Update the player's runes value.
-    print(f'You gained {runes} runes.\n')
-    host_obj.add_runes(runes)
-    summon_one.add_runes(runes)
-    summon_two.add_runes(runes)
-    print(f'{host_obj.get_name()} currently has {host_obj.get_runes()} runes.')
-    print(f'{summon_one.get_name()} currently has {summon_one.get_runes()} runes.')
-    print(f'{summon_two.get_name()} currently has {summon_two.get_runes()} runes.')
-    time.sleep(1)
-
-    # Make the rest action interactive for the player.
-    input("\nPress'ENTER' to end journey...")
+    boss_fight(player_list, boss_obj, 'main')
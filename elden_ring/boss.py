@@ -17,9 +17,10 @@ Functions:
 import math
 import sys
 import os
-import time
-import secrets
-import pandas as pd
+import dice
+import game_data
+import data_bundle
+import pacing
 
 
 BOSSES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'bosses'))
@@ -32,8 +33,8 @@ def roll_d10():
     Returns:
         int: Returns a number from 1-10 (inclusive).
     """
-    # Roll a number in the range 1-10 and return it.
-    return secrets.SystemRandom().randrange(1,11)
+    # Roll a number in the range 1-10 through the shared dice backend.
+    return dice.roll_d10()
 
 
 # Class for the boss character.
@@ -56,6 +57,8 @@ class Boss():
 
     Methods
     -------
+    create(tier='tutorial', boss_name=None)
+        Creates a Boss of the given tier without going through a boss fight.
     drop_weapon(chance=1)
         Allows the boss to drop a random weapon from one of two weapon lists
         when defeated.
@@ -71,6 +74,8 @@ class Boss():
         Returns the health value of the boss object.
     get_armor()
         Returns the armor value of the boss object.
+    get_attack()
+        Returns the attack value of the boss object.
     get_name()
         Returns the name of the boss object.
     get_runes()
@@ -85,12 +90,9 @@ class Boss():
     """
 
     def __init__(self):
-        # Set the starter/tutorial boss name, health, attack, armor and runes.
-        self._boss_name = 'Soldier of Godrick'
-        self._boss_health = math.ceil(384 / 2)
-        self._boss_attack = 10
-        self._boss_armor = 7
-        self._boss_runes = 400
+        # Set the starter/tutorial boss name, health, attack, armor and runes
+        # from the boss parameter file.
+        self._set_boss_data(game_data.tutorial_boss())
 
     def drop_weapon(self, chance = 1):
         """drop_weapon Allows the boss to drop a random weapon from one of two
@@ -105,115 +107,120 @@ class Boss():
             a fully upgraded weapon and chance = 2 is a 50% chance. Defaults to 1.
 
         Returns:
-            pandas.core.frame.DataFrame: Sample DataFrame from one of the weapon lists.
+            game_data.Weapon: A random weapon from one of the weapon lists.
         """
         # Ensure that chance is at least 1 so there is no error for randrange.
         if chance <= 0:
             chance = 1
 
-        unupgraded_weapons_path = os.path.join(WEAPONS_PATH, 'unupgraded-weapons.csv')
-        upgraded_weapons_path = os.path.join(WEAPONS_PATH, 'full-upgraded-weapons.csv')
-
-        luck = secrets.SystemRandom().randrange(0, chance)
+        luck = dice.randbelow(chance)
 
         try:
-            if luck == 0:
-                weapon_drop = pd.read_csv(upgraded_weapons_path, sep=';').sample()
-                return weapon_drop
-        except FileNotFoundError:
-            print(f'File {upgraded_weapons_path} not found! Exiting...')
-            time.sleep(1.5)
+            weapons = game_data.get_weapon_catalog()
+        except FileNotFoundError as error:
+            print(f'File {error.filename} not found! Exiting...')
+            pacing.sleep(1.5)
             sys.exit(1)
-
-        try:
-            weapon_drop = pd.read_csv(unupgraded_weapons_path, sep=';').sample()
-            return weapon_drop
-        except FileNotFoundError:
-            print(f'File {unupgraded_weapons_path} not found! Exiting...')
-            time.sleep(1.5)
+        except data_bundle.DataValidationError as error:
+            print(f'\n{error}\nExiting...')
+            pacing.sleep(1.5)
             sys.exit(1)
 
+        if luck == 0:
+            return weapons.random_weapon(upgraded=True)
+        return weapons.random_weapon(upgraded=False)
+
     def set_field_boss(self):
         """set_field_boss Sets the stats for a boss from the field-boss-list
-        CSV file. Creates a pandas DataFrame of the data and grabs a sample
-        to use as the boss name and health.
+        CSV file. Picks a random boss from the preloaded boss roster to use as
+        the boss name, health and runes.
         """
-        # Set the boss file path, attack, and armor.
-        boss_file_path = os.path.join(BOSSES_PATH, 'field-boss-list.csv')
-        self._boss_attack = 15
-        self._boss_armor = 9
-
-        # Read the field boss list file and get a sample of boss data.
-        # Set the boss name and health.
-        try:
-            boss_data = pd.read_csv(boss_file_path, sep=';').sample()
-            self._boss_name = boss_data.iloc[0,0]
-            self._boss_health = math.ceil(boss_data.iloc[0,1]
-                                          / 4)
-            self._boss_runes = boss_data.iloc[0,2]
-        except FileNotFoundError:
-            print(f'\nFile {boss_file_path} not found! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
-        except IndexError:
-            print('\nError: Index out of range in boss data! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
+        self._set_tier_boss('field')
 
     def set_mini_boss(self):
         """set_mini_boss Sets the stats for a boss from the mini-boss-list
-        CSV file. Creates a pandas DataFrame of the data and grabs a sample
-        to use as the boss name and health.
+        CSV file. Picks a random boss from the preloaded boss roster to use as
+        the boss name, health and runes.
         """
-        # Set the boss file path, attack, and armor.
-        boss_file_path = os.path.join(BOSSES_PATH, 'mini-boss-list.csv')
-        self._boss_attack = 20
-        self._boss_armor = 11
-
-        # Read the mini boss list file and create a list of mini bosses.
-        # Set the boss name and health.
-        try:
-            boss_data = pd.read_csv(boss_file_path, sep=';').sample()
-            self._boss_name = boss_data.iloc[0,0]
-            self._boss_health = math.ceil(boss_data.iloc[0,1]
-                                          / 6)
-            self._boss_runes = boss_data.iloc[0,2]
-        except FileNotFoundError:
-            print(f'\nFile {boss_file_path} not found! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
-        except IndexError:
-            print('\nError: Index out of range in boss data! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
+        self._set_tier_boss('mini')
 
     def set_main_boss(self):
         """set_main_boss Sets the stats for a boss from the main-boss-list
-        CSV file. Creates a pandas DataFrame of the data and grabs a sample
-        to use as the boss name and health.
+        CSV file. Picks a random boss from the preloaded boss roster to use as
+        the boss name, health and runes.
         """
-        # Set the boss file path, attack, and armor.
-        boss_file_path = os.path.join(BOSSES_PATH, 'main-boss-list.csv')
-        self._boss_attack = 25
-        self._boss_armor = 13
+        self._set_tier_boss('main')
 
-        # Read the main boss list file and create a list of main bosses.
-        # Set the boss name and health.
+    def _set_tier_boss(self, tier):
+        """_set_tier_boss Sets the stats for a random boss from the given tier
+        of the boss roster.
+
+        Args:
+            tier (str): The boss tier, e.g. 'field', 'mini' or 'main'.
+        """
         try:
-            boss_data = pd.read_csv(boss_file_path, sep=';').sample()
-            self._boss_name = boss_data.iloc[0,0]
-            self._boss_health = math.ceil(boss_data.iloc[0,1]
-                                          / 8)
-            self._boss_runes = boss_data.iloc[0,2]
-        except FileNotFoundError:
-            print(f'\nFile {boss_file_path} not found! Exiting...')
-            time.sleep(1.5)
+            boss_data = game_data.get_boss_roster().random_boss(tier)
+        except FileNotFoundError as error:
+            print(f'\nFile {error.filename} not found! Exiting...')
+            pacing.sleep(1.5)
+            sys.exit(1)
+        except data_bundle.DataValidationError as error:
+            print(f'\n{error}\nExiting...')
+            pacing.sleep(1.5)
             sys.exit(1)
         except IndexError:
             print('\nError: Index out of range in boss data! Exiting...')
-            time.sleep(1.5)
+            pacing.sleep(1.5)
             sys.exit(1)
 
+        self._set_boss_data(boss_data)
+
+    def _set_boss_data(self, boss_data):
+        """_set_boss_data Sets the boss' stats from an entry of the boss roster.
+
+        Args:
+            boss_data (game_data.BossEntry): The boss' name, health, runes,
+            attack and armor.
+        """
+        # Set the boss name, health, runes, attack and armor.
+        self._boss_name = boss_data.name
+        self._boss_health = boss_data.health
+        self._boss_runes = boss_data.runes
+        self._boss_attack = boss_data.attack
+        self._boss_armor = boss_data.armor
+
+    @classmethod
+    def create(cls, tier='tutorial', boss_name=None):
+        """create Create a Boss of the given tier without going through a boss
+        fight. Raises exceptions instead of exiting the program.
+
+        Args:
+            tier (str, optional): The boss tier, either 'tutorial', 'field',
+            'mini' or 'main'. Defaults to 'tutorial'.
+            boss_name (str, optional): The name of the boss to pick from the
+            tier. A random boss from the tier is picked if None. Defaults to None.
+
+        Raises:
+            KeyError: If the tier or the boss name is not known.
+            FileNotFoundError: If the boss parameter file or one of the boss
+            files does not exist.
+            data_bundle.DataValidationError: If the boss parameter file or any
+            of the game data files are invalid.
+
+        Returns:
+            Boss: The new boss.
+        """
+        boss_obj = cls()
+        if tier == 'tutorial':
+            return boss_obj
+
+        roster = game_data.get_boss_roster()
+        if boss_name is None:
+            boss_obj._set_boss_data(roster.random_boss(tier))
+        else:
+            boss_obj._set_boss_data(roster.get(tier, boss_name))
+        return boss_obj
+
     def print_stats(self):
         """print_stats Prints the boss name and health.
         """
@@ -236,6 +243,14 @@ class Boss():
         """
         return self._boss_armor
 
+    def get_attack(self):
+        """get_attack Returns the boss' attack value.
+
+        Returns:
+            int: The boss' attack.
+        """
+        return self._boss_attack
+
     def get_name(self):
         """get_name Return the boss' name.
 
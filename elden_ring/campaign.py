@@ -0,0 +1,347 @@
+"""
+campaign.py
+
+Listen up, brother! This module plays whole campaigns of the Elden Ring CLI game without a single prompt:
+the tutorial boss, then a random field, mini and main boss, with the weapon drops, runes and a rest at a
+site of grace between every fight, just like elden_ring.py. The fights are resolved by fight_engine.py,
+and the choices a player would make at the prompts are made by a weapon policy and a level-up policy.
+
+Campaigns are split into chunks that run across a pool of worker processes, and each chunk's results are
+written to a ';' separated file as soon as it finishes. Every chunk has its own seed, so a run can be
+repeated exactly with the same seed whatever the number of workers.
+
+Run it through elden_ring.py, e.g.
+
+    python elden_ring.py --simulate 1000000 --players 3 --jobs 8
+
+Classes:
+    CampaignResult:
+        A named tuple holding the outcome of a single campaign.
+
+Functions:
+    level_up_stat(policy, stats) -> str:
+        Returns the stat a level-up policy increases next, brother!
+
+    level_up_plan(policy, stats, levels) -> dict:
+        Returns the levels a level-up policy puts in each stat.
+
+    choose_hand(policy, player, weapon) -> str:
+        Returns the hand a weapon policy equips a dropped weapon in, if any.
+
+    run_campaign(classes, rng, level_up='balanced', weapons='best', campaign=0) -> CampaignResult:
+        Plays a whole campaign for a party of the given classes, brother!
+
+    simulate(campaigns, players=1, jobs=None, output='campaigns.csv', level_up='balanced',
+             weapons='best', classes=None, seed=None) -> dict:
+        Runs many campaigns across a pool of processes, streaming the results to a file, brother!
+"""
+
+import multiprocessing
+import os
+import random
+import secrets
+import time
+from collections import namedtuple
+import battles
+import boss
+import character
+import fight_engine
+import game_data
+
+
+CHUNK_CAMPAIGNS = 1000    # Number of campaigns in each chunk handed to a worker.
+LEVEL_UP_POLICIES = ['balanced', 'vigor', 'strength', 'none']
+WEAPON_POLICIES = ['best', 'keep']
+
+# The boss fights of a campaign in order, with the chance of a fully upgraded
+# weapon drop ("1 in chance"), taken from battles.py so the game and the
+# campaigns never drift apart. The main boss drops no weapon.
+STAGES = [(tier, battles.DROP_CHANCES[tier]) for tier in battles.BOSS_TIERS]
+
+CSV_HEADER = ['Campaign', 'Classes', 'Cleared', 'Stage', 'Rounds', 'Bosses', 'Levels']
+
+# classes: the class of every player, host first. cleared: True if the main
+# boss was felled. stage: the last stage reached, see STAGES. rounds: the
+# number of rounds fought over the whole campaign. bosses: the names of the
+# bosses fought. levels: the final level of every player.
+CampaignResult = namedtuple('CampaignResult', ['campaign', 'classes', 'cleared', 'stage',
+                                               'rounds', 'bosses', 'levels'])
+
+
+def level_up_stat(policy, stats):
+    """level_up_stat Return the stat a level-up policy increases next.
+
+    'balanced' raises Vig and Str in turns, keeping them even. 'vigor' only
+    raises Vig for more health, 'strength' only raises Str for more attack,
+    and 'none' never levels up.
+
+    Args:
+        policy (str): One of LEVEL_UP_POLICIES.
+        stats (dict): The player's current stats.
+
+    Returns:
+        str: The stat to increase, or None to stop leveling up.
+    """
+    if policy == 'balanced':
+        return 'Vig' if stats['Vig'] <= stats['Str'] else 'Str'
+    if policy == 'vigor':
+        return 'Vig'
+    if policy == 'strength':
+        return 'Str'
+    return None
+
+
+def level_up_plan(policy, stats, levels):
+    """level_up_plan Return how a level-up policy spends several levels, the
+    same as asking level_up_stat() for one level at a time.
+
+    Args:
+        policy (str): One of LEVEL_UP_POLICIES.
+        stats (dict): The player's current stats.
+        levels (int): The number of levels to spend.
+
+    Returns:
+        dict: A dictionary of stats to the number of levels to put in each.
+    """
+    if policy == 'balanced':
+        # Level the lower of Vig and Str until they are even, Vig first on a
+        # tie, then share the rest starting with Vig.
+        gap = min(abs(stats['Vig'] - stats['Str']), levels)
+        low = 'Vig' if stats['Vig'] <= stats['Str'] else 'Str'
+        rest = levels - gap
+        plan = {'Vig': (rest + 1) // 2, 'Str': rest // 2}
+        plan[low] += gap
+        return plan
+    stat = level_up_stat(policy, stats)
+    return {stat: levels} if stat is not None else {}
+
+
+def _hands_attack(player, right_hand, left_hand):
+    """_hands_attack Return the attack the player would have with the given
+    weapons in their hands, the same as Character.update_stats().
+    """
+    weapons = game_data.get_weapon_catalog()
+    stats = player.get_stats()
+    attack = weapons.get(right_hand).attack + stats['Str'] + stats['Dex']
+    if left_hand:
+        left = weapons.get(left_hand)
+        if left.type in character.WEAPON_TYPES:
+            attack += left.attack // 2
+    return attack
+
+
+def choose_hand(policy, player, weapon):
+    """choose_hand Return the hand a weapon policy equips a dropped weapon in.
+
+    'best' equips a weapon in the hand that gives the most attack, if any, and
+    a shield in an empty left hand or in place of a left hand weapon if the
+    player has no shield yet. 'keep' never changes weapons.
+
+    Args:
+        policy (str): One of WEAPON_POLICIES.
+        player (character.Character): The player.
+        weapon (game_data.Weapon): The dropped weapon.
+
+    Returns:
+        str: 'Right Hand' or 'Left Hand', or None to keep the current weapons.
+    """
+    if policy != 'best':
+        return None
+
+    equipment = player.get_equipment()
+    if weapon.type in character.SHIELD_TYPES:
+        left_hand = equipment['Left Hand']
+        has_shield = bool(left_hand) and \
+            character.get_weapon(left_hand).type in character.SHIELD_TYPES
+        return None if has_shield else 'Left Hand'
+    if weapon.type not in character.WEAPON_TYPES:
+        return None
+
+    current = _hands_attack(player, equipment['Right Hand'], equipment['Left Hand'])
+    right = _hands_attack(player, weapon.name, equipment['Left Hand'])
+    left = _hands_attack(player, equipment['Right Hand'], weapon.name)
+    if max(right, left) <= current:
+        return None
+    return 'Right Hand' if right >= left else 'Left Hand'
+
+
+def _stage_boss(tier, rng):
+    """_stage_boss Return the Fighter and the runes of a boss of the given
+    tier picked with the generator.
+    """
+    if tier == 'tutorial':
+        boss_obj = boss.Boss()
+        return fight_engine.from_boss(boss_obj), boss_obj.get_runes()
+
+    bosses = game_data.get_boss_roster().bosses(tier)
+    entry = bosses[rng.randrange(len(bosses))]
+    return fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor), entry.runes
+
+
+def _drop_weapon(chance, rng):
+    """_drop_weapon Return a random weapon dropped by a felled boss, the same
+    as Boss.drop_weapon() but picked with the generator.
+    """
+    weapons = game_data.get_weapon_catalog()
+    pool = weapons.upgraded() if rng.randrange(chance) == 0 else weapons.unupgraded()
+    return pool[rng.randrange(len(pool))]
+
+
+def run_campaign(classes, rng, level_up='balanced', weapons='best', campaign=0):
+    """run_campaign Play a whole campaign for a party without any prompts. The
+    campaign ends as soon as the host falls, the same as elden_ring.py.
+
+    Args:
+        classes (list): The class of every player, host first.
+        rng (random.Random): The generator for the fights, boss picks and
+        weapon drops.
+        level_up (str, optional): One of LEVEL_UP_POLICIES. Defaults to
+        'balanced'.
+        weapons (str, optional): One of WEAPON_POLICIES. Defaults to 'best'.
+        campaign (int, optional): The number of the campaign. Defaults to 0.
+
+    Returns:
+        CampaignResult: The outcome of the campaign.
+    """
+    players = [character.Character.create(name, f'Player {number + 1}')
+               for number, name in enumerate(classes)]
+    bosses = []
+    rounds = 0
+
+    for tier, chance in STAGES:
+        boss_fighter, runes = _stage_boss(tier, rng)
+        bosses.append(boss_fighter.name)
+        result = fight_engine.resolve_fight(
+            [fight_engine.from_character(player) for player in players], boss_fighter, rng)
+        rounds += result.rounds
+        for player, health in zip(players, result.player_health):
+            player.reduce_health(player.get_health() - health)
+
+        if not result.won:
+            break
+        if chance is None:
+            # The main boss is felled, the campaign is cleared.
+            break
+
+        # Every player may equip the dropped weapon and gets the runes.
+        dropped_weapon = _drop_weapon(chance, rng)
+        for player in players:
+            hand = choose_hand(weapons, player, dropped_weapon)
+            if hand is not None:
+                player.equip(dropped_weapon.name, hand)
+            player.add_runes(runes)
+
+        # Rest at a site of grace: level up as long as the runes last, then heal.
+        for player in players:
+            levels = character.affordable_levels(player.get_level(), player.get_runes())
+            player.level_up_stats(level_up_plan(level_up, player.get_stats(), levels))
+            player.heal()
+
+    return CampaignResult(campaign, list(classes), result.won and chance is None, tier,
+                          rounds, bosses, [player.get_level() for player in players])
+
+
+def _run_chunk(task):
+    """_run_chunk Run a chunk of campaigns in a worker process and return
+    their results as lines of the output file.
+    """
+    first, count, seed, players, classes, level_up, weapons = task
+    rng = random.Random(seed)
+    lines = []
+    cleared = 0
+    for campaign in range(first, first + count):
+        party = classes or [rng.choice(character.CLASSES) for _ in range(players)]
+        result = run_campaign(party, rng, level_up, weapons, campaign)
+        cleared += result.cleared
+        lines.append(';'.join([str(result.campaign), '|'.join(result.classes),
+                               str(result.cleared), result.stage, str(result.rounds),
+                               '|'.join(result.bosses),
+                               '|'.join(str(level) for level in result.levels)]))
+    return count, cleared, lines
+
+
+def _load_worker():
+    """_load_worker Load the game data and class templates once per worker
+    process.
+    """
+    game_data.get_weapon_catalog()
+    game_data.get_boss_roster()
+    character.Character.load_templates()
+
+
+def simulate(campaigns, players=1, jobs=None, output='campaigns.csv', level_up='balanced',
+             weapons='best', classes=None, seed=None):
+    """simulate Run many campaigns across a pool of worker processes, writing
+    each chunk of results to a ';' separated file as soon as it finishes and
+    showing the progress.
+
+    Args:
+        campaigns (int): The number of campaigns to run.
+        players (int, optional): The number of players in every party.
+        Defaults to 1.
+        jobs (int, optional): The number of worker processes. Uses every CPU
+        if None. Defaults to None.
+        output (str, optional): The file to write the results to. Defaults
+        to 'campaigns.csv'.
+        level_up (str, optional): One of LEVEL_UP_POLICIES. Defaults to
+        'balanced'.
+        weapons (str, optional): One of WEAPON_POLICIES. Defaults to 'best'.
+        classes (list, optional): The class of every player. Random classes
+        are picked for every campaign if None. Defaults to None.
+        seed (int, optional): The seed of the run. A random seed is picked
+        if None. Defaults to None.
+
+    Raises:
+        ValueError: If jobs is less than 1.
+        OSError: If the output file cannot be written.
+
+    Returns:
+        dict: The number of campaigns run and cleared, the seed, and the
+        time taken.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    elif jobs < 1:
+        raise ValueError(f'A simulation needs at least 1 worker process, got {jobs}')
+    seed = secrets.randbits(32) if seed is None else seed
+    # Each chunk's generator is seeded from the run's seed and the chunk
+    # number together, so the chunks of runs with nearby seeds never overlap.
+    tasks = [(first, min(CHUNK_CAMPAIGNS, campaigns - first),
+              f'{seed}:{first // CHUNK_CAMPAIGNS}', players, classes, level_up, weapons)
+             for first in range(0, campaigns, CHUNK_CAMPAIGNS)]
+
+    # Load everything before the pool starts so forked workers share it.
+    _load_worker()
+    start = time.perf_counter()
+    done = cleared = 0
+
+    with open(output, 'w', encoding='UTF-8') as file:
+        file.write(';'.join(CSV_HEADER) + '\n')
+        if jobs == 1:
+            results = map(_run_chunk, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(jobs, initializer=_load_worker)
+            results = pool.imap_unordered(_run_chunk, tasks)
+        try:
+            for count, chunk_cleared, lines in results:
+                file.write('\n'.join(lines) + '\n')
+                file.flush()
+                done += count
+                cleared += chunk_cleared
+                elapsed = time.perf_counter() - start
+                print(f'\rSimulated {done}/{campaigns} campaigns '
+                      f'({done / elapsed:,.0f}/s, {cleared / done:.1%} cleared)',
+                      end='', flush=True)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+    print()
+
+    return {'campaigns': done, 'cleared': cleared, 'seed': seed,
+            'seconds': time.perf_counter() - start}
+
+
+if __name__ == "__main__":
+    print("This module is to be imported by elden_ring.py.")
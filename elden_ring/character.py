@@ -12,16 +12,33 @@ Classes:
 Functions:
     roll_d10() -> int:
         Generates a random number between 1 and 10 (inclusive), brother!
+
+    get_weapon(weapon_name) -> game_data.Weapon:
+        Looks up a weapon in the weapon catalog that gets loaded only once, brother!
+
+    get_class_data(character) -> dict:
+        Looks up the data of a class .json file in the game data bundle, brother!
+
+    rune_cost(level) -> int:
+        Returns the number of runes needed to level up from the given level, brother!
+
+    levels_cost(level, levels) -> int:
+        Returns the number of runes needed to level up several times from the given level.
+
+    affordable_levels(level, runes) -> int:
+        Returns how many levels in a row the given runes buy, brother!
 """
 
+import bisect
+import importlib.util
 import math
-import json
 import os
-import time
 import sys
-import secrets
+import dice
 import pyinputplus as pyip
-import pandas as pd
+import game_data
+import data_bundle
+import pacing
 
 
 CLASSES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'classes'))
@@ -34,6 +51,11 @@ WEAPON_TYPES = ['Dagger', 'Straight Sword', 'Greatsword', 'Colossal Weapon',
                 'Light Bow', 'Bow', 'Greatbow', 'Crossbow', 'Ballista',
                 'Glintstone Staff', 'Sacred Seal', 'Torches']
 SHIELD_TYPES = ['Small Shield', 'Medium Shield', 'Great Shield']
+BASE_ARMOR = 11      # Every player's armor without a shield.
+SHIELD_ARMOR = 13    # A player's armor with a shield in the Left Hand.
+RUNE_TABLE_LEVELS = 713     # Levels in the rune cost table, the highest level in Elden Ring.
+CLASSES = ['Astrologer', 'Bandit', 'Confessor', 'Hero', 'Prisoner', 'Prophet',
+           'Samurai', 'Vagabond', 'Warrior', 'Wretch']
 
 
 def roll_d10():
@@ -42,8 +64,138 @@ def roll_d10():
     Returns:
         int: Returns a number from 1-10 (inclusive).
     """
-    # Roll a number in the range 1-10 and return it.
-    return secrets.SystemRandom().randrange(1,11)
+    # Roll a number in the range 1-10 through the shared dice backend.
+    return dice.roll_d10()
+
+
+def get_weapon(weapon_name):
+    """get_weapon Look up a weapon by name in the process-wide weapon catalog.
+    Exits the program if the weapon files or the weapon cannot be found.
+
+    Args:
+        weapon_name (str): The name of the weapon to look up.
+
+    Returns:
+        game_data.Weapon: The weapon's name, type and attack.
+    """
+    try:
+        return game_data.get_weapon_catalog().get(weapon_name)
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        pacing.sleep(1.5)
+        sys.exit(1)
+    except data_bundle.DataValidationError as error:
+        print(f'\n{error}\nExiting...')
+        pacing.sleep(1.5)
+        sys.exit(1)
+    except KeyError:
+        print(f'\nError: Weapon {weapon_name} not found in weapon data! Exiting...')
+        pacing.sleep(1.5)
+        sys.exit(1)
+
+
+def get_class_data(character):
+    """get_class_data Look up the data of a class .json file in the game data
+    bundle. Exits the program if the game data or the class cannot be found.
+
+    Args:
+        character (str): The name of the class, e.g. 'Samurai'.
+
+    Returns:
+        dict: The class data with its Level, Stats and Equipment.
+    """
+    try:
+        return game_data.load_game_data()['classes'][character.lower()]
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        pacing.sleep(1.5)
+        sys.exit(1)
+    except data_bundle.DataValidationError as error:
+        print(f'\n{error}\nExiting...')
+        pacing.sleep(1.5)
+        sys.exit(1)
+    except KeyError:
+        character_path = os.path.join(CLASSES_PATH, character.lower() + '.json')
+        print(f'\nFile {character_path} not found! Exiting...')
+        sys.exit(1)
+
+
+def rune_cost(level):
+    """rune_cost Return the number of runes needed to level up a character
+    from the given level. The formula for the rune cost is taken from
+    eldenring.wiki.fextralife.com/Level
+
+    Args:
+        level (int): The character's current level.
+
+    Returns:
+        int: The rune cost of the next level.
+    """
+    # Formula for calculating the rune cost.
+    x = ((level + 81) - 92) * 0.02
+    # Change x to 0 if the above expression results in x below 0.
+    x = max(x, 0)
+    return int(((x + 0.1) * ((level + 81) ** 2)) + 1)
+
+
+def _extend_rune_totals(level):
+    """_extend_rune_totals Extend the table of rune totals to hold the given
+    level.
+
+    Args:
+        level (int): The highest level the table must hold.
+    """
+    while len(_rune_totals) <= level:
+        _rune_totals.append(_rune_totals[-1] + rune_cost(len(_rune_totals) - 1))
+
+
+# _rune_totals[n] is the number of runes needed to level up from level 0 to
+# level n, so the cost of any run of levels is a difference of two entries.
+# Levels past RUNE_TABLE_LEVELS are added when they are first asked for.
+_rune_totals = [0]
+_extend_rune_totals(RUNE_TABLE_LEVELS)
+
+
+def levels_cost(level, levels):
+    """levels_cost Return the number of runes needed to level up a character
+    several times in a row from the given level.
+
+    Args:
+        level (int): The character's current level.
+        levels (int): The number of levels.
+
+    Returns:
+        int: The rune cost of the levels.
+    """
+    _extend_rune_totals(level + levels)
+    return _rune_totals[level + levels] - _rune_totals[level]
+
+
+def affordable_levels(level, runes):
+    """affordable_levels Return how many levels in a row a character can buy
+    from the given level with the given runes.
+
+    Args:
+        level (int): The character's current level.
+        runes (int): The character's runes.
+
+    Returns:
+        int: The number of levels.
+    """
+    _extend_rune_totals(level)
+    total = _rune_totals[level] + runes
+    # Every level costs at least one rune, so the table only has to reach
+    # past the total when there are more runes than it holds.
+    while _rune_totals[-1] <= total:
+        _extend_rune_totals(2 * len(_rune_totals))
+    return bisect.bisect_right(_rune_totals, total) - 1 - level
+
+
+def _has_numpy():
+    """_has_numpy Return True if NumPy is installed, without importing it.
+    NumPy is optional and only needed by the Recommended Build action.
+    """
+    return importlib.util.find_spec('numpy') is not None
 
 
 # The class for the the player character.
@@ -76,6 +228,12 @@ class Character:
 
     Methods
     -------
+    create(character, player_name, stats=None, equipment=None)
+        Creates a Character without any prompts.
+    get_template(character)
+        Returns the cached template Character of the given class.
+    load_templates()
+        Parses every class and caches their template Characters.
     update_stats()
         Reads the player's stats and updates their max health and attack.
     print_stats()
@@ -86,17 +244,40 @@ class Character:
         Returns the player's name.
     get_armor()
         Returns the player's armor rating value.
+    get_attack()
+        Returns the player's attack rating value.
     get_health()
         Returns the player's current health value.
+    get_max_health()
+        Returns the player's maximum health value.
     get_runes()
         Returns the player's current runes.
+    get_level()
+        Returns the player's current level.
+    get_stats()
+        Returns a copy of the player's stats.
+    get_equipment()
+        Returns a copy of the player's equipment slots.
+    level_up(stat)
+        Increase the given stat without any prompts if the player has enough runes.
+    level_up_stats(levels)
+        Increase several stats by several levels at once without any prompts.
+    level_up_to(stat, value)
+        Increase the given stat up to a value at once without any prompts.
     increase_player_level()
         Increase the player's chosen stat.
+    equip(weapon_name, hand)
+        Equip a weapon in the given hand without any prompts.
     change_weapon(weapon_data)
         Give the player the opportunity to equip the new weapon dropped from the
         previous boss fight.
-    grace()
+    heal()
         Sets the player's current health value to the player's max health value.
+    grace(next_tier=None)
+        Lets the player level up, or take the recommended build for the next
+        boss tier, then heals them before the next boss fight.
+    take_recommended_build(tier)
+        Level up with the build that gives the best chance against the tier.
     reduce_health(damage=0)
         Subtracts the player's current health value by the given to the
         damage parameter.
@@ -111,15 +292,45 @@ class Character:
         boss. Round the damage number up to the nearest whole number.
     """
 
+    _templates = {}     # Cache of class names to their template Character.
+
     def __init__(self):
-        # Path for the file that contains the starter weapons for each class.
-        unupgraded_weapons_path = os.path.join(WEAPONS_PATH, 'unupgraded-weapons.csv')
+        # Clear the screen for the terminal.
+        os.system('cls' if os.name == 'nt' else 'clear')
 
+        # Create a menu of the classes for the player to choose from:
+        character = pyip.inputMenu(CLASSES + ['Quit'], numbered=True)
+
+        # Exit the program if the player chooses the 'Quit' option.
+        if character == 'Quit':
+            sys.exit()
+
+        # Get a name for the player.
+        player_name = pyip.inputStr(prompt='\nEnter a name for your character: ')
+
+        # "Load" the class and clear the screen.
+        print('Loading class...')
+        pacing.sleep(0.5)
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+        # Copy the stats, equipment and derived stats of the chosen class.
+        self._copy_template(Character.get_template(character))
+        self._player_name = player_name
+
+    def _load_class(self, character):
+        """_load_class Sets the player's class, level, stats and equipment from
+        the class .json file of the given class and derives their max health,
+        attack and armor from them.
+
+        Args:
+            character (str): The name of the class, e.g. 'Samurai'.
+        """
         self._player_max_health = 0
         self._player_current_health = 0
         self._player_attack = 0
-        self._player_armor = 11
+        self._player_armor = BASE_ARMOR
         self._player_runes = 0
+        self._player_name = ''
 
         self._stats = {
             'Vig': 0,
@@ -143,39 +354,8 @@ class Character:
 
         # _self.inventory = {}   Dictionary to track the player's inventory.
 
-        # Clear the screen for the terminal.
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-        # Create a menu of the classes for the player to choose from:
-        self._character = pyip.inputMenu(['Astrologer', 'Bandit','Confessor',
-                                    'Hero', 'Prisoner', 'Prophet', 'Samurai',
-                                    'Vagabond', 'Warrior', 'Wretch', 'Quit'],
-                                   numbered=True)
-
-        # Exit the program if the player chooses the 'Quit' option.
-        if self._character == 'Quit':
-            sys.exit()
-
-        # Get a name for the player.
-        self._player_name = pyip.inputStr(
-                            prompt='\nEnter a name for your character: ')
-
-        # "Load" the class and clear the screen.
-        print('Loading class...')
-        time.sleep(0.5)
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-        # Join the path to the classes .json files and the chosen class to get
-        # the .json file for the chosen class and load the json file data into
-        # classData.
-        character_path = os.path.join(CLASSES_PATH,
-                                      self._character.lower() + '.json')
-        try:
-            with open(character_path, 'r', encoding="UTF-8") as file:
-                class_data = json.load(file)
-        except FileNotFoundError:
-            print(f'\nFile {character_path} not found! Exiting...')
-            sys.exit(1)
+        self._character = character
+        class_data = get_class_data(character)
 
         self._player_level = class_data['Level']
 
@@ -187,97 +367,131 @@ class Character:
             # Fill the slots for the player's equipment in the _equipment dict.
             self._equipment[k] = v
 
-        try:
-            weapons_df = pd.read_csv(unupgraded_weapons_path, sep=';')
+        # Set the player's attack and armor from their equipped weapons and
+        # their max health from their Vig stat.
+        self.update_stats()
 
-            # Get the data for the weapon in the player's right hand and set the
-            # player's attack to that weapon's attack.
-            right_hand = weapons_df[weapons_df["Name"] == self._equipment['Right Hand']]
-            self._player_attack = int(right_hand.iloc[0,2])
+        # Set the player's current health equal to their max health.
+        self._player_current_health = self._player_max_health
 
-            # Get the data for the weapon in the player's left hand.
-            left_hand = weapons_df[weapons_df["Name"] == self._equipment['Left Hand']]
-            if left_hand.iloc[0,1] in WEAPON_TYPES:
-                # Add half its attack to the player's attack if it is a weapon.
-                self._player_attack += int(left_hand.iloc[0,2]) // 2
-            elif left_hand.iloc[0,1] in SHIELD_TYPES:
-                # Increase the player's armor if it is a shield.
-                self._player_armor = 13
-        except FileNotFoundError:
-            print(f'\nFile {unupgraded_weapons_path} not found! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
-        except IndexError:
-            print('\nError: Index out of range for weapon data! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
+    def _copy_template(self, template):
+        """_copy_template Makes the player a shallow copy of the template
+        Character. The stats and equipment get their own dictionaries since they
+        change as the player levels up and equips new weapons.
 
-        # Increase the player's attack by their Str and Dex stat.
-        self._player_attack += (self._stats['Str'] + self._stats['Dex'])
+        Args:
+            template (Character): The template Character of the player's class.
+        """
+        self.__dict__.update(template.__dict__)
+        self._stats = dict(template._stats)
+        self._equipment = dict(template._equipment)
 
-        # Get the player's max health and set their current health equal to
-        # their max health.
-        self._player_max_health = self._stats['Vig'] * 10
-        self._player_current_health = self._player_max_health
+    @classmethod
+    def get_template(cls, character):
+        """get_template Return the template Character of the given class. The
+        class .json file is parsed and the derived stats are computed the first
+        time a class is asked for.
+
+        Args:
+            character (str): The name of the class, e.g. 'Samurai'.
+
+        Returns:
+            Character: The template Character of the class. It should not be
+            changed, copy it with _copy_template() instead.
+        """
+        template = cls._templates.get(character)
+        if template is None:
+            template = cls.__new__(cls)
+            template._load_class(character)
+            cls._templates[character] = template
+        return template
+
+    @classmethod
+    def create(cls, character, player_name, stats=None, equipment=None):
+        """create Create a Character without any prompts, screen clears or
+        pauses. Gives the same derived stats as choosing the class and name in
+        the interactive menus.
+
+        Args:
+            character (str): The name of the class, e.g. 'Samurai'.
+            player_name (str): The name of the player.
+            stats (dict, optional): Stat values to use in place of the class'
+            values, e.g. {'Vig': 20}. Defaults to None.
+            equipment (dict, optional): Items to use in place of the class'
+            equipment, e.g. {'Right Hand': 'Uchigatana'}. Defaults to None.
+
+        Raises:
+            ValueError: If the class, a stat, an equipment slot or a weapon in
+            the player's hands is not known.
+
+        Returns:
+            Character: The new player.
+        """
+        if character not in CLASSES:
+            raise ValueError(f'Unknown class: {character}')
+
+        player = cls.__new__(cls)
+        player._copy_template(cls.get_template(character))
+        player._player_name = player_name
+
+        if not stats and not equipment:
+            return player
+
+        for k, v in (stats or {}).items():
+            if k not in player._stats:
+                raise ValueError(f'Unknown stat: {k}')
+            player._stats[k] = v
+
+        for k, v in (equipment or {}).items():
+            if k not in player._equipment:
+                raise ValueError(f'Unknown equipment slot: {k}')
+            if k in ('Right Hand', 'Left Hand') and v and v not in game_data.get_weapon_catalog():
+                raise ValueError(f'Unknown weapon: {v}')
+            player._equipment[k] = v
+
+        # Derive the stats again as if the class came with these values.
+        player._player_armor = BASE_ARMOR
+        player.update_stats()
+        player._player_current_health = player._player_max_health
+        return player
+
+    @classmethod
+    def load_templates(cls):
+        """load_templates Parse every class and compute their derived stats up
+        front, e.g. before creating thousands of characters for a simulation.
+
+        Returns:
+            dict: A dictionary of class names to their template Character.
+        """
+        for character in CLASSES:
+            cls.get_template(character)
+        return dict(cls._templates)
 
     def update_stats(self):
         """update_stats Reads the player's stats and updates their max health and
-        attacked based on their Vig, Str, and Dex.
+        attacked based on their Vig, Str, and Dex, and their armor based on
+        whether they hold a shield.
         """
-        unupgraded_weapons_path = os.path.join(WEAPONS_PATH, 'unupgraded-weapons.csv')
-        upgraded_weapons_path = os.path.join(WEAPONS_PATH, 'full-upgraded-weapons.csv')
+        # Reset the player's armor, a shield in the left hand raises it below.
+        self._player_armor = BASE_ARMOR
 
         # Set the player's health based on their Vig stat.
         self._player_max_health = self._stats['Vig'] * 10
 
-        try:
-            # Get the data for the weapon in the player's right hand and set the
-            # player's attack to that weapon's attack.
-            if 'MAX' in self._equipment['Right Hand']:
-                try:
-                    weapons_df = pd.read_csv(upgraded_weapons_path, sep=';')
-                except FileNotFoundError:
-                    print(f'\nFile {upgraded_weapons_path} not found! Exiting...')
-                    time.sleep(1.5)
-                    sys.exit(1)
-            else:
-                try:
-                    weapons_df = pd.read_csv(unupgraded_weapons_path, sep=';')
-                except FileNotFoundError:
-                    print(f'\nFile {unupgraded_weapons_path} not found! Exiting...')
-                    time.sleep(1.5)
-                    sys.exit(1)
-
-            right_hand = weapons_df[weapons_df["Name"] == self._equipment['Right Hand']]
-            self._player_attack = int(right_hand.iloc[0,2])
-
-            # Get the data for the weapon in the player's left hand.
-            if 'MAX' in self._equipment['Left Hand']:
-                try:
-                    weapons_df = pd.read_csv(upgraded_weapons_path, sep=';')
-                except FileNotFoundError:
-                    print(f'\nFile {upgraded_weapons_path} not found! Exiting...')
-                    time.sleep(1.5)
-                    sys.exit(1)
-            else:
-                try:
-                    weapons_df = pd.read_csv(unupgraded_weapons_path, sep=';')
-                except FileNotFoundError:
-                    print(f'\nFile {unupgraded_weapons_path} not found! Exiting...')
-                    time.sleep(1.5)
-                    sys.exit(1)
-
-            left_hand = weapons_df[weapons_df["Name"] == self._equipment['Left Hand']]
-            if left_hand.iloc[0,1] in WEAPON_TYPES:
+        # Get the data for the weapon in the player's right hand and set the
+        # player's attack to that weapon's attack.
+        right_hand = get_weapon(self._equipment['Right Hand'])
+        self._player_attack = right_hand.attack
+
+        # Get the data for the weapon in the player's left hand, if any.
+        if self._equipment['Left Hand']:
+            left_hand = get_weapon(self._equipment['Left Hand'])
+            if left_hand.type in WEAPON_TYPES:
                 # Add half its attack to the player's attack if it is a weapon.
-                self._player_attack += int(left_hand.iloc[0,2]) // 2
-            elif left_hand.iloc[0,1] in SHIELD_TYPES:
+                self._player_attack += left_hand.attack // 2
+            elif left_hand.type in SHIELD_TYPES:
                 # Increase the player's armor if it is a shield.
-                self._player_armor = 13
-        except IndexError:
-            print('\nError: Index out of range for weapon data! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
+                self._player_armor = SHIELD_ARMOR
 
         # Increase the player's attack by their Str and Dex stat.
         self._player_attack += (self._stats['Str'] + self._stats['Dex'])
@@ -303,7 +517,7 @@ class Character:
         print('-' * 30)
 
         # Let the player read the chosen class' stats.
-        time.sleep(3)
+        pacing.sleep(3)
         # Wait for the player to hit 'ENTER' to initiate the first battle.
         input("\nPress 'ENTER' to continue...")
 
@@ -332,6 +546,15 @@ class Character:
         # Return the player's armor rating for boss damage rolls.
         return self._player_armor
 
+    def get_attack(self):
+        """get_attack Return the player's attack rating.
+
+        Returns:
+            int: The player's attack rating.
+        """
+        # Return the player's attack rating for damage rolls.
+        return self._player_attack
+
     def get_health(self):
         """get_health Return the player's current health value.
 
@@ -341,6 +564,15 @@ class Character:
         # Return the player's current health.
         return self._player_current_health
 
+    def get_max_health(self):
+        """get_max_health Return the player's maximum health value.
+
+        Returns:
+            int: The player's maximum health value.
+        """
+        # Return the player's maximum health from their Vig stat.
+        return self._player_max_health
+
     def get_runes(self):
         """get_runes Return the player's current runes.
 
@@ -350,37 +582,139 @@ class Character:
         # Return the player's current runes.
         return self._player_runes
 
+    def get_level(self):
+        """get_level Return the player's current level.
+
+        Returns:
+            int: The player's current level.
+        """
+        return self._player_level
+
+    def get_stats(self):
+        """get_stats Return a copy of the player's stats.
+
+        Returns:
+            dict: A dictionary of the player's stats and values.
+        """
+        return dict(self._stats)
+
+    def get_equipment(self):
+        """get_equipment Return a copy of the player's equipment slots.
+
+        Returns:
+            dict: A dictionary of the player's equipment slots.
+        """
+        return dict(self._equipment)
+
+    def level_up(self, stat):
+        """level_up Increase the given stat by one and pay the rune cost of the
+        next level, without any prompts. Nothing happens if the player does not
+        have enough runes.
+
+        Args:
+            stat (str): The stat to increase, e.g. 'Vig'.
+
+        Returns:
+            bool: True if the player leveled up.
+        """
+        return self.level_up_stats({stat: 1}) == 1
+
+    def level_up_stats(self, levels):
+        """level_up_stats Increase several stats by several levels at once and
+        pay the rune cost of the levels, without any prompts. The levels are
+        bought in the order given until the player runs out of runes, and the
+        stats are updated once at the end.
+
+        Args:
+            levels (dict): A dictionary of stats to the number of levels to
+            put in each, e.g. {'Vig': 5, 'Str': 3}.
+
+        Raises:
+            ValueError: If a stat is not known. No stats are changed.
+
+        Returns:
+            int: The number of levels bought.
+        """
+        # Check every stat before changing any, so a bad one never leaves the
+        # player with levels they did not pay for.
+        for stat in levels:
+            if stat not in self._stats:
+                raise ValueError(f'Unknown stat: {stat}')
+
+        left = affordable_levels(self._player_level, self._player_runes)
+        bought = 0
+        for stat, count in levels.items():
+            count = max(min(count, left - bought), 0)
+            self._stats[stat] += count
+            bought += count
+
+        if bought:
+            # Increase the player's chosen stats and reduce their current runes.
+            self._player_runes -= levels_cost(self._player_level, bought)
+            self._player_level += bought
+            self.update_stats()
+        return bought
+
+    def level_up_to(self, stat, value):
+        """level_up_to Increase the given stat up to a value at once, or as far
+        as the player's runes go, without any prompts.
+
+        Args:
+            stat (str): The stat to increase, e.g. 'Vig'.
+            value (int): The value to increase the stat to.
+
+        Raises:
+            ValueError: If the stat is not known.
+
+        Returns:
+            int: The number of levels bought.
+        """
+        if stat not in self._stats:
+            raise ValueError(f'Unknown stat: {stat}')
+        return self.level_up_stats({stat: max(value - self._stats[stat], 0)})
+
     def increase_player_level(self):
         """increase_player_level Lets the player choose a stat to increase to
-        level up their character if they have sufficient runes. The formula for
-        the rune cost is taken from eldenring.wiki.fextralife.com/Level
+        level up their character if they have sufficient runes. If the runes
+        buy more than one level, the player can also choose the value to raise
+        the stat to in one go. See rune_cost() for the rune cost of each level.
         """
-        # Formula for calculating the rune cost.
-        x = ((self._player_level + 81) - 92) * 0.02
-        # Change x to 0 if the above expression results in x below 0.
-        x = max(x, 0)
-        rune_cost = int(((x + 0.1) * ((self._player_level + 81) ** 2)) + 1)
+        affordable = affordable_levels(self._player_level, self._player_runes)
 
-        if self._player_runes < rune_cost:
+        if not affordable:
             print("\nInsufficient runes to level up.")
-            print(f'Need {rune_cost} runes to level up.')
-            time.sleep(0.75)    # Allow player time to read message.
+            print(f'Need {rune_cost(self._player_level)} runes to level up.')
+            pacing.sleep(0.75)    # Allow player time to read message.
             return
 
         stats = ['Vig', 'Mnd', 'End', 'Str', 'Dex', 'Int', 'Fth', 'Arc']
         stat_to_inc = pyip.inputMenu(stats, prompt='\nSelect a stat to increase:\n',
                                      numbered=True)
-        # Increase the player's chosen stat and reduce their current runes.
-        print(f'\n{stat_to_inc} increased from {self._stats[stat_to_inc]}',
-              f'to {self._stats[stat_to_inc] + 1}\n')
-
-        self._stats[stat_to_inc] += 1
-        self._player_runes -= rune_cost
-        self._player_level += 1
-        self.update_stats()
+        current = self._stats[stat_to_inc]
+        value = current + 1
+        if affordable > 1:
+            # A blank answer buys a single level.
+            value = pyip.inputInt(prompt=f'Increase {stat_to_inc} up to (Enter for {value}, '
+                                         f'max {current + affordable}): ',
+                                  min=current + 1, max=current + affordable,
+                                  blank=True) or value
+        print(f'\n{stat_to_inc} increased from {current}',
+              f'to {value}\n')
+        self.level_up_to(stat_to_inc, value)
 
         print(f'Current runes: {self._player_runes}')
-        time.sleep(0.75)
+        pacing.sleep(0.75)
+
+    def equip(self, weapon_name, hand):
+        """equip Equip a weapon in the given hand and update the player's stats,
+        without any prompts.
+
+        Args:
+            weapon_name (str): The name of the weapon or shield.
+            hand (str): 'Right Hand' or 'Left Hand'.
+        """
+        self._equipment[hand] = weapon_name
+        self.update_stats()
 
     def change_weapon(self, weapon_data):
         """change_weapon Ask the player if they would like to change the weapon in
@@ -389,64 +723,21 @@ class Character:
         the new weapon or not.
 
         Args:
-            weapon_data (pandas.core.frame.DataFrame): DataFrame of the weapon data
-            dropped from the previous boss fight that should follow the format of:
-            Name;Type;Attack.
+            weapon_data (game_data.Weapon): The weapon dropped from the previous
+            boss fight with its name, type and attack.
         """
-        unupgraded_weapons_path = os.path.join(WEAPONS_PATH, 'unupgraded-weapons.csv')
-        upgraded_weapons_path = os.path.join(WEAPONS_PATH, 'full-upgraded-weapons.csv')
-        try:
-            weapon_name = weapon_data.iloc[0,0]
-            weapon_type = weapon_data.iloc[0,1]
-            weapon_attack = weapon_data.iloc[0,2]
-        except IndexError:
-            print('\nError: Index out of range for weapon data! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
-
-        # Get the data from the player's right hand weapon.
-        if 'MAX' in self._equipment['Right Hand']:
-            try:
-                weapons_df = pd.read_csv(upgraded_weapons_path, sep=';')
-            except FileNotFoundError:
-                print(f'\nFile {upgraded_weapons_path} not found! Exiting...')
-                time.sleep(1.5)
-                sys.exit(1)
-        else:
-            try:
-                weapons_df = pd.read_csv(unupgraded_weapons_path, sep=';')
-            except FileNotFoundError:
-                print(f'\nFile {unupgraded_weapons_path} not found! Exiting...')
-                time.sleep(1.5)
-                sys.exit(1)
-        right_hand = weapons_df[weapons_df["Name"] == self._equipment['Right Hand']]
-
-        # Get the data from the player's left hand weapon.
-        if 'MAX' in self._equipment['Left Hand']:
-            try:
-                weapons_df = pd.read_csv(upgraded_weapons_path, sep=';')
-            except FileNotFoundError:
-                print(f'\nFile {upgraded_weapons_path} not found! Exiting...')
-                time.sleep(1.5)
-                sys.exit(1)
-        else:
-            try:
-                weapons_df = pd.read_csv(unupgraded_weapons_path, sep=';')
-            except FileNotFoundError:
-                print(f'\nFile {unupgraded_weapons_path} not found! Exiting...')
-                time.sleep(1.5)
-                sys.exit(1)
-        left_hand = weapons_df[weapons_df["Name"] == self._equipment['Left Hand']]
+        weapon_name, weapon_type, weapon_attack = weapon_data
+
+        # Get the data from the player's right and left hand weapons.
+        right_hand = get_weapon(self._equipment['Right Hand'])
+        left_hand_attack = 0
+        if self._equipment['Left Hand']:
+            left_hand_attack = get_weapon(self._equipment['Left Hand']).attack
 
         # Print the player's weapon attack for each hand, the new weapon's attack
         # and ask if they would like to equip the new weapon.
-        try:
-            print(f'\nRight hand attack: {right_hand.iloc[0,2]}')
-            print(f'Left hand attack: {left_hand.iloc[0,2]}')
-        except IndexError:
-            print('\nError: Index out of range for weapon data! Exiting...')
-            time.sleep(1.5)
-            sys.exit(1)
+        print(f'\nRight hand attack: {right_hand.attack}')
+        print(f'Left hand attack: {left_hand_attack}')
         print(f'\n{weapon_name} attack: {weapon_attack}')
         print('\nWeapons increase attack while shields increase your armor.')
         response = pyip.inputYesNo(prompt='Would you like to equip the new weapon? Y/N: ')
@@ -463,22 +754,38 @@ class Character:
                 print(f'\n{weapon_name} equipped in Left Hand\n')
 
         print('Updating stats...\n')
-        time.sleep(1.5)
+        pacing.sleep(1.5)
         self.update_stats()
 
-    def grace(self):
+    def heal(self):
+        """heal Set the player's current health value to the player's maximum
+        health value.
+        """
+        # Heal the player's current health to their max health.
+        self._player_current_health = self._player_max_health
+
+    def grace(self, next_tier=None):
         """grace Give the player a set of actions to choose from and perform the
         action chosen. Once the player is done performing actions other than 'Rest',
         set the player's current health value to the player's maximum health value.
         Use to heal the player between boss fights.
+
+        Args:
+            next_tier (str, optional): The tier of the next boss, e.g. 'field'.
+            Adds the 'Recommended Build' action, which spends the player's runes
+            on the levels with the best chance of felling a boss of that tier,
+            if NumPy is installed. Defaults to None.
         """
         action = ""
+        actions = ['Show Stats', 'Level Up', 'Rest']
+        if next_tier is not None and _has_numpy():
+            actions.insert(2, 'Recommended Build')
 
         print(f'\nName: {self._player_name}')
         print(f'Current runes: {self._player_runes}')
 
         while action != 'Rest':
-            action = pyip.inputMenu(['Show Stats', 'Level Up', 'Rest'],
+            action = pyip.inputMenu(actions,
                                     prompt='\nPick an action:\n',
                                     numbered=True)
             if action == 'Show Stats':
@@ -486,14 +793,44 @@ class Character:
                 self.print_stats()
             elif action == 'Level Up':
                 self.increase_player_level()
+            elif action == 'Recommended Build':
+                self.take_recommended_build(next_tier)
 
         print('\nRest...') # Rest and prepare for the next battle.
-        # Heal the player's current health to their max health.
-        self._player_current_health = self._player_max_health
+        self.heal()
         print('Fully healed and preparing for next battle...')
-        time.sleep(0.70)
+        pacing.sleep(0.70)
         print('-' * 30)
 
+    def take_recommended_build(self, tier):
+        """take_recommended_build Level up the player with the build that gives
+        the best chance of felling a boss of the given tier, see level_solver.py,
+        and print what changed.
+
+        Args:
+            tier (str): The tier of the next boss, e.g. 'field'.
+        """
+        # The solver imports NumPy as it solves, not when it is imported, so
+        # check for it first.
+        if not _has_numpy():
+            print('\nThe recommended build needs NumPy installed.')
+            pacing.sleep(0.75)
+            return
+        import level_solver
+
+        build = level_solver.recommended_build(self, tier)
+        if not build.vig and not build.str_dex:
+            print("\nInsufficient runes to level up.")
+            print(f'Need {rune_cost(self._player_level)} runes to level up.')
+            pacing.sleep(0.75)
+            return
+
+        level_solver.apply_build(self, build)
+        print(f'\nVig +{build.vig}, Str +{build.str_dex} for {build.runes} runes')
+        print(f'Chance against a {tier} boss: {build.current:.1%} -> {build.win_probability:.1%}')
+        print(f'Current runes: {self._player_runes}')
+        pacing.sleep(0.75)
+
     def reduce_health(self, damage = 0):
         """reduce_health Reduce the player's current health value by the amount
         of the damage value passed. Sets the player's current health to 0 if the
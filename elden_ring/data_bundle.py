@@ -0,0 +1,494 @@
+"""
+data_bundle.py
+
+Listen up, brother! This module compiles the game data in the bosses/, weapons/ and classes/ directories
+into one validated binary bundle. Every file is checked before the bundle is written and the starting
+equipment of every class is cross-referenced against the weapon files, so broken data is caught before
+anyone steps into the ring instead of halfway through a boss fight.
+
+The bundle stores a SHA-256 hash of every source file along with its size and modification time. When the
+game loads the bundle, only the source files whose size or modification time changed are read and hashed,
+and the bundle is rebuilt automatically if a hash no longer matches.
+
+Run this module directly to validate the data and build the bundle:
+
+    python data_bundle.py
+
+Classes:
+    DataValidationError:
+        Raised when one or more of the game data files are invalid.
+
+Functions:
+    parse_row(name, line_number, row, header, column_types, errors) -> tuple:
+        Validates one row of a weapon or boss file and converts its whole numbers.
+
+    check_equipment(name, equipment, weapon_names, errors):
+        Checks that a class' starting weapons are in the weapon files, brother!
+
+    validate_sources(data_path) -> tuple:
+        Reads and validates every game data file and returns the data with a list of errors, brother!
+
+    build_bundle(data_path, bundle_path) -> dict:
+        Validates the game data files and writes the bundle file.
+
+    load_bundle(data_path, bundle_path) -> dict:
+        Loads the bundle file in a single read, rebuilding it first if a source file changed.
+"""
+
+import csv
+import glob
+import hashlib
+import io
+import json
+import marshal
+import os
+import sys
+import zlib
+
+
+DATA_PATH = os.path.abspath(os.path.dirname(__file__))
+BUNDLE_PATH = os.path.join(DATA_PATH, 'game-data.bundle')
+
+BUNDLE_MAGIC = b'ERGD'      # Marks the start of a game data bundle file.
+BUNDLE_VERSION = 3          # Increase when the layout of the bundle changes.
+HEADER_SIZE = len(BUNDLE_MAGIC) + 1 + hashlib.sha256().digest_size
+
+WEAPON_FILES = ['unupgraded-weapons.csv', 'full-upgraded-weapons.csv']
+BOSS_FILES = ['field-boss-list.csv', 'mini-boss-list.csv', 'main-boss-list.csv']
+WEAPON_HEADER = ['Name', 'Type', 'Attack']
+BOSS_HEADER = ['Name', 'Health', 'Runes']
+STATS = ['Vig', 'Mnd', 'End', 'Str', 'Dex', 'Int', 'Fth', 'Arc']
+EQUIPMENT_SLOTS = ['Right Hand', 'Left Hand', 'Helm', 'Torso', 'Wrists', 'Legs']
+
+
+class DataValidationError(ValueError):
+    """Raised when one or more of the game data files are invalid.
+
+    Attributes
+    ----------
+    errors: list
+        A list of messages describing each problem that was found.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('Invalid game data:\n    ' + '\n    '.join(errors))
+
+
+def source_files(data_path=DATA_PATH):
+    """source_files Return the paths of every game data file relative to the
+    data path. The weapon and boss files are required, so they are returned even
+    if they are missing.
+
+    Args:
+        data_path (str, optional): The directory holding the bosses/, weapons/
+        and classes/ directories. Defaults to DATA_PATH.
+
+    Returns:
+        list: Sorted list of relative paths.
+    """
+    files = {os.path.join('weapons', name) for name in WEAPON_FILES}
+    files.update(os.path.join('bosses', name) for name in BOSS_FILES)
+    for pattern in (os.path.join('bosses', '*.csv'), os.path.join('weapons', '*.csv'),
+                    os.path.join('classes', '*.json')):
+        files.update(os.path.relpath(path, data_path)
+                     for path in glob.glob(os.path.join(data_path, pattern)))
+    return sorted(files)
+
+
+def _read_sources(data_path):
+    """_read_sources Read every game data file and hash its contents.
+
+    Args:
+        data_path (str): The directory holding the game data directories.
+
+    Raises:
+        FileNotFoundError: If one of the required files does not exist.
+
+    Returns:
+        tuple: A dictionary of relative paths to file contents and a dictionary
+        of relative paths to SHA-256 hex digests.
+    """
+    contents = {}
+    hashes = {}
+    for name in source_files(data_path):
+        with open(os.path.join(data_path, name), 'rb') as file:
+            contents[name] = file.read()
+        hashes[name] = hashlib.sha256(contents[name]).hexdigest()
+    return contents, hashes
+
+
+def _source_stats(data_path):
+    """_source_stats Return the size and modification time of every game data
+    file, without reading them.
+
+    Args:
+        data_path (str): The directory holding the game data directories.
+
+    Raises:
+        FileNotFoundError: If one of the required files does not exist.
+
+    Returns:
+        dict: A dictionary of relative paths to (size, modification time in
+        nanoseconds) tuples.
+    """
+    stats = {}
+    for name in source_files(data_path):
+        stat = os.stat(os.path.join(data_path, name))
+        stats[name] = (stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+def _sources_changed(data, data_path):
+    """_sources_changed Check the bundled game data against the source files.
+    Only the files whose size or modification time differ from the bundle's
+    are read and hashed.
+
+    Args:
+        data (dict): The game data read from the bundle.
+        data_path (str): The directory holding the game data directories.
+
+    Raises:
+        FileNotFoundError: If one of the required files does not exist.
+
+    Returns:
+        tuple: True if the bundle must be rebuilt, and the current stats of the
+        source files if any of them changed but kept their contents, or None.
+    """
+    stats = _source_stats(data_path)
+    if set(stats) != set(data['sources']):
+        return True, None
+
+    touched = [name for name in stats if data['stats'].get(name) != stats[name]]
+    for name in touched:
+        with open(os.path.join(data_path, name), 'rb') as file:
+            if hashlib.sha256(file.read()).hexdigest() != data['sources'][name]:
+                return True, None
+    return False, stats if touched else None
+
+
+def parse_row(name, line_number, row, header, column_types, errors):
+    """parse_row Validate one row of a ';' separated game data file and
+    convert its int columns. Also used by mmap_catalog.py for data packs.
+
+    Args:
+        name (str): The path of the file, used in error messages.
+        line_number (int): The line of the row, used in error messages.
+        row (list): The fields of the row.
+        header (list): The expected header row.
+        column_types (list): The type of each column, either str or int.
+        errors (list): List to append any problems found to.
+
+    Returns:
+        tuple: The row with the int columns converted, or None if it is not
+        valid.
+    """
+    if len(row) != len(header):
+        errors.append(f'{name}:{line_number}: expected {len(header)} fields, got {len(row)}')
+        return None
+    if not row[0].strip():
+        errors.append(f'{name}:{line_number}: missing {header[0]}')
+        return None
+    try:
+        values = tuple(kind(value) for kind, value in zip(column_types, row))
+    except ValueError:
+        errors.append(f'{name}:{line_number}: non-numeric value in {row}')
+        return None
+    if any(kind is int and value < 0 for kind, value in zip(column_types, values)):
+        errors.append(f'{name}:{line_number}: negative value in {row}')
+        return None
+    return values
+
+
+def _parse_csv(name, content, header, column_types, errors):
+    """_parse_csv Parse and validate a ';' separated game data file.
+
+    Args:
+        name (str): The relative path of the file, used in error messages.
+        content (bytes): The contents of the file.
+        header (list): The expected header row.
+        column_types (list): The type of each column, either str or int.
+        errors (list): List to append any problems found to.
+
+    Returns:
+        list: List of row tuples with the int columns converted.
+    """
+    rows = []
+    reader = csv.reader(io.StringIO(content.decode('UTF-8'), newline=''), delimiter=';')
+    if next(reader, None) != header:
+        errors.append(f'{name}: header must be {";".join(header)}')
+        return rows
+
+    for line_number, row in enumerate(reader, start=2):
+        if row:
+            values = parse_row(name, line_number, row, header, column_types, errors)
+            if values is not None:
+                rows.append(values)
+
+    if not rows:
+        errors.append(f'{name}: no rows')
+    return rows
+
+
+def check_equipment(name, equipment, weapon_names, errors):
+    """check_equipment Check that the weapons of a class' starting equipment
+    exist in the weapon files. Also used by mmap_catalog.py for data packs.
+
+    Args:
+        name (str): The relative path of the class file, used in error messages.
+        equipment (dict): The class' equipment slots to item names.
+        weapon_names (set): The names of every weapon in the weapon files, or
+        any container of them.
+        errors (list): List to append any problems found to.
+    """
+    # The right hand always needs a weapon, the left hand may be empty.
+    if equipment['Right Hand'] not in weapon_names:
+        errors.append(f'{name}: Right Hand "{equipment["Right Hand"]}" '
+                      'is not in the weapon files')
+    if equipment['Left Hand'] and equipment['Left Hand'] not in weapon_names:
+        errors.append(f'{name}: Left Hand "{equipment["Left Hand"]}" '
+                      'is not in the weapon files')
+
+
+def _parse_class(name, content, weapon_names, errors):
+    """_parse_class Parse and validate a class .json file and check that its
+    weapons exist in the weapon files.
+
+    Args:
+        name (str): The relative path of the file, used in error messages.
+        content (bytes): The contents of the file.
+        weapon_names (set): The names of every weapon in the weapon files.
+        errors (list): List to append any problems found to.
+
+    Returns:
+        dict: The class data, or None if the file is not valid.
+    """
+    try:
+        class_data = json.loads(content.decode('UTF-8'))
+    except ValueError as error:
+        errors.append(f'{name}: invalid JSON ({error})')
+        return None
+    if not isinstance(class_data, dict):
+        errors.append(f'{name}: must hold a JSON object')
+        return None
+
+    found = len(errors)
+    if not isinstance(class_data.get('Level'), int):
+        errors.append(f'{name}: Level must be a whole number')
+
+    stats = class_data.get('Stats')
+    if not isinstance(stats, dict) or sorted(stats) != sorted(STATS):
+        errors.append(f'{name}: Stats must contain exactly {", ".join(STATS)}')
+    elif not all(isinstance(value, int) and value >= 0 for value in stats.values()):
+        errors.append(f'{name}: Stats values must be whole numbers')
+
+    equipment = class_data.get('Equipment')
+    if not isinstance(equipment, dict) or sorted(equipment) != sorted(EQUIPMENT_SLOTS):
+        errors.append(f'{name}: Equipment must contain exactly {", ".join(EQUIPMENT_SLOTS)}')
+    elif not all(isinstance(value, str) for value in equipment.values()):
+        errors.append(f'{name}: Equipment values must be text')
+    else:
+        check_equipment(name, equipment, weapon_names, errors)
+
+    return class_data if len(errors) == found else None
+
+
+def validate_sources(data_path=DATA_PATH):
+    """validate_sources Read and validate every game data file.
+
+    Args:
+        data_path (str, optional): The directory holding the bosses/, weapons/
+        and classes/ directories. Defaults to DATA_PATH.
+
+    Raises:
+        FileNotFoundError: If one of the required files does not exist.
+
+    Returns:
+        tuple: The game data dictionary and a list of the problems found.
+    """
+    contents, hashes = _read_sources(data_path)
+    errors = []
+    data = {'weapons': {}, 'bosses': {}, 'classes': {}, 'sources': hashes}
+
+    for name, content in contents.items():
+        directory, file_name = os.path.split(name)
+        if directory == 'weapons':
+            data['weapons'][file_name] = _parse_csv(name, content, WEAPON_HEADER,
+                                                    [str, str, int], errors)
+        elif directory == 'bosses':
+            data['bosses'][file_name] = _parse_csv(name, content, BOSS_HEADER,
+                                                   [str, int, int], errors)
+
+    weapon_names = {row[0] for rows in data['weapons'].values() for row in rows}
+    for name, content in contents.items():
+        directory, file_name = os.path.split(name)
+        if directory == 'classes':
+            class_data = _parse_class(name, content, weapon_names, errors)
+            if class_data is not None:
+                data['classes'][os.path.splitext(file_name)[0]] = class_data
+
+    return data, errors
+
+
+def _write_bundle(data, bundle_path):
+    """_write_bundle Write the game data to the bundle file. The bundle is a
+    short header holding the SHA-256 hash of the body, followed by the
+    compressed game data.
+
+    Args:
+        data (dict): The validated game data.
+        bundle_path (str): Path of the bundle file to write.
+
+    Raises:
+        OSError: If the bundle file cannot be written.
+    """
+    # The game data is only dicts, lists, tuples, text and numbers, so
+    # marshal stores it without pickle's ability to run code on load.
+    body = zlib.compress(marshal.dumps(data))
+    header = BUNDLE_MAGIC + bytes([BUNDLE_VERSION]) + hashlib.sha256(body).digest()
+
+    # Write to a temporary file first so a half written bundle is never read.
+    temp_path = f'{bundle_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(header + body)
+        os.replace(temp_path, bundle_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def build_bundle(data_path=DATA_PATH, bundle_path=BUNDLE_PATH):
+    """build_bundle Validate the game data files and write them to the bundle
+    file, see _write_bundle().
+
+    Args:
+        data_path (str, optional): The directory holding the bosses/, weapons/
+        and classes/ directories. Defaults to DATA_PATH.
+        bundle_path (str, optional): Path of the bundle file to write, or None
+        to skip writing it. Defaults to BUNDLE_PATH. If the bundle file
+        cannot be written, e.g. from a read-only install, the game still runs
+        from the validated data.
+
+    Raises:
+        FileNotFoundError: If one of the required files does not exist.
+        DataValidationError: If any of the game data files are invalid.
+
+    Returns:
+        dict: The validated game data.
+    """
+    # Taken before the files are read, so a file changed while the bundle is
+    # built is hashed again on the next load.
+    stats = _source_stats(data_path)
+    data, errors = validate_sources(data_path)
+    if errors:
+        raise DataValidationError(errors)
+    data['stats'] = stats
+
+    if bundle_path is not None:
+        try:
+            _write_bundle(data, bundle_path)
+        except OSError:
+            pass
+    return data
+
+
+def read_bundle(bundle_path=BUNDLE_PATH):
+    """read_bundle Read the bundle file in a single read and check its header
+    and content hash.
+
+    Args:
+        bundle_path (str, optional): Path of the bundle file to read.
+        Defaults to BUNDLE_PATH.
+
+    Returns:
+        dict: The game data, or None if the bundle is missing or damaged.
+    """
+    try:
+        with open(bundle_path, 'rb') as file:
+            raw = file.read()
+    except OSError:
+        return None
+
+    if len(raw) < HEADER_SIZE:
+        return None
+    header, body = raw[:HEADER_SIZE], raw[HEADER_SIZE:]
+    if (header[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC
+            or header[len(BUNDLE_MAGIC)] != BUNDLE_VERSION
+            or header[len(BUNDLE_MAGIC) + 1:] != hashlib.sha256(body).digest()):
+        return None
+    try:
+        data = marshal.loads(zlib.decompress(body))
+    except (ValueError, EOFError, TypeError, zlib.error):
+        # Written by another Python version's marshal format.
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def load_bundle(data_path=DATA_PATH, bundle_path=BUNDLE_PATH):
+    """load_bundle Load the game data from the bundle file. The source files
+    are only read if their size or modification time changed since the bundle
+    was built. The bundle is rebuilt first if it is missing, damaged, or the
+    hash of any of those files no longer matches the hash stored in the bundle.
+
+    Args:
+        data_path (str, optional): The directory holding the bosses/, weapons/
+        and classes/ directories. Defaults to DATA_PATH.
+        bundle_path (str, optional): Path of the bundle file.
+        Defaults to BUNDLE_PATH.
+
+    Raises:
+        FileNotFoundError: If one of the required files does not exist.
+        DataValidationError: If the bundle has to be rebuilt and any of the game
+        data files are invalid.
+
+    Returns:
+        dict: The validated game data.
+    """
+    data = read_bundle(bundle_path)
+    if data is not None:
+        rebuild, stats = _sources_changed(data, data_path)
+        if not rebuild:
+            if stats is not None:
+                # Only touched, so keep the new times to skip hashing next time.
+                data['stats'] = stats
+                try:
+                    _write_bundle(data, bundle_path)
+                except OSError:
+                    pass
+            return data
+    return build_bundle(data_path, bundle_path)
+
+
+def main():
+    """main Validate the game data files and build the bundle, printing any
+    problems that were found.
+    """
+    try:
+        data = build_bundle(bundle_path=None)
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        sys.exit(1)
+    except DataValidationError as error:
+        print(f'\n{error}')
+        sys.exit(1)
+
+    # Written here rather than by build_bundle(), which ignores write errors,
+    # so the message below is only printed if the bundle really was written.
+    try:
+        _write_bundle(data, BUNDLE_PATH)
+    except OSError as error:
+        print(f'\nThe data is valid, but the bundle could not be written to '
+              f'{BUNDLE_PATH} ({error.strerror}). Exiting...')
+        sys.exit(1)
+
+    print(f'Validated {len(data["sources"])} files: '
+          f'{sum(len(rows) for rows in data["weapons"].values())} weapons, '
+          f'{sum(len(rows) for rows in data["bosses"].values())} bosses, '
+          f'{len(data["classes"])} classes.')
+    print(f'Bundle written to {BUNDLE_PATH}')
+
+
+if __name__ == "__main__":
+    main()
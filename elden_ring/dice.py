@@ -0,0 +1,511 @@
+"""
+dice.py
+
+Listen up, brother! This module is the one place the Elden Ring CLI game gets its random numbers from.
+battles.py, boss.py and character.py all roll their d20 and d10 dice through here, and the boss and weapon
+picks use it too, so a whole session can be switched to a faster or a reproducible random number generator
+in one call.
+
+Backends:
+    system:
+        Uses the operating system's entropy source through secrets.SystemRandom. This is the default.
+
+    fast:
+        Uses Python's Mersenne Twister PRNG seeded from the operating system once.
+
+    seeded:
+        Uses Python's Mersenne Twister PRNG with a fixed seed, so a session can be replayed exactly.
+
+    vectorized:
+        Draws the dice in large NumPy blocks and hands them out from a cursor. Needs NumPy installed
+        and takes an optional seed.
+
+    fair-play:
+        Uses the operating system's entropy source like 'system', but reads it in large chunks into an
+        entropy pool and turns the bytes into unbiased dice with rejection sampling. Meant for
+        tournaments that need cryptographic quality rolls.
+
+The backend can also be chosen before the game starts with the ELDEN_RING_DICE and ELDEN_RING_SEED
+environment variables, e.g. ELDEN_RING_DICE=seeded ELDEN_RING_SEED=42 python elden_ring.py
+A value that cannot be used prints a warning and falls back to the 'system' backend.
+
+Classes:
+    RandomBackend:
+        A dice backend built on a random.Random compatible generator.
+
+    DiceStream:
+        A dice backend that draws the dice in large NumPy blocks, with vectorized advantage and
+        disadvantage.
+
+    EntropyPool:
+        A dice backend that rolls unbiased dice from a buffer of operating system entropy.
+
+Functions:
+    set_backend(backend='system', seed=None):
+        Switches every dice roll to the given backend, brother!
+
+    get_backend() -> str:
+        Returns the name of the current backend.
+
+    get_seed() -> int:
+        Returns the seed of the current backend, if it has one.
+
+    randbelow(n) -> int:
+        Returns a random number from 0 to n - 1 (inclusive).
+
+    roll_d20(advantage=False, disadvantage=False) -> int:
+        Generates a random number between 1 and 20, with optional advantage or disadvantage, brother!
+
+    roll_d10() -> int:
+        Generates a random number between 1 and 10 (inclusive), brother!
+"""
+
+import os
+import random
+import secrets
+import sys
+import weakref
+
+
+BACKENDS = ['system', 'fast', 'seeded', 'vectorized', 'fair-play']
+BLOCK_SIZE = 1000000     # Number of dice drawn at a time by DiceStream.
+POOL_SIZE = 65536        # Number of bytes read from the OS at a time by EntropyPool.
+DICE_ENV = 'ELDEN_RING_DICE'
+SEED_ENV = 'ELDEN_RING_SEED'
+
+
+class RandomBackend:
+    """A class used to roll dice with a random.Random compatible generator.
+
+    Attributes
+    ----------
+    name: str
+        The name of the backend.
+    seed: int
+        The seed of the generator, or None if it was seeded by the OS.
+    rng: random.Random
+        The generator used for the rolls.
+
+    Methods
+    -------
+    roll(sides)
+        Returns a random number from 1 to sides (inclusive).
+    roll_d20(advantage=False, disadvantage=False)
+        Returns a d20 roll with optional advantage or disadvantage.
+    randbelow(n)
+        Returns a random number from 0 to n - 1 (inclusive).
+    """
+
+    def __init__(self, name, rng, seed=None):
+        self.name = name
+        self.seed = seed
+        self.rng = rng
+
+        if isinstance(rng, random.SystemRandom):
+            # Keep the exact integer sampling of randrange for the OS entropy
+            # source, it reads the same number of bytes either way.
+            self.roll = lambda sides: rng.randrange(1, sides + 1)
+        else:
+            # Scaling a 53-bit float is several times faster than randrange
+            # and its bias is far below anything a game could notice.
+            rand = rng.random
+            self.roll = lambda sides: int(rand() * sides) + 1
+
+    def roll_d20(self, advantage=False, disadvantage=False):
+        """roll_d20 Return a d20 roll, the higher of two rolls with advantage
+        or the lower of two rolls with disadvantage.
+        """
+        if advantage:
+            return max(self.roll(20), self.roll(20))
+
+        if disadvantage:
+            return min(self.roll(20), self.roll(20))
+
+        return self.roll(20)
+
+    def randbelow(self, n):
+        """randbelow Return a random number from 0 to n - 1 (inclusive).
+
+        Args:
+            n (int): The number of possible results.
+
+        Returns:
+            int: The random number.
+        """
+        return self.rng.randrange(n)
+
+
+class DiceStream:
+    """A class used to roll dice from large blocks drawn with NumPy. Each
+    kind of roll has its own block, handed out one die at a time from a cursor
+    and drawn again once it runs out. Advantage and disadvantage blocks are the
+    element-wise max and min of two d20 blocks.
+
+    Attributes
+    ----------
+    name: str
+        The name of the backend.
+    seed: int
+        The seed of the generator, or None if it was seeded by the OS.
+    block_size: int
+        The number of dice drawn at a time.
+    _generator: numpy.random.Generator
+        The generator used to draw the blocks.
+    _streams: dict
+        A dictionary of roll kinds to the cursor over their current block.
+
+    Methods
+    -------
+    roll(sides)
+        Returns a random number from 1 to sides (inclusive).
+    roll_d20(advantage=False, disadvantage=False)
+        Returns a d20 roll with optional advantage or disadvantage.
+    rolls(sides, count, advantage=False, disadvantage=False)
+        Returns a NumPy array of count rolls.
+    randbelow(n)
+        Returns a random number from 0 to n - 1 (inclusive).
+    """
+
+    def __init__(self, seed=None, block_size=BLOCK_SIZE):
+        # NumPy is only needed for this backend, so it is imported here to
+        # keep it off the interactive startup path.
+        import numpy as np
+
+        self.name = 'vectorized'
+        self.seed = seed
+        self.block_size = block_size
+        self._np = np
+        self._generator = np.random.default_rng(seed)
+        self._streams = {}
+
+    def _draw(self, kind):
+        """_draw Draw a new block for the given kind of roll and return a
+        cursor over it. kind is the number of sides, 'advantage' or
+        'disadvantage'.
+        """
+        integers = self._generator.integers
+        if kind in ('advantage', 'disadvantage'):
+            first = integers(1, 21, size=self.block_size)
+            second = integers(1, 21, size=self.block_size)
+            if kind == 'advantage':
+                block = self._np.maximum(first, second)
+            else:
+                block = self._np.minimum(first, second)
+        else:
+            block = integers(1, kind + 1, size=self.block_size)
+        # Python ints are much faster to hand out one at a time than NumPy scalars.
+        self._streams[kind] = iter(block.tolist())
+        return self._streams[kind]
+
+    def roll(self, sides):
+        """roll Return a random number from 1 to sides (inclusive).
+
+        Args:
+            sides (int): The number of sides of the die.
+
+        Returns:
+            int: The roll.
+        """
+        stream = self._streams.get(sides)
+        if stream is not None:
+            for value in stream:
+                return value
+        return next(self._draw(sides))
+
+    def roll_d20(self, advantage=False, disadvantage=False):
+        """roll_d20 Return a d20 roll, the higher of two rolls with advantage
+        or the lower of two rolls with disadvantage.
+        """
+        if advantage:
+            return self.roll('advantage')
+
+        if disadvantage:
+            return self.roll('disadvantage')
+
+        return self.roll(20)
+
+    def rolls(self, sides, count, advantage=False, disadvantage=False):
+        """rolls Return count rolls at once as a NumPy array, for simulations
+        that work on whole arrays of dice.
+
+        Args:
+            sides (int): The number of sides of the die.
+            count (int): The number of rolls.
+            advantage (bool, optional): Determines if each roll is the greater
+            of two rolls. Defaults to False.
+            disadvantage (bool, optional): Determines if each roll is the less
+            of two rolls. Defaults to False.
+
+        Returns:
+            numpy.ndarray: The rolls.
+        """
+        integers = self._generator.integers
+        if advantage or disadvantage:
+            first = integers(1, sides + 1, size=count)
+            second = integers(1, sides + 1, size=count)
+            if advantage:
+                return self._np.maximum(first, second)
+            return self._np.minimum(first, second)
+        return integers(1, sides + 1, size=count)
+
+    def randbelow(self, n):
+        """randbelow Return a random number from 0 to n - 1 (inclusive).
+
+        Args:
+            n (int): The number of possible results.
+
+        Returns:
+            int: The random number.
+        """
+        return int(self._generator.integers(n))
+
+
+_pools = weakref.WeakSet()    # Every EntropyPool, so a forked process can empty them.
+
+
+def _discard_pools():
+    """_discard_pools Empty every entropy pool. A forked process must never
+    reuse its parent's bytes, or both processes would roll the same dice.
+    """
+    for pool in list(_pools):
+        pool._discard()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_discard_pools)
+
+
+class EntropyPool:
+    """A class used to roll dice from a pool of operating system entropy. The
+    pool is refilled with one os.urandom() call per POOL_SIZE bytes instead of
+    one call per roll. Each byte is only used once, and bytes that would make
+    some faces more likely than others are thrown away (rejection sampling),
+    so every roll is as fair and unpredictable as secrets.SystemRandom.
+
+    Attributes
+    ----------
+    name: str
+        The name of the backend.
+    seed: None
+        The pool is never seeded.
+    pool_size: int
+        The number of bytes read from the OS at a time.
+    _bytes: iterator
+        The cursor over the unused bytes of the pool.
+
+    Methods
+    -------
+    roll(sides)
+        Returns a random number from 1 to sides (inclusive).
+    roll_d20(advantage=False, disadvantage=False)
+        Returns a d20 roll with optional advantage or disadvantage.
+    randbelow(n)
+        Returns a random number from 0 to n - 1 (inclusive).
+    """
+
+    def __init__(self, pool_size=POOL_SIZE):
+        self.name = 'fair-play'
+        self.seed = None
+        self.pool_size = pool_size
+        self._bytes = iter(b'')
+        _pools.add(self)
+
+    def _discard(self):
+        """_discard Throw away the unused bytes of the pool.
+        """
+        self._bytes = iter(b'')
+
+    def _refill(self):
+        """_refill Read a new chunk of entropy from the OS and return a cursor
+        over it.
+        """
+        self._bytes = iter(os.urandom(self.pool_size))
+        return self._bytes
+
+    def roll(self, sides):
+        """roll Return a random number from 1 to sides (inclusive).
+
+        Args:
+            sides (int): The number of sides of the die.
+
+        Returns:
+            int: The roll.
+        """
+        return self.randbelow(sides) + 1
+
+    def roll_d20(self, advantage=False, disadvantage=False):
+        """roll_d20 Return a d20 roll, the higher of two rolls with advantage
+        or the lower of two rolls with disadvantage.
+        """
+        if advantage:
+            return max(self.roll(20), self.roll(20))
+
+        if disadvantage:
+            return min(self.roll(20), self.roll(20))
+
+        return self.roll(20)
+
+    def randbelow(self, n):
+        """randbelow Return a random number from 0 to n - 1 (inclusive).
+
+        Args:
+            n (int): The number of possible results.
+
+        Returns:
+            int: The random number.
+        """
+        if n <= 256:
+            # Only accept bytes below the largest multiple of n, e.g. 0-239
+            # for a d20, so each result covers the same number of bytes.
+            limit = 256 - 256 % n
+            while True:
+                for byte in self._bytes:
+                    if byte < limit:
+                        return byte % n
+                self._refill()
+
+        # Larger ranges, like a weapon pick from a long list, are only used
+        # once per fight, so they go straight to the OS.
+        return secrets.randbelow(n)
+
+
+def _make_backend(backend, seed=None):
+    """_make_backend Create the dice backend with the given name.
+
+    Args:
+        backend (str): The name of the backend.
+        seed (int, optional): The seed for the 'seeded' or 'vectorized'
+        backend. The 'seeded' backend picks a random seed if None.
+        Defaults to None.
+
+    Raises:
+        ValueError: If the backend is not known.
+        ImportError: If the 'vectorized' backend is asked for without NumPy.
+
+    Returns:
+        RandomBackend, DiceStream or EntropyPool: The new backend.
+    """
+    if backend == 'system':
+        return RandomBackend(backend, secrets.SystemRandom())
+    if backend == 'fast':
+        return RandomBackend(backend, random.Random())
+    if backend == 'seeded':
+        if seed is None:
+            seed = secrets.randbits(64)
+        return RandomBackend(backend, random.Random(seed), seed)
+    if backend == 'vectorized':
+        return DiceStream(seed)
+    if backend == 'fair-play':
+        return EntropyPool()
+    raise ValueError(f'Unknown dice backend: {backend}. Choose from {", ".join(BACKENDS)}.')
+
+
+def _backend_from_environment():
+    """_backend_from_environment Create the backend named by the
+    ELDEN_RING_DICE and ELDEN_RING_SEED environment variables, falling back
+    to the 'system' backend. A warning naming the bad value is printed if
+    either variable cannot be used, so a session meant to be replayed never
+    runs unseeded without notice.
+    """
+    seed = os.environ.get(SEED_ENV)
+    backend = os.environ.get(DICE_ENV, 'seeded' if seed else 'system')
+    try:
+        seed = int(seed) if seed else None
+    except ValueError:
+        print(f'Warning: {SEED_ENV}={seed} is not a whole number, '
+              "using the unseeded 'system' dice instead.", file=sys.stderr)
+        return _make_backend('system')
+    try:
+        return _make_backend(backend, seed)
+    except (ValueError, ImportError) as error:
+        print(f'Warning: {DICE_ENV}={backend} cannot be used ({error}), '
+              "using the unseeded 'system' dice instead.", file=sys.stderr)
+        return _make_backend('system')
+
+
+_backend = _backend_from_environment()    # The backend used for every roll.
+
+
+def set_backend(backend='system', seed=None):
+    """set_backend Switch every dice roll and random pick in the game to the
+    given backend.
+
+    Args:
+        backend (str, optional): 'system', 'fast', 'seeded', 'vectorized' or
+        'fair-play'. Defaults to 'system'.
+        seed (int, optional): The seed for the 'seeded' or 'vectorized' backend,
+        ignored by the others. The 'seeded' backend picks a random seed if
+        None, see get_seed().
+        Defaults to None.
+
+    Raises:
+        ValueError: If the backend is not known.
+        ImportError: If the 'vectorized' backend is asked for without NumPy.
+    """
+    global _backend
+
+    _backend = _make_backend(backend, seed)
+
+
+def get_backend():
+    """get_backend Return the name of the current backend.
+
+    Returns:
+        str: The name of the backend.
+    """
+    return _backend.name
+
+
+def get_seed():
+    """get_seed Return the seed of the current backend so a seeded session can
+    be replayed.
+
+    Returns:
+        int: The seed, or None if the backend is not seeded.
+    """
+    return _backend.seed
+
+
+def randbelow(n):
+    """randbelow Return a random number from 0 to n - 1 (inclusive). Used to
+    pick a random row from the boss and weapon lists.
+
+    Args:
+        n (int): The number of possible results.
+
+    Returns:
+        int: The random number.
+    """
+    return _backend.randbelow(n)
+
+
+def roll_d20(advantage=False, disadvantage=False):
+    """roll_d20 Generate a random number in the range 1-20 (inclusive) and
+    return it. If the roller has advantage, then generate two numbers and return
+    the higher number. If the roller has disadvantage, then generate two numbers
+    and return the lower number.
+
+    Args:
+        advantage (bool, optional): Determines if the greater of two numbers
+        should be returned. Defaults to False.
+        disadvantage (bool, optional): Determines if the less of two numbers
+        should be returned. Defaults to False.
+
+    Returns:
+        int: The number to determine if the player/boss successfully land an
+        attack.
+    """
+    return _backend.roll_d20(advantage, disadvantage)
+
+
+def roll_d10():
+    """roll_d10 Generates a random number from 1-10 (inclusive).
+
+    Returns:
+        int: Returns a number from 1-10 (inclusive).
+    """
+    return _backend.roll(10)
+
+
+if __name__ == "__main__":
+    print("This module is to be imported by elden_ring.py.")
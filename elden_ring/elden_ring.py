@@ -14,6 +14,10 @@ character including Right Hand, Left Hand, Helm, Torso, Wrists, and Legs.
 Get ready to step into the ring and show those bosses what you're made of, brother!
 
 Functions:
+    play_game(num_of_players):
+        Function for a game with any number of players. Includes the tutorial boss fight as well as a
+        single field, mini, and main boss fight. The program exits early if the host reaches 0 hp.
+
     single_player_game():
         Function for a single player version of the program. Includes the tutorial boss fight as well as
         a single field, mini, and main boss fight.
@@ -28,13 +32,27 @@ Functions:
         a single field, mini, and main boss fight. This version will exit the program early if the host
         object reaches 0 hp.
 
-    main():
+    parse_arguments(argv=None) -> argparse.Namespace:
+        Reads the command line options, brother!
+
+    run_simulation(arguments):
+        Runs headless campaigns in batch mode with campaign.py and prints a summary.
+
+    main(argv=None):
         Main function to call when running the program. This will get the number of players and run the
-        appropriate game mode based on the number of players joining the fight(s).
+        appropriate game mode based on the number of players joining the fight(s), or run the batch mode
+        if --simulate is given.
+
+Batch mode plays whole campaigns without any prompts across a pool of processes and writes the results
+to a ';' separated file, e.g.
+
+    python elden_ring.py --simulate 1000000 --players 3 --jobs 8
+
+The game pauses between its messages through pacing.py, run it with --turbo to skip every pause.
 """
 
+import argparse
 import sys
-import time
 
 try:
     import pyinputplus as pyip
@@ -45,38 +63,56 @@ try:
     import character
     import boss
     import battles
+    import game_data
+    import data_bundle
+    import pacing
 except ImportError:
     print("\nPlease ensure the following modules are available:\n\
         - character.py\n\
         - boss.py\n\
-        - battles.py")
+        - battles.py\n\
+        - game_data.py\n\
+        - data_bundle.py\n\
+        - pacing.py")
     sys.exit(1)
 
 
 PLAYER_REST_TIME = 2.5              # Amount of time to wait for players to rest.
+MAX_PLAYERS = 3                     # The host and up to 2 summons.
 
-def single_player_game():
-    """single_player_game Function for a single player version of the program.
-    Includes the tutorial boss fight as well as a single field, mini and main
-    boss fight.
+def play_game(num_of_players):
+    """play_game Function for a game with any number of players, the host
+    first and the rest as summons. Includes the tutorial boss fight as well as
+    a single field, mini and main boss fight. The program exits early if the
+    host reaches 0 hp.
+
+    Args:
+        num_of_players (int): The number of players, at least 1.
     """
-    player_one = character.Character() # Create the player object.
-    boss_one = boss.Boss()             # Create the boss object.
-    player_one.print_stats() # Display the player's stats.
+    # Create the player objects, the host first.
+    players = [character.Character() for _ in range(num_of_players)]
+    boss_one = boss.Boss()    # Create the boss object.
 
-    battles.tutorial_boss_fight(player_one, boss_one) # Begin the tutorial boss fight.
-    player_one.grace()   # Rest and heal the player.
-    time.sleep(PLAYER_REST_TIME)
+    for number, player in enumerate(players):
+        if number:
+            print()
+        player.print_stats()    # Display each player's stats.
 
-    battles.field_boss_fight(player_one, boss_one)    # Begin the field boss fight.
-    player_one.grace()
-    time.sleep(PLAYER_REST_TIME)
+    for number, tier in enumerate(battles.BOSS_TIERS):
+        battles.boss_fight(players, boss_one, tier)     # Begin the boss fight.
+        if tier == 'main':
+            break
+        for player in players:  # Rest and heal each of the players
+            player.grace(battles.BOSS_TIERS[number + 1])
+        pacing.sleep(PLAYER_REST_TIME)
 
-    battles.mini_boss_fight(player_one, boss_one) # Begin the mini boss fight.
-    player_one.grace()
-    time.sleep(PLAYER_REST_TIME)
 
-    battles.main_boss_fight(player_one, boss_one) # Begin the main boss fight.
+def single_player_game():
+    """single_player_game Function for a single player version of the program.
+    Includes the tutorial boss fight as well as a single field, mini and main
+    boss fight.
+    """
+    play_game(1)
 
 
 def two_player_game():
@@ -85,35 +121,7 @@ def two_player_game():
     boss fight. This version will exit the program early if the host object
     reaches 0 hp.
     """
-    host = character.Character()          # Create the host object.
-    summon_one = character.Character()     # Create the first summon object.
-    players = [host, summon_one] # Create the player list.
-    boss_one = boss.Boss()    # Create the boss object.
-
-    host.print_stats()          # Display the host's stats.
-    print()
-    summon_one.print_stats()     # Display the first summon's stats.
-
-    # Begin the tutorial boss fight.
-    battles.two_player_tutorial_boss_fight(players, boss_one)
-    for player in players:  # Rest and heal each of the players
-        player.grace()
-    time.sleep(PLAYER_REST_TIME)
-
-    # Begin the field boss fight.
-    battles.two_player_field_boss_fight(players, boss_one)
-    for player in players:  # Rest and heal each of the players
-        player.grace()
-    time.sleep(PLAYER_REST_TIME)
-
-    # Begin the mini boss fight.
-    battles.two_player_mini_boss_fight(players, boss_one)
-    for player in players:  # Rest and heal each of the players
-        player.grace()
-    time.sleep(PLAYER_REST_TIME)
-
-    # Begin the main boss fight.
-    battles.two_player_main_boss_fight(players, boss_one)
+    play_game(2)
 
 
 def three_player_game():
@@ -122,57 +130,114 @@ def three_player_game():
     boss fight. This version will exit the program early if the host object
     reaches 0 hp.
     """
-    host = character.Character()            # Create the host object.
-    summon_one = character.Character()       # Create the first summon object.
-    summon_two = character.Character()       # Create the second summon object.
-    players = [host, summon_one, summon_two]  # Create the player list.
-    boss_one = boss.Boss()    # Create the boss object.
-
-    host.print_stats()          # Display the host's stats.
-    print()
-    summon_one.print_stats()     # Display the first summon's stats.
-    print()
-    summon_two.print_stats()     # Display the second summon's stats.
-
-    # Begin the tutorial boss fight.
-    battles.three_player_tutorial_boss_fight(players, boss_one)
-    for player in players:  # Rest and heal each of the players
-        player.grace()
-    time.sleep(PLAYER_REST_TIME)
+    play_game(3)
 
-    # Begin the field boss fight.
-    battles.three_player_field_boss_fight(players, boss_one)
-    for player in players:  # Rest and heal each of the players
-        player.grace()
-    time.sleep(PLAYER_REST_TIME)
 
-    # Begin the mini boss fight.
-    battles.three_player_mini_boss_fight(players, boss_one)
-    for player in players:  # Rest and heal each of the players
-        player.grace()
-    time.sleep(PLAYER_REST_TIME)
+def parse_arguments(argv=None):
+    """parse_arguments Read the command line options. Without any options the
+    interactive game is played.
 
-    # Begin the main boss fight.
-    battles.three_player_main_boss_fight(players, boss_one)
+    Args:
+        argv (list, optional): The command line options. Uses sys.argv if None.
+        Defaults to None.
 
+    Returns:
+        argparse.Namespace: The options.
+    """
+    parser = argparse.ArgumentParser(
+        description='Face off against the bosses of Elden Ring, brother!')
+    parser.add_argument('--simulate', type=int, metavar='CAMPAIGNS',
+                        help='run this many headless campaigns instead of the game')
+    parser.add_argument('--players', type=int, default=1, choices=[1, 2, 3],
+                        help='number of players in every simulated party (default: 1)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='number of worker processes (default: every CPU)')
+    parser.add_argument('--classes', nargs='+', choices=character.CLASSES, metavar='CLASS',
+                        help='class of every simulated player (default: random classes)')
+    parser.add_argument('--level-up', default='balanced',
+                        choices=['balanced', 'vigor', 'strength', 'none'],
+                        help='how simulated players spend their runes (default: balanced)')
+    parser.add_argument('--weapons', default='best', choices=['best', 'keep'],
+                        help='whether simulated players equip better drops (default: best)')
+    parser.add_argument('--seed', type=int, help='seed of the simulation')
+    parser.add_argument('--output', default='campaigns.csv',
+                        help='file to write the campaign results to (default: campaigns.csv)')
+    parser.add_argument('--turbo', action='store_true',
+                        help='play without any pauses between the messages')
+    arguments = parser.parse_args(argv)
+
+    if arguments.simulate is not None and arguments.simulate < 1:
+        parser.error('--simulate needs at least 1 campaign')
+    if arguments.jobs is not None and arguments.jobs < 1:
+        parser.error('--jobs needs at least 1 worker process')
+    if arguments.classes and len(arguments.classes) != arguments.players:
+        parser.error('--classes needs one class for every player')
+    return arguments
+
+
+def run_simulation(arguments):
+    """run_simulation Run headless campaigns in batch mode with campaign.py and
+    print a summary once they are done.
+
+    Args:
+        arguments (argparse.Namespace): The command line options.
+    """
+    # The batch mode is only loaded when it is asked for, so the game itself
+    # starts without the multiprocessing machinery.
+    import campaign
 
-def main():
+    try:
+        summary = campaign.simulate(arguments.simulate, players=arguments.players,
+                                    jobs=arguments.jobs, output=arguments.output,
+                                    level_up=arguments.level_up, weapons=arguments.weapons,
+                                    classes=arguments.classes, seed=arguments.seed)
+    except OSError as error:
+        print(f'\nCould not write {error.filename or arguments.output} '
+              f'({error.strerror})! Exiting...')
+        sys.exit(1)
+    print(f'{summary["cleared"]} of {summary["campaigns"]} campaigns cleared '
+          f'({summary["cleared"] / summary["campaigns"]:.2%}) in {summary["seconds"]:.1f}s '
+          f'with seed {summary["seed"]}.')
+    print(f'Results written to {arguments.output}')
+
+
+def main(argv=None):
     """main Main function to call when running the program. This will get the
     number of players and run the appropriate game mode based on the number
-    of players joining the fight(s).
+    of players joining the fight(s), or run the batch mode if --simulate is
+    given.
+
+    Args:
+        argv (list, optional): The command line options. Uses sys.argv if None.
+        Defaults to None.
     """
+    arguments = parse_arguments(argv)
+    if arguments.turbo:
+        pacing.set_mode('turbo')
+
+    # Load the game data bundle up front so broken data files are reported
+    # before the game starts instead of in the middle of a fight.
+    try:
+        game_data.load_game_data()
+        game_data.get_boss_params()
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        sys.exit(1)
+    except data_bundle.DataValidationError as error:
+        print(f'\n{error}\nExiting...')
+        sys.exit(1)
+
+    if arguments.simulate is not None:
+        run_simulation(arguments)
+        return
+
     # Get the number of players for the game. There can be a minimum
-    # of 1 player (the host) and a maximum of 3 players (2 summons).
-    num_of_players = pyip.inputInt(prompt="Enter the number of players. Max 3: ",
-                                   min=1, max=3)
-
-    # Start the correct game based on the number of players.
-    if num_of_players == 1:
-        single_player_game()
-    elif num_of_players == 2:
-        two_player_game()
-    else:
-        three_player_game()
+    # of 1 player (the host) and a maximum of MAX_PLAYERS players.
+    num_of_players = pyip.inputInt(prompt=f"Enter the number of players. Max {MAX_PLAYERS}: ",
+                                   min=1, max=MAX_PLAYERS)
+
+    # Start the game with the number of players.
+    play_game(num_of_players)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,308 @@
+"""
+exact_solver.py
+
+Listen up, brother! This module computes the exact chance of winning a boss fight and its expected number
+of rounds, with no dice rolled at all. A fight is a finite Markov chain: every attack is a d20 against
+armor and a d10 scaled by attack, so from any health the next health can only be one of a handful of
+values, each with a known chance. The solver follows the same rules and turn order as fight_engine.py
+and battles.py, Host -> Boss -> Summon -> Boss -> ..., for a solo fight or a party of any size.
+
+Instead of walking every (host health, summon health, ..., boss health) state, which gets far too big
+for a party against a main boss, the solver uses the fact that each player's health only changes when
+the boss hits back at that player, and the boss' health only changes by the sum of the damage dealt to
+it. So it keeps one distribution over health states per player and one over the damage dealt to the
+boss, moves them forward a round at a time, and adds up the chance of the boss falling before the host
+every round. Rounds are added until the chance of the fight still going is below a tolerance, so the
+results are exact up to that tolerance.
+
+NumPy is only needed for this module, it is never imported by the game itself.
+
+Classes:
+    Solution:
+        A named tuple holding the win probability and the expected rounds of a fight.
+
+Functions:
+    damage_distribution(attack, armor) -> tuple:
+        Returns every damage an attack can do and the chance of each, brother!
+
+    solve_fight(players, boss, tolerance=1e-12) -> Solution:
+        Solves a fight between a party and a boss exactly, brother!
+
+    solve(player_objs, boss_obj, tolerance=1e-12) -> Solution:
+        Solves a fight between characters and a boss at their current health.
+
+    solve_healths(player, boss_attack, boss_armor, healths, tolerance=1e-12) -> list:
+        Solves a solo fight against bosses of every given health at once, brother!
+"""
+
+from collections import Counter, namedtuple
+import fight_engine
+
+
+TOLERANCE = 1e-12   # Chance of the fight still going at which the solver stops.
+
+# win_probability: the chance the boss is felled before the host falls.
+# expected_rounds: the expected number of rounds, counted the same as
+# fight_engine.FightResult.rounds.
+Solution = namedtuple('Solution', ['win_probability', 'expected_rounds'])
+
+
+def damage_distribution(attack, armor):
+    """damage_distribution Return every damage an attack can do and the chance
+    of each, from the damage table in fight_engine.py. A miss is 0 damage.
+
+    Args:
+        attack (int): The attacker's attack rating.
+        armor (int): The target's armor.
+
+    Returns:
+        tuple: A tuple of (damage, chance) pairs, sorted by damage.
+    """
+    counts = Counter(fight_engine.damage_table(attack, armor))
+    return tuple((damage, count / fight_engine.OUTCOMES)
+                 for damage, count in sorted(counts.items()))
+
+
+def _deal(dealt, damages, cap):
+    """_deal Return the distribution of the damage dealt to the boss after one
+    more attack. The last slot holds every total of cap and up, so the boss'
+    health is gone.
+    """
+    import numpy as np
+
+    moved = np.zeros_like(dealt)
+    for damage, chance in damages:
+        if damage >= cap:
+            moved[cap] += chance * dealt.sum()
+            continue
+        moved[damage:cap] += chance * dealt[:cap - damage]
+        moved[cap] += chance * dealt[cap - damage:].sum()
+    return moved
+
+
+def _take(taken, damages):
+    """_take Return the distribution of the damage taken by a player that is
+    still alive after one more boss attack. The damage that fells the player
+    is dropped, so the sum is the chance of the player still standing.
+    """
+    import numpy as np
+
+    moved = np.zeros_like(taken)
+    health = taken.size
+    for damage, chance in damages:
+        if damage < health:
+            moved[damage:] += chance * taken[:health - damage]
+    return moved
+
+
+def _combine(first, second, cap):
+    """_combine Return the distribution of the sum of two independent damage
+    totals, capped the same as _deal().
+    """
+    import numpy as np
+
+    size = 1 << (2 * cap + 1).bit_length()
+    total = np.fft.irfft(np.fft.rfft(first, size) * np.fft.rfft(second, size), size)
+    total = np.clip(total[:2 * cap + 1], 0.0, None)
+    total[cap] += total[cap + 1:].sum()
+    return total[:cap + 1]
+
+
+def _felled(host_dealt, summons_dealt):
+    """_felled Return the chance that the host's and the summons' damage add
+    up to the boss' health.
+    """
+    import numpy as np
+
+    # summons_tail[k] is the chance of the summons dealing k damage or more.
+    summons_tail = np.cumsum(summons_dealt[::-1])[::-1]
+    return float(host_dealt @ summons_tail[::-1])
+
+
+def solve_fight(players, boss, tolerance=TOLERANCE):
+    """solve_fight Solve a fight between a party and a boss exactly. Follows
+    the same rules and turn order as fight_engine.resolve_fight().
+
+    Args:
+        players (list): The fight_engine.Fighters of the players, with the
+        host first.
+        boss (fight_engine.Fighter): The Fighter of the boss.
+        tolerance (float, optional): The chance of the fight still going at
+        which to stop. Defaults to TOLERANCE.
+
+    Raises:
+        ValueError: If there are no players, or if the host and the boss can
+        never hurt each other so the fight may never end.
+
+    Returns:
+        Solution: The win probability and the expected rounds of the fight.
+    """
+    import numpy as np
+
+    if not players:
+        raise ValueError('A fight takes at least 1 player')
+    if boss.health <= 0:
+        return Solution(1.0, 0.0)
+    host = players[0]
+    if host.health <= 0:
+        return Solution(0.0, 0.0)
+
+    host_damages = damage_distribution(host.attack, boss.armor)
+    host_hits = damage_distribution(boss.attack, host.armor)
+    if host_damages[-1][0] == 0 and host_hits[-1][0] == 0:
+        raise ValueError(f'{host.name} and {boss.name} can never hurt each other, '
+                         'the fight may never end')
+
+    cap = boss.health
+    nothing = np.zeros(cap + 1)
+    nothing[0] = 1.0
+
+    # The damage dealt by the host after n attacks, and the damage taken by
+    # the host while still standing after n boss attacks.
+    host_dealt = nothing
+    host_taken = np.zeros(host.health)
+    host_taken[0] = 1.0
+
+    # Summons with no health left never take a turn. Each summon keeps the
+    # damage it would deal in n attacks, the damage it has dealt by round n
+    # given it may have fallen before then, and the damage it has taken while
+    # still standing.
+    summons = []
+    for summon in players[1:]:
+        if summon.health <= 0:
+            continue
+        taken = np.zeros(summon.health)
+        taken[0] = 1.0
+        summons.append([damage_distribution(summon.attack, boss.armor),
+                        damage_distribution(boss.attack, summon.armor),
+                        nothing, nothing, taken])
+
+    summons_dealt = nothing
+    going = 1.0
+    won = 0.0
+    rounds = 0.0
+    while True:
+        rounds += going
+
+        # The host attacks, and the boss hits back if it is still standing.
+        # If the host falls to it, the boss must have been felled by the
+        # host's attacks and the summons' attacks of the earlier rounds.
+        host_standing = host_taken.sum()
+        host_dealt = _deal(host_dealt, host_damages, cap)
+        host_taken = _take(host_taken, host_hits)
+        host_falls = host_standing - host_taken.sum()
+        won += host_falls * _felled(host_dealt, summons_dealt)
+
+        # The summons still standing attack, each taking the boss' hit back.
+        for summon in summons:
+            damages, hits, dealt, by_round, taken = summon
+            standing = taken.sum()
+            next_dealt = _deal(dealt, damages, cap)
+            summon[2] = next_dealt
+            summon[3] = by_round + standing * (next_dealt - dealt)
+            summon[4] = _take(taken, hits)
+
+        if summons:
+            summons_dealt = summons[0][3]
+            for summon in summons[1:]:
+                summons_dealt = _combine(summons_dealt, summon[3], cap)
+
+        # The next round starts if the host is standing and the boss is not
+        # felled yet.
+        felled = _felled(host_dealt, summons_dealt)
+        going = host_taken.sum() * (1.0 - felled)
+        if going < tolerance:
+            won += host_taken.sum() * felled
+            break
+
+    return Solution(float(min(max(won, 0.0), 1.0)), float(rounds))
+
+
+def solve_healths(player, boss_attack, boss_armor, healths, tolerance=TOLERANCE):
+    """solve_healths Solve a solo fight against bosses of the same attack and
+    armor for every given boss health at once, e.g. every boss of a tier. In a
+    solo fight the damage dealt by the player and the damage they take come
+    from separate rolls, so one pass over the rounds gives the chance of the
+    boss falling at each attack for every health up to the highest.
+
+    Args:
+        player (fight_engine.Fighter): The Fighter of the player.
+        boss_attack (int): The bosses' attack.
+        boss_armor (int): The bosses' armor.
+        healths (list): The bosses' health.
+        tolerance (float, optional): The chance of the fight against the
+        boss with the most health still going at which to stop. Defaults to
+        TOLERANCE.
+
+    Raises:
+        ValueError: If the player and the bosses can never hurt each other so
+        the fights may never end.
+
+    Returns:
+        list: The win probability against each boss health, in the order of
+        healths.
+    """
+    import numpy as np
+
+    healths = list(healths)
+    cap = max(healths + [1])
+    if player.health <= 0:
+        return [1.0 if health <= 0 else 0.0 for health in healths]
+
+    damages = damage_distribution(player.attack, boss_armor)
+    hits = damage_distribution(boss_attack, player.armor)
+    if damages[-1][0] == 0 and hits[-1][0] == 0:
+        raise ValueError(f'{player.name} and the bosses can never hurt each other, '
+                         'the fights may never end')
+
+    # dealt is the damage dealt after n attacks, capped the same as
+    # solve_fight(), and below[h] the chance of it being under h.
+    dealt = np.zeros(cap + 1)
+    dealt[0] = 1.0
+    below = np.ones(cap + 1)
+    below[0] = 0.0
+    taken = np.zeros(player.health)
+    taken[0] = 1.0
+    standing = 1.0
+    won = np.zeros(cap + 1)
+
+    while True:
+        # The player attacks if still standing, felling every boss whose
+        # health the damage dealt reaches with this attack.
+        dealt = _deal(dealt, damages, cap)
+        next_below = np.concatenate(([0.0], np.cumsum(dealt)[:-1]))
+        won += standing * (below - next_below)
+        below = next_below
+
+        # The boss hits back if it is still standing.
+        taken = _take(taken, hits)
+        standing = taken.sum()
+        if standing * below[cap] < tolerance:
+            break
+
+    return [1.0 if health <= 0 else float(min(max(won[health], 0.0), 1.0))
+            for health in healths]
+
+
+def solve(player_objs, boss_obj, tolerance=TOLERANCE):
+    """solve Solve a fight between characters and a boss exactly, from their
+    current health.
+
+    Args:
+        player_objs (list): The character.Character objects of the players,
+        with the host first. A single Character is a solo fight.
+        boss_obj (boss.Boss): The boss.
+        tolerance (float, optional): The chance of the fight still going at
+        which to stop. Defaults to TOLERANCE.
+
+    Returns:
+        Solution: The win probability and the expected rounds of the fight.
+    """
+    if not isinstance(player_objs, (list, tuple)):
+        player_objs = [player_objs]
+    return solve_fight([fight_engine.from_character(player) for player in player_objs],
+                       fight_engine.from_boss(boss_obj), tolerance)
+
+
+if __name__ == "__main__":
+    print("This module is to be imported.")
@@ -0,0 +1,366 @@
+"""
+fight_engine.py
+
+Listen up, brother! This module resolves boss fights without any printing, prompts or pauses. It follows
+the exact rules of battles.py: every attack is a d20 against the target's armor and, on a hit, a d10
+scaled by the attacker's attack rating. The turn order is Host -> Boss -> Summon -> Boss -> ... each
+round, the boss hits back right after every attack that does not fell it, summons with no health left
+skip their turns, and the fight is lost as soon as the host has no health left. The turn order is kept by
+turn_order() for a party of any size.
+
+Each attack is drawn as one number from 0 to OUTCOMES - 1, holding both the d20 and the d10, and looked
+up in a damage table built once per fight. Given a random.Random compatible generator, the outcomes are
+read straight from chunks of random bytes, so a fight comes down to a few list lookups per attack and a
+single process can run over a hundred thousand fights per second.
+
+Classes:
+    Fighter:
+        A named tuple holding the name, health, attack and armor of a player or a boss.
+
+    Attack:
+        A named tuple describing a single attack of a fight.
+
+    FightResult:
+        A named tuple holding the outcome of a fight.
+
+Functions:
+    from_character(player_obj) -> Fighter:
+        Returns the current state of a character.Character as a Fighter, brother!
+
+    from_boss(boss_obj) -> Fighter:
+        Returns the current state of a boss.Boss as a Fighter, brother!
+
+    damage_table(attack, armor) -> tuple:
+        Returns the damage of every d20 and d10 outcome of an attack.
+
+    attack_roll(outcome) -> tuple:
+        Returns the d20 and d10 rolls of an outcome.
+
+    turn_order(health) -> generator:
+        Yields the round and the player of every turn of a fight, brother!
+
+    roll_attack(attack, armor, rng=None) -> Attack:
+        Rolls a single attack outside of a fight, brother!
+
+    fight_events(players, boss, rng=None) -> generator:
+        Plays out a fight one attack at a time and returns its FightResult, brother!
+
+    resolve_fight(players, boss, rng=None, turn=0) -> FightResult:
+        Resolves a whole fight at once as fast as possible, brother!
+"""
+
+import math
+import weakref
+from collections import namedtuple
+import dice
+
+
+OUTCOMES = 200      # Every pair of a d20 and a d10 roll.
+CHUNK_SIZE = 4096   # Number of random bytes drawn at a time for the outcomes.
+BOSS = -1           # The attacker or target index of the boss in an Attack.
+
+_REJECTED = bytes(range(OUTCOMES, 256))    # Bytes that are not an outcome.
+_damage_tables = {}                         # Damage tables by attack and armor.
+_leftovers = weakref.WeakKeyDictionary()    # Unused outcomes by generator.
+
+Fighter = namedtuple('Fighter', ['name', 'health', 'attack', 'armor'])
+
+# round: the round of the fight, starting at 1. attacker and target: the index
+# of the player in the players list, or BOSS. outcome: the d20 and d10 rolls,
+# see attack_roll(). damage: the damage done, 0 if the attack missed.
+Attack = namedtuple('Attack', ['round', 'attacker', 'target', 'hit', 'damage', 'outcome'])
+
+# won: True if the boss was felled. damage_dealt, damage_taken and
+# player_health are tuples in the order of the players list. The boss'
+# health is not floored at 0, the same as boss.Boss.reduce_health().
+FightResult = namedtuple('FightResult', ['won', 'rounds', 'damage_dealt', 'damage_taken',
+                                         'player_health', 'boss_health'])
+
+
+def from_character(player_obj):
+    """from_character Return the current state of a character as a Fighter.
+
+    Args:
+        player_obj (character.Character): The player.
+
+    Returns:
+        Fighter: The player's name, current health, attack and armor.
+    """
+    return Fighter(player_obj.get_name(), player_obj.get_health(),
+                   player_obj.get_attack(), player_obj.get_armor())
+
+
+def from_boss(boss_obj):
+    """from_boss Return the current state of a boss as a Fighter.
+
+    Args:
+        boss_obj (boss.Boss): The boss.
+
+    Returns:
+        Fighter: The boss' name, health, attack and armor.
+    """
+    return Fighter(boss_obj.get_name(), boss_obj.get_health(),
+                   boss_obj.get_attack(), boss_obj.get_armor())
+
+
+def damage_table(attack, armor):
+    """damage_table Return the damage of every outcome of an attack. The
+    outcome (d20 - 1) * 10 + (d10 - 1) misses if the d20 is below the
+    target's armor, and otherwise does math.ceil(attack * (d10 / 10)) damage,
+    the same as Character.attack() and Boss.attack().
+
+    Args:
+        attack (int): The attacker's attack rating.
+        armor (int): The target's armor.
+
+    Returns:
+        tuple: The damage of each of the OUTCOMES outcomes.
+    """
+    # The tables are kept for the life of the process, there are only a few
+    # hundred attack and armor pairs in the game.
+    table = _damage_tables.get((attack, armor))
+    if table is None:
+        table = tuple(math.ceil(attack * (d10 / 10)) if d20 >= armor else 0
+                      for d20 in range(1, 21) for d10 in range(1, 11))
+        _damage_tables[(attack, armor)] = table
+    return table
+
+
+def attack_roll(outcome):
+    """attack_roll Return the d20 and d10 rolls of an attack outcome.
+
+    Args:
+        outcome (int): The outcome, from 0 to OUTCOMES - 1.
+
+    Returns:
+        tuple: The d20 roll and the d10 roll.
+    """
+    return outcome // 10 + 1, outcome % 10 + 1
+
+
+def _refiller(rng):
+    """_refiller Return a function returning an iterator over the next attack
+    outcomes. With a random.Random compatible generator, the outcomes are the
+    bytes of a chunk of random bytes, with the bytes of 200 and up thrown away
+    so every outcome is equally likely. Without one, two outcomes at a time are
+    rolled with the dice backend chosen in dice.py.
+    """
+    if rng is None:
+        randbelow = dice.randbelow
+        return lambda: iter((randbelow(OUTCOMES), randbelow(OUTCOMES)))
+
+    randbytes = rng.randbytes
+    return lambda: iter(randbytes(CHUNK_SIZE).translate(None, _REJECTED))
+
+
+def _unused_outcomes(rng):
+    """_unused_outcomes Return the outcomes left over from the last fight
+    resolved with the generator, so the next fight carries on from them.
+    """
+    if rng is None:
+        return iter(())
+    return _leftovers.get(rng, iter(()))
+
+
+def _keep_outcomes(rng, outcomes):
+    """_keep_outcomes Keep the outcomes left over from a fight for the next
+    fight resolved with the generator.
+    """
+    if rng is not None:
+        _leftovers[rng] = outcomes
+
+
+def turn_order(health):
+    """turn_order Yield the round and the index of the player whose turn it
+    is, for a party of any size. Every round the players still standing take
+    their turn in order, host first, and the boss hits back after each of
+    them. Summons with no health left are dropped from the order, so each
+    round costs no more than the number of players still standing. The
+    scheduler stops once the host has no health left, and the caller stops
+    asking for turns once the boss is felled.
+
+    Args:
+        health (list): The players' current health, with the host first. The
+        caller updates it as the fight goes on.
+
+    Yields:
+        tuple: The round, starting at 1, and the index of the player.
+    """
+    standing = [index for index, value in enumerate(health) if value > 0]
+    rounds = 0
+    while standing and standing[0] == 0:
+        rounds += 1
+        for index in standing:
+            # A summon may fall during the round and an earlier attack never
+            # changes a later player's health, so only the host is checked.
+            if health[0] <= 0:
+                return
+            yield rounds, index
+        standing = [index for index in standing if health[index] > 0]
+
+
+def roll_attack(attack, armor, rng=None):
+    """roll_attack Roll a single attack outside of a fight.
+
+    Args:
+        attack (int): The attacker's attack rating.
+        armor (int): The target's armor.
+        rng (random.Random, optional): The generator to roll with. Uses the
+        dice backend if None. Defaults to None.
+
+    Returns:
+        Attack: The attack, with a round of 0 and no attacker or target.
+    """
+    if rng is None:
+        # The dice backend keeps no leftovers, so roll just the one outcome.
+        outcome = dice.randbelow(OUTCOMES)
+    else:
+        outcomes = _unused_outcomes(rng)
+        outcome = next(outcomes, None)
+        if outcome is None:
+            outcomes = _refiller(rng)()
+            outcome = next(outcomes)
+        _keep_outcomes(rng, outcomes)
+    damage = damage_table(attack, armor)[outcome]
+    return Attack(0, None, None, outcome // 10 + 1 >= armor, damage, outcome)
+
+
+def fight_events(players, boss, rng=None):
+    """fight_events Play out a fight one attack at a time. This is a
+    generator yielding an Attack for every attack of the fight, in the order
+    they happen, and returning the FightResult once the fight is over.
+
+    Args:
+        players (list): The Fighters of the players, with the host first.
+        boss (Fighter): The Fighter of the boss.
+        rng (random.Random, optional): The generator to roll with. Uses the
+        dice backend if None. Defaults to None.
+
+    Yields:
+        Attack: The next attack of the fight.
+
+    Returns:
+        FightResult: The outcome of the fight.
+    """
+    refill = _refiller(rng)
+    outcomes = _unused_outcomes(rng)
+    turns = zip(outcomes, outcomes)
+    player_tables = [damage_table(player.attack, boss.armor) for player in players]
+    boss_tables = [damage_table(boss.attack, player.armor) for player in players]
+    health = [player.health for player in players]
+    dealt = [0] * len(players)
+    taken = [0] * len(players)
+    boss_health = boss.health
+    rounds = 0
+
+    if boss_health > 0:
+        for rounds, index in turn_order(health):
+            turn = next(turns, None)
+            if turn is None:
+                outcomes = refill()
+                turns = zip(outcomes, outcomes)
+                turn = next(turns)
+            player_outcome, boss_outcome = turn
+            damage = player_tables[index][player_outcome]
+            boss_health -= damage
+            dealt[index] += damage
+            yield Attack(rounds, index, BOSS, player_outcome // 10 + 1 >= boss.armor,
+                         damage, player_outcome)
+            if boss_health <= 0:
+                break
+
+            # The boss hits back at whoever just attacked.
+            damage = boss_tables[index][boss_outcome]
+            health[index] -= damage
+            taken[index] += damage
+            yield Attack(rounds, BOSS, index, boss_outcome // 10 + 1 >= players[index].armor,
+                         damage, boss_outcome)
+
+    _keep_outcomes(rng, outcomes)
+    return FightResult(boss_health <= 0, rounds, tuple(dealt), tuple(taken),
+                       tuple(max(value, 0) for value in health), boss_health)
+
+
+def resolve_fight(players, boss, rng=None, turn=0):
+    """resolve_fight Resolve a whole fight at once. Follows the same rules
+    and draws the same outcomes as fight_events(), without creating an Attack
+    for every attack. A fight picked up part way through a round, e.g. to
+    finish a fight shown in battles.py, starts at the given player's turn.
+
+    Args:
+        players (list): The Fighters of the players, with the host first.
+        boss (Fighter): The Fighter of the boss.
+        rng (random.Random, optional): The generator to roll with. Uses the
+        dice backend if None. Defaults to None.
+        turn (int, optional): The index of the player whose turn is next in
+        the first round. The player must have health left. Defaults to 0.
+
+    Returns:
+        FightResult: The outcome of the fight.
+    """
+    boss_health = boss.health
+    rounds = 0
+    outcomes = _unused_outcomes(rng)
+
+    if len(players) == 1:
+        # A solo fight takes the outcomes straight from the chunks of random
+        # bytes, a turn at a time, refilling when a chunk runs out.
+        player = players[0]
+        player_table = damage_table(player.attack, boss.armor)
+        boss_table = damage_table(boss.attack, player.armor)
+        player_health = player.health
+        while player_health > 0 and boss_health > 0:
+            for player_outcome, boss_outcome in zip(outcomes, outcomes):
+                rounds += 1
+                boss_health -= player_table[player_outcome]
+                if boss_health <= 0:
+                    break
+                player_health -= boss_table[boss_outcome]
+                if player_health <= 0:
+                    break
+            else:
+                outcomes = _refiller(rng)()
+        _keep_outcomes(rng, outcomes)
+        return FightResult(boss_health <= 0, rounds, (boss.health - boss_health,),
+                           (player.health - player_health,), (max(player_health, 0),),
+                           boss_health)
+
+    # A party fight walks a turn cursor over the players from the given turn,
+    # skipping the summons with no health left and starting a new round when
+    # it wraps.
+    player_tables = [damage_table(player.attack, boss.armor) for player in players]
+    boss_tables = [damage_table(boss.attack, player.armor) for player in players]
+    health = [player.health for player in players]
+    dealt = [0] * len(players)
+    index = turn
+    # The first round is counted once it starts, the same as a solo fight, so
+    # a fight that is already over lasts 0 rounds.
+    if health[0] > 0 and boss_health > 0:
+        rounds = 1
+    while health[0] > 0 and boss_health > 0:
+        for player_outcome, boss_outcome in zip(outcomes, outcomes):
+            damage = player_tables[index][player_outcome]
+            boss_health -= damage
+            dealt[index] += damage
+            if boss_health <= 0:
+                break
+            health[index] -= boss_tables[index][boss_outcome]
+            if health[0] <= 0:
+                break
+            index += 1
+            while index < len(health) and health[index] <= 0:
+                index += 1
+            if index == len(health):
+                index = 0
+                rounds += 1
+        else:
+            outcomes = _refiller(rng)()
+
+    _keep_outcomes(rng, outcomes)
+    return FightResult(boss_health <= 0, rounds, tuple(dealt),
+                       tuple(player.health - value for player, value in zip(players, health)),
+                       tuple(max(value, 0) for value in health), boss_health)
+
+
+if __name__ == "__main__":
+    print("This module is to be imported by elden_ring.py.")
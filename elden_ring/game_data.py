@@ -0,0 +1,482 @@
+"""
+game_data.py
+
+Listen up, brother! This module loads the game data used by the elden_ring.py program. The data is
+read once per process from the validated game data bundle built by data_bundle.py and kept in memory,
+so the Character and Boss objects can look up what they need without parsing the files again every
+time they step into the ring.
+
+Classes:
+    Weapon:
+        A named tuple holding the name, type and attack of a single weapon.
+
+    WeaponCatalog:
+        An in-memory catalog of the unupgraded and fully upgraded weapons with a name index.
+
+    BossEntry:
+        A named tuple holding a boss' name, scaled health, runes, attack and armor.
+
+    BossRoster:
+        An in-memory roster of the field, mini and main bosses with their tier stats precomputed.
+
+Functions:
+    load_game_data() -> dict:
+        Returns the validated game data from the game data bundle, loading it on first use, brother!
+
+    default_boss_params() -> dict:
+        Returns the built-in boss difficulty parameters.
+
+    load_boss_params(params_path=BOSS_PARAMS_FILE) -> dict:
+        Returns the validated boss difficulty parameters from the parameter file.
+
+    get_boss_params() -> dict:
+        Returns the process-wide boss difficulty parameters, loading them on first use, brother!
+
+    boss_tiers(params=None) -> dict:
+        Returns the boss tiers with the difficulty parameters applied.
+
+    tutorial_boss(params=None) -> BossEntry:
+        Returns the tutorial boss with the difficulty parameters applied.
+
+    get_weapon_catalog() -> WeaponCatalog:
+        Returns the process-wide weapon catalog, loading it on first use, brother!
+
+    get_boss_roster() -> BossRoster:
+        Returns the process-wide boss roster, loading it on first use, brother!
+
+    to_dataframe(rows) -> pandas.DataFrame:
+        Turns a list of weapons or bosses into a pandas DataFrame for analytics, brother!
+
+pandas is never imported by this module unless to_dataframe() is called, so the game itself starts
+without it. Only the analytics features need pandas installed.
+"""
+
+import json
+import math
+import os
+from collections import namedtuple
+import data_bundle
+import dice
+
+
+WEAPONS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'weapons'))
+UNUPGRADED_WEAPONS_FILE = os.path.join(WEAPONS_PATH, 'unupgraded-weapons.csv')
+UPGRADED_WEAPONS_FILE = os.path.join(WEAPONS_PATH, 'full-upgraded-weapons.csv')
+BOSSES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'bosses'))
+BOSS_PARAMS_FILE = os.path.join(BOSSES_PATH, 'boss-params.json')
+
+# Environment variable naming a data pack directory built by mmap_catalog.py.
+DATA_PACK_ENV = 'ELDEN_RING_DATA_PACK'
+
+# The boss tiers: the boss list file, the divisor for the boss' health and the
+# attack and armor of every boss in the tier. The divisor, attack and armor
+# are the built-in values, the parameter file can change them.
+BOSS_TIERS = {
+    'field': {'file': 'field-boss-list.csv', 'health_divisor': 4, 'attack': 15, 'armor': 9},
+    'mini': {'file': 'mini-boss-list.csv', 'health_divisor': 6, 'attack': 20, 'armor': 11},
+    'main': {'file': 'main-boss-list.csv', 'health_divisor': 8, 'attack': 25, 'armor': 13}
+}
+
+# The tutorial boss, fought before the boss tiers. Its health is divided by
+# its health divisor the same as a boss tier.
+TUTORIAL_BOSS = {'name': 'Soldier of Godrick', 'health': 384, 'runes': 400,
+                 'health_divisor': 2, 'attack': 10, 'armor': 7}
+
+# The difficulty knobs of the tutorial boss and every boss tier that can be
+# set in the parameter file, see balance_tuner.py.
+BOSS_PARAMS = ['health_divisor', 'attack', 'armor']
+
+# A single row of the weapon files: Name;Type;Attack.
+Weapon = namedtuple('Weapon', ['name', 'type', 'attack'])
+
+# A single row of the boss files with the tier's stats applied.
+BossEntry = namedtuple('BossEntry', ['name', 'health', 'runes', 'attack', 'armor'])
+
+_game_data = None       # The process-wide game data from the bundle.
+_weapon_catalog = None  # The process-wide weapon catalog.
+_boss_roster = None     # The process-wide boss roster.
+_boss_params = None     # The process-wide boss difficulty parameters.
+
+
+class WeaponCatalog:
+    """A class used to hold the weapon files in memory with an index by weapon
+    name across both the unupgraded and fully upgraded weapons.
+
+    Attributes
+    ----------
+    _unupgraded: list
+        The weapons from the unupgraded weapon file in file order.
+    _upgraded: list
+        The weapons from the fully upgraded weapon file in file order.
+    _index: dict
+        A dictionary of weapon names to their Weapon tuple.
+
+    Methods
+    -------
+    get(name)
+        Returns the weapon with the given name.
+    unupgraded()
+        Returns the list of unupgraded weapons.
+    upgraded()
+        Returns the list of fully upgraded weapons.
+    random_weapon(upgraded=False)
+        Returns a random weapon from one of the weapon lists.
+    """
+
+    def __init__(self, unupgraded_rows, upgraded_rows):
+        self._unupgraded = [Weapon(*row) for row in unupgraded_rows]
+        self._upgraded = [Weapon(*row) for row in upgraded_rows]
+
+        # Index every weapon by name. Only the first row for a name is kept so
+        # the lookups match the first match of the old DataFrame scans.
+        self._index = {}
+        for weapon in self._unupgraded + self._upgraded:
+            self._index.setdefault(weapon.name, weapon)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, name):
+        """get Return the weapon with the given name.
+
+        Args:
+            name (str): The name of the weapon.
+
+        Raises:
+            KeyError: If there is no weapon with the given name.
+
+        Returns:
+            Weapon: The weapon's name, type and attack.
+        """
+        return self._index[name]
+
+    def unupgraded(self):
+        """unupgraded Return the weapons from the unupgraded weapon file.
+
+        Returns:
+            list: List of Weapon tuples.
+        """
+        return self._unupgraded
+
+    def upgraded(self):
+        """upgraded Return the weapons from the fully upgraded weapon file.
+
+        Returns:
+            list: List of Weapon tuples.
+        """
+        return self._upgraded
+
+    def random_weapon(self, upgraded=False):
+        """random_weapon Return a random weapon from the unupgraded or the fully
+        upgraded weapon list. Every row of the list is equally likely.
+
+        Args:
+            upgraded (bool, optional): Determines if the weapon should come from
+            the fully upgraded weapon list. Defaults to False.
+
+        Raises:
+            IndexError: If the weapon list is empty.
+
+        Returns:
+            Weapon: The weapon's name, type and attack.
+        """
+        weapons = self._upgraded if upgraded else self._unupgraded
+        if not weapons:
+            raise IndexError('No weapons in the weapon list.')
+        return weapons[dice.randbelow(len(weapons))]
+
+
+class BossRoster:
+    """A class used to hold the boss files in memory. Each boss' health is
+    already scaled by its tier's divisor and each boss carries its tier's attack
+    and armor, so picking a boss is a single random index.
+
+    Attributes
+    ----------
+    _tiers: dict
+        A dictionary of tier names to their list of BossEntry tuples.
+    _index: dict
+        A dictionary of tier names to a dictionary of boss names to their
+        BossEntry tuple.
+
+    Methods
+    -------
+    bosses(tier)
+        Returns the list of bosses in the tier.
+    get(tier, name)
+        Returns the boss with the given name from the tier.
+    random_boss(tier)
+        Returns a random boss from the tier.
+    """
+
+    def __init__(self, boss_rows, tiers=None):
+        if tiers is None:
+            tiers = BOSS_TIERS
+
+        # Apply each tier's health divisor, attack and armor to the rows of its
+        # boss file: Name;Health;Runes.
+        self._tiers = {}
+        for tier, settings in tiers.items():
+            self._tiers[tier] = [BossEntry(name, math.ceil(health / settings['health_divisor']),
+                                           runes, settings['attack'], settings['armor'])
+                                 for name, health, runes in boss_rows[settings['file']]]
+
+        # Index the bosses of each tier by name, keeping the first row for a name.
+        self._index = {}
+        for tier, bosses in self._tiers.items():
+            self._index[tier] = {}
+            for boss in bosses:
+                self._index[tier].setdefault(boss.name, boss)
+
+    def bosses(self, tier):
+        """bosses Return the bosses in the given tier.
+
+        Args:
+            tier (str): The boss tier, e.g. 'field', 'mini' or 'main'.
+
+        Returns:
+            list: List of BossEntry tuples.
+        """
+        return self._tiers[tier]
+
+    def get(self, tier, name):
+        """get Return the boss with the given name from the given tier.
+
+        Args:
+            tier (str): The boss tier, e.g. 'field', 'mini' or 'main'.
+            name (str): The name of the boss.
+
+        Raises:
+            KeyError: If there is no boss with the given name in the tier.
+
+        Returns:
+            BossEntry: The boss' name, health, runes, attack and armor.
+        """
+        return self._index[tier][name]
+
+    def random_boss(self, tier):
+        """random_boss Return a random boss from the given tier. Every row of
+        the tier's boss file is equally likely.
+
+        Args:
+            tier (str): The boss tier, e.g. 'field', 'mini' or 'main'.
+
+        Raises:
+            IndexError: If the tier has no bosses.
+
+        Returns:
+            BossEntry: The boss' name, health, runes, attack and armor.
+        """
+        bosses = self._tiers[tier]
+        if not bosses:
+            raise IndexError(f'No bosses in the {tier} tier.')
+        return bosses[dice.randbelow(len(bosses))]
+
+
+def load_game_data():
+    """load_game_data Return the validated game data from the game data
+    bundle. The bundle is loaded the first time this is called and rebuilt if
+    any of the game data files changed.
+
+    Raises:
+        FileNotFoundError: If one of the game data files does not exist.
+        data_bundle.DataValidationError: If any of the game data files are invalid.
+
+    Returns:
+        dict: The game data with 'weapons', 'bosses', 'classes' and 'sources'.
+    """
+    global _game_data
+
+    if _game_data is None:
+        _game_data = data_bundle.load_bundle()
+    return _game_data
+
+
+def default_boss_params():
+    """default_boss_params Return the built-in difficulty parameters of the
+    tutorial boss and every boss tier, used where the parameter file does not
+    set them.
+
+    Returns:
+        dict: A dictionary of 'tutorial' and the tier names to a dictionary of
+        BOSS_PARAMS to their values.
+    """
+    params = {'tutorial': {key: TUTORIAL_BOSS[key] for key in BOSS_PARAMS}}
+    for tier, settings in BOSS_TIERS.items():
+        params[tier] = {key: settings[key] for key in BOSS_PARAMS}
+    return params
+
+
+def load_boss_params(params_path=BOSS_PARAMS_FILE):
+    """load_boss_params Return the difficulty parameters of the tutorial boss
+    and every boss tier from the parameter file, e.g.
+
+        {"field": {"health_divisor": 4, "attack": 15, "armor": 9}, ...}
+
+    Anything the file does not set keeps its built-in value, and a missing
+    file gives the built-in values.
+
+    Args:
+        params_path (str, optional): Path of the parameter file. Defaults to
+        BOSS_PARAMS_FILE.
+
+    Raises:
+        data_bundle.DataValidationError: If the file is not valid JSON or
+        sets an unknown tier or parameter, or a value that is not a positive
+        integer.
+
+    Returns:
+        dict: A dictionary of 'tutorial' and the tier names to a dictionary of
+        BOSS_PARAMS to their values.
+    """
+    params = default_boss_params()
+    name = os.path.basename(params_path)
+    try:
+        with open(params_path, 'r', encoding='UTF-8') as file:
+            overrides = json.load(file)
+    except FileNotFoundError:
+        return params
+    except ValueError as error:
+        raise data_bundle.DataValidationError([f'{name}: invalid JSON ({error})']) from error
+
+    errors = []
+    if not isinstance(overrides, dict):
+        raise data_bundle.DataValidationError([f'{name}: must be a JSON object'])
+    for tier, values in overrides.items():
+        if tier not in params or not isinstance(values, dict):
+            errors.append(f'{name}: unknown boss tier {tier!r}')
+            continue
+        for key, value in values.items():
+            if key not in BOSS_PARAMS:
+                errors.append(f'{name}: {tier} has unknown parameter {key!r}')
+            elif not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                errors.append(f'{name}: {tier} {key} must be a positive integer')
+            else:
+                params[tier][key] = value
+    if errors:
+        raise data_bundle.DataValidationError(errors)
+    return params
+
+
+def get_boss_params():
+    """get_boss_params Return the process-wide boss difficulty parameters. The
+    parameter file is loaded the first time this is called.
+
+    Raises:
+        data_bundle.DataValidationError: If the parameter file is invalid.
+
+    Returns:
+        dict: The parameters, see load_boss_params().
+    """
+    global _boss_params
+
+    if _boss_params is None:
+        _boss_params = load_boss_params()
+    return _boss_params
+
+
+def boss_tiers(params=None):
+    """boss_tiers Return the boss tiers with the difficulty parameters of each
+    tier applied, in the same layout as BOSS_TIERS.
+
+    Args:
+        params (dict, optional): The parameters, see load_boss_params(). Uses
+        get_boss_params() if None. Defaults to None.
+
+    Returns:
+        dict: A dictionary of tier names to their settings.
+    """
+    params = get_boss_params() if params is None else params
+    return {tier: dict(settings, **params[tier]) for tier, settings in BOSS_TIERS.items()}
+
+
+def tutorial_boss(params=None):
+    """tutorial_boss Return the tutorial boss with its difficulty parameters
+    applied.
+
+    Args:
+        params (dict, optional): The parameters, see load_boss_params(). Uses
+        get_boss_params() if None. Defaults to None.
+
+    Returns:
+        BossEntry: The boss' name, health, runes, attack and armor.
+    """
+    settings = (get_boss_params() if params is None else params)['tutorial']
+    return BossEntry(TUTORIAL_BOSS['name'],
+                     math.ceil(TUTORIAL_BOSS['health'] / settings['health_divisor']),
+                     TUTORIAL_BOSS['runes'], settings['attack'], settings['armor'])
+
+
+def get_weapon_catalog():
+    """get_weapon_catalog Return the process-wide weapon catalog. The weapons
+    are loaded from the game data bundle the first time this is called, or from
+    the memory-mapped data pack named by the ELDEN_RING_DATA_PACK environment
+    variable if it is set.
+
+    Raises:
+        FileNotFoundError: If one of the game data files does not exist.
+        data_bundle.DataValidationError: If any of the game data files are invalid.
+
+    Returns:
+        WeaponCatalog: The weapon catalog.
+    """
+    global _weapon_catalog
+
+    if _weapon_catalog is None and os.environ.get(DATA_PACK_ENV):
+        # Imported here since mmap_catalog builds on the tuples in this module.
+        import mmap_catalog
+        _weapon_catalog = mmap_catalog.MmapWeaponCatalog(os.environ[DATA_PACK_ENV])
+    elif _weapon_catalog is None:
+        weapons = load_game_data()['weapons']
+        _weapon_catalog = WeaponCatalog(weapons[os.path.basename(UNUPGRADED_WEAPONS_FILE)],
+                                        weapons[os.path.basename(UPGRADED_WEAPONS_FILE)])
+    return _weapon_catalog
+
+
+def get_boss_roster():
+    """get_boss_roster Return the process-wide boss roster. The bosses are
+    loaded from the game data bundle the first time this is called, or from
+    the memory-mapped data pack named by the ELDEN_RING_DATA_PACK environment
+    variable if it is set, with the tier stats from the parameter file.
+
+    Raises:
+        FileNotFoundError: If one of the game data files does not exist.
+        data_bundle.DataValidationError: If any of the game data files are invalid.
+
+    Returns:
+        BossRoster: The boss roster.
+    """
+    global _boss_roster
+
+    if _boss_roster is None and os.environ.get(DATA_PACK_ENV):
+        # Imported here since mmap_catalog builds on the tuples in this module.
+        import mmap_catalog
+        _boss_roster = mmap_catalog.MmapBossRoster(os.environ[DATA_PACK_ENV], boss_tiers())
+    elif _boss_roster is None:
+        _boss_roster = BossRoster(load_game_data()['bosses'], boss_tiers())
+    return _boss_roster
+
+
+def to_dataframe(rows):
+    """to_dataframe Turn a list of Weapon or BossEntry tuples into a pandas
+    DataFrame. pandas is only imported when this is called.
+
+    Args:
+        rows (list): List of Weapon or BossEntry tuples.
+
+    Raises:
+        ImportError: If pandas is not installed.
+
+    Returns:
+        pandas.DataFrame: DataFrame with one column per tuple field.
+    """
+    import pandas as pd     # Optional dependency, only needed for analytics.
+
+    return pd.DataFrame(rows, columns=rows[0]._fields if rows else None)
+
+
+if __name__ == "__main__":
+    print("This module is to be imported by elden_ring.py.")
@@ -0,0 +1,135 @@
+"""
+level_solver.py
+
+Listen up, brother! This module works out the best way to spend a rune budget on level-ups before the
+next boss fight. Every level costs the same runes whatever stat it goes to, see character.rune_cost(), so
+the budget fixes how many levels can be bought, and only three stats matter in a fight: Vig gives 10 max
+health a level, and Str and Dex each give 1 attack a level. The solver searches every way of splitting
+the levels between Vig and Str + Dex, one level at a time from the player's current (level, Vig, Str +
+Dex), with the states it has already seen memoized, and keeps the build with the highest chance of
+felling a boss of the next tier. The win probabilities are solved exactly by loadout_ranker.py from full
+health, since the player rests at a site of grace before the fight.
+
+The Recommended Build action at a site of grace in character.py uses this module.
+
+NumPy is needed for this module, it is only imported by the game when a Recommended Build is asked for.
+
+Classes:
+    Build:
+        A named tuple holding the levels to buy and the win probability they give.
+
+Functions:
+    affordable_levels(level, runes) -> tuple:
+        Returns how many levels a rune budget buys from a level and their cost.
+
+    solve_levels(level, vig, str_dex, attack, armor, runes, tier='field') -> Build:
+        Returns the split of the affordable levels with the best win probability, brother!
+
+    recommended_build(player_obj, tier='field') -> Build:
+        Returns the best build for a player's runes against the next boss tier, brother!
+
+    apply_build(player_obj, build) -> int:
+        Levels up a player with a build and returns the number of levels gained.
+"""
+
+from collections import namedtuple
+import character
+import loadout_ranker
+
+
+# vig and str_dex: the levels to put in Vig and in Str + Dex. runes: the
+# runes they cost. win_probability: the chance of felling a boss of the tier
+# with them, and current: without any level-ups.
+Build = namedtuple('Build', ['vig', 'str_dex', 'runes', 'win_probability', 'current'])
+
+
+def affordable_levels(level, runes):
+    """affordable_levels Return how many levels in a row a rune budget buys,
+    starting from the given level.
+
+    Args:
+        level (int): The player's current level.
+        runes (int): The rune budget.
+
+    Returns:
+        tuple: The number of levels and the runes they cost.
+    """
+    levels = character.affordable_levels(level, runes)
+    return levels, character.levels_cost(level, levels)
+
+
+def solve_levels(level, vig, str_dex, attack, armor, runes, tier='field'):
+    """solve_levels Return the split of the levels a rune budget buys between
+    Vig and Str + Dex that gives the best chance of felling a boss of the
+    tier from full health. Every level bought can only help, so the search
+    goes through every (level, Vig, Str + Dex) state reachable with the
+    budget, with the best build from each state memoized.
+
+    Args:
+        level (int): The player's current level.
+        vig (int): The player's Vig.
+        str_dex (int): The player's Str + Dex.
+        attack (int): The player's attack, which includes their Str + Dex.
+        armor (int): The player's armor.
+        runes (int): The rune budget.
+        tier (str, optional): One of loadout_ranker.TIERS. Defaults to
+        'field'.
+
+    Returns:
+        Build: The levels to put in Vig and in Str + Dex. Ties go to Vig.
+    """
+    levels, spent = affordable_levels(level, runes)
+    best = {}
+
+    def search(state_level, state_vig, state_str_dex):
+        state = (state_level, state_vig, state_str_dex)
+        if state not in best:
+            if state_level == level + levels:
+                best[state] = (loadout_ranker.tier_win_probability(
+                    state_vig * 10, attack + state_str_dex - str_dex, armor, tier),
+                    state_vig, state_str_dex)
+            else:
+                best[state] = max(search(state_level + 1, state_vig + 1, state_str_dex),
+                                  search(state_level + 1, state_vig, state_str_dex + 1))
+        return best[state]
+
+    win_probability, best_vig, best_str_dex = search(level, vig, str_dex)
+    current = loadout_ranker.tier_win_probability(vig * 10, attack, armor, tier)
+    return Build(best_vig - vig, best_str_dex - str_dex, spent, win_probability, current)
+
+
+def recommended_build(player_obj, tier='field'):
+    """recommended_build Return the best build for a player's runes against
+    the bosses of the next tier. See solve_levels().
+
+    Args:
+        player_obj (character.Character): The player.
+        tier (str, optional): One of loadout_ranker.TIERS. Defaults to
+        'field'.
+
+    Returns:
+        Build: The levels to put in Vig and in Str + Dex.
+    """
+    stats = player_obj.get_stats()
+    return solve_levels(player_obj.get_level(), stats['Vig'], stats['Str'] + stats['Dex'],
+                        player_obj.get_attack(), player_obj.get_armor(),
+                        player_obj.get_runes(), tier)
+
+
+def apply_build(player_obj, build):
+    """apply_build Level up a player with a build, the Vig levels first and
+    the Str + Dex levels in Str, without any prompts.
+
+    Args:
+        player_obj (character.Character): The player.
+        build (Build): The build from recommended_build().
+
+    Returns:
+        int: The number of levels gained, fewer than the build if the player
+        runs out of runes.
+    """
+    return player_obj.level_up_stats({'Vig': build.vig, 'Str': build.str_dex})
+
+
+if __name__ == "__main__":
+    print("This module is to be imported by character.py.")
@@ -0,0 +1,309 @@
+"""
+loadout_ranker.py
+
+Listen up, brother! This module ranks every legal loadout a player can hold, every (Right Hand, Left Hand)
+pair from both weapon files, by the damage it deals each round or by its chance of felling the bosses of
+a tier. A weapon can go in either hand and a shield only in the Left Hand, which may also be empty, so
+there are over 400,000 pairs.
+
+A loadout only changes two things, the same as Character.update_stats(): the attack, which is the Right
+Hand's attack plus half of a Left Hand weapon's attack on top of the player's Str and Dex, and the armor,
+which a shield in the Left Hand raises. Every pair is put in a sorted index once, grouped by armor and
+by attack from the highest down. Both the damage per round and the chance of winning only go up with the
+attack for the same armor, so the best loadouts are always at the head of the two armor groups, and a
+top-k query merges the heads and stops after k pairs. Only the few attack values it reaches are ever
+scored, and their scores are kept for the life of the process, so queries answer in milliseconds.
+
+Run it from the elden_ring directory to rank the loadouts of a fresh character of a starting class:
+
+    python loadout_ranker.py CLASS [--tier TIER] [--by {damage,win}] [--top K]
+
+NumPy is only needed for this module, it is never imported by the game itself.
+
+Classes:
+    Loadout:
+        A named tuple holding a ranked loadout with its attack, armor and score.
+
+    LoadoutIndex:
+        A sorted index of every legal (Right Hand, Left Hand) pair by armor and attack.
+
+Functions:
+    get_loadout_index() -> LoadoutIndex:
+        Returns the process-wide loadout index, building it on first use, brother!
+
+    damage_per_round(attack, tier='field') -> float:
+        Returns the expected damage of an attack against the bosses of a tier.
+
+    tier_win_probability(health, attack, armor, tier='field') -> float:
+        Returns the chance of a player felling a boss of a tier, brother!
+
+    rank_loadouts(player_obj, tier='field', by='damage', k=10) -> list:
+        Returns the best k loadouts of a player against a boss tier, brother!
+
+    main():
+        Prints the best loadouts of a starting class.
+"""
+
+import argparse
+import heapq
+import sys
+from collections import namedtuple
+import character
+import data_bundle
+import exact_solver
+import fight_engine
+import game_data
+
+
+TIERS = ['tutorial'] + list(game_data.BOSS_TIERS)
+RANKINGS = ['damage', 'win']
+
+# right_hand and left_hand: the weapon names, left_hand is None if empty.
+# attack and armor: the player's attack and armor with the loadout. score:
+# the damage per round or the win probability the loadouts are ranked by.
+Loadout = namedtuple('Loadout', ['right_hand', 'left_hand', 'attack', 'armor', 'score'])
+
+_loadout_index = None       # The process-wide loadout index.
+_win_probabilities = {}     # Win probabilities by health, attack, armor and tier.
+
+
+class LoadoutIndex:
+    """A class used to hold every legal (Right Hand, Left Hand) pair of the
+    weapon catalog in a sorted index. The pairs are split by whether the Left
+    Hand holds a shield, and each split is grouped by the attack of its
+    weapons from the highest down. The player's Str and Dex are left out, so
+    the index is the same for every player.
+
+    Attributes
+    ----------
+    _right_hands: list
+        The weapons that can go in the Right Hand.
+    _left_hands: list
+        The weapons and shields that can go in the Left Hand, with None first
+        for an empty Left Hand.
+    _pairs: dict
+        A dictionary of True for the shield split and False for the other to
+        an array of pair numbers, right hand * len(_left_hands) + left hand,
+        sorted by attack from the highest down.
+    _groups: dict
+        A dictionary of each split to a list of (attack, start, end) tuples,
+        the pairs of an attack being _pairs[split][start:end].
+
+    Methods
+    -------
+    top(attack_bonus, score, k=10)
+        Returns the k pairs with the highest score.
+    """
+
+    def __init__(self, catalog):
+        import numpy as np
+
+        weapons = list(catalog.unupgraded()) + list(catalog.upgraded())
+        self._right_hands = [weapon for weapon in weapons
+                             if weapon.type in character.WEAPON_TYPES]
+        self._left_hands = [None] + [weapon for weapon in weapons
+                                     if weapon.type in character.WEAPON_TYPES
+                                     or weapon.type in character.SHIELD_TYPES]
+
+        # A Left Hand weapon adds half its attack, a shield adds none.
+        right_attack = np.array([weapon.attack for weapon in self._right_hands], dtype=np.int64)
+        left_attack = np.array([0] + [weapon.attack // 2 if weapon.type in character.WEAPON_TYPES
+                                      else 0 for weapon in self._left_hands[1:]], dtype=np.int64)
+        shield = np.array([False] + [weapon.type in character.SHIELD_TYPES
+                                     for weapon in self._left_hands[1:]])
+
+        self._pairs = {}
+        self._groups = {}
+        for split in (False, True):
+            columns = np.flatnonzero(shield == split)
+            attack = (right_attack[:, None] + left_attack[None, columns]).ravel()
+            pairs = (np.arange(right_attack.size)[:, None] * len(self._left_hands)
+                     + columns[None, :]).ravel()
+            order = np.argsort(-attack, kind='stable')
+            attack = attack[order]
+            self._pairs[split] = pairs[order]
+            starts = np.flatnonzero(np.diff(attack, prepend=attack[:1] + 1))
+            ends = np.append(starts[1:], attack.size)
+            self._groups[split] = list(zip(attack[starts].tolist(), starts.tolist(),
+                                           ends.tolist()))
+
+    def __len__(self):
+        return sum(len(pairs) for pairs in self._pairs.values())
+
+    def top(self, attack_bonus, score, k=10):
+        """top Return the k pairs with the highest score. The score must never
+        go down as the attack goes up for the same armor, so the best pairs
+        left are always at the head of one of the two splits.
+
+        Args:
+            attack_bonus (int): The attack the player adds to every loadout,
+            their Str and Dex.
+            score (function): Called with the attack and the armor of a
+            loadout, returns its score.
+            k (int, optional): The number of pairs. Defaults to 10.
+
+        Returns:
+            list: Up to k Loadout tuples, the best first. Ties go to the
+            shield, then to the order of the weapon files.
+        """
+        armors = {False: character.BASE_ARMOR, True: character.SHIELD_ARMOR}
+        heads = []
+
+        def push(split, group):
+            if group < len(self._groups[split]):
+                attack = self._groups[split][group][0] + attack_bonus
+                heapq.heappush(heads, (-score(attack, armors[split]), not split, group, split))
+
+        push(False, 0)
+        push(True, 0)
+        loadouts = []
+        while heads and len(loadouts) < k:
+            negative_score, _, group, split = heapq.heappop(heads)
+            attack, start, end = self._groups[split][group]
+            for pair in self._pairs[split][start:min(end, start + k - len(loadouts))].tolist():
+                right, left = divmod(pair, len(self._left_hands))
+                left_hand = self._left_hands[left]
+                loadouts.append(Loadout(self._right_hands[right].name,
+                                        left_hand.name if left_hand else None,
+                                        attack + attack_bonus, armors[split], -negative_score))
+            push(split, group + 1)
+        return loadouts
+
+
+def get_loadout_index():
+    """get_loadout_index Return the process-wide loadout index. The index is
+    built from the weapon catalog the first time this is called.
+
+    Raises:
+        FileNotFoundError: If one of the game data files does not exist.
+        data_bundle.DataValidationError: If any of the game data files are invalid.
+
+    Returns:
+        LoadoutIndex: The loadout index.
+    """
+    global _loadout_index
+
+    if _loadout_index is None:
+        _loadout_index = LoadoutIndex(game_data.get_weapon_catalog())
+    return _loadout_index
+
+
+def _tier_bosses(tier):
+    """_tier_bosses Return the bosses of a tier, or the tutorial boss.
+    """
+    if tier == 'tutorial':
+        return [game_data.tutorial_boss()]
+    return list(game_data.get_boss_roster().bosses(tier))
+
+
+def damage_per_round(attack, tier='field'):
+    """damage_per_round Return the expected damage of a player's attack
+    against the bosses of a tier, misses included.
+
+    Args:
+        attack (int): The player's attack.
+        tier (str, optional): One of TIERS. Defaults to 'field'.
+
+    Returns:
+        float: The expected damage.
+    """
+    table = fight_engine.damage_table(attack, _tier_bosses(tier)[0].armor)
+    return sum(table) / fight_engine.OUTCOMES
+
+
+def tier_win_probability(health, attack, armor, tier='field'):
+    """tier_win_probability Return the chance of a player felling a boss of a
+    tier, the average over every boss in the tier, solved exactly. The results
+    are kept for the life of the process.
+
+    Args:
+        health (int): The player's health.
+        attack (int): The player's attack.
+        armor (int): The player's armor.
+        tier (str, optional): One of TIERS. Defaults to 'field'.
+
+    Returns:
+        float: The win probability.
+    """
+    key = (health, attack, armor, tier)
+    probability = _win_probabilities.get(key)
+    if probability is None:
+        bosses = _tier_bosses(tier)
+        probabilities = exact_solver.solve_healths(
+            fight_engine.Fighter('Player', health, attack, armor), bosses[0].attack,
+            bosses[0].armor, [entry.health for entry in bosses])
+        probability = sum(probabilities) / len(probabilities)
+        _win_probabilities[key] = probability
+    return probability
+
+
+def rank_loadouts(player_obj, tier='field', by='damage', k=10):
+    """rank_loadouts Return the best loadouts of a player against the bosses
+    of a tier, from the player's current health and stats.
+
+    Args:
+        player_obj (character.Character): The player.
+        tier (str, optional): One of TIERS. Defaults to 'field'.
+        by (str, optional): 'damage' to rank by the expected damage per
+        round, or 'win' by the chance of felling a boss of the tier. Defaults
+        to 'damage'.
+        k (int, optional): The number of loadouts. Defaults to 10.
+
+    Raises:
+        ValueError: If the tier or the ranking is not known.
+
+    Returns:
+        list: Up to k Loadout tuples, the best first.
+    """
+    if tier not in TIERS:
+        raise ValueError(f'Unknown boss tier: {tier}')
+    if by not in RANKINGS:
+        raise ValueError(f'Unknown ranking: {by}')
+
+    stats = player_obj.get_stats()
+    health = player_obj.get_health()
+    if by == 'damage':
+        def score(attack, armor):
+            return damage_per_round(attack, tier)
+    else:
+        def score(attack, armor):
+            return tier_win_probability(health, attack, armor, tier)
+    return get_loadout_index().top(stats['Str'] + stats['Dex'], score, k)
+
+
+def main():
+    """main Print the best loadouts of a fresh character of a starting class
+    against a boss tier.
+    """
+    parser = argparse.ArgumentParser(description='Rank every loadout of a class, brother!')
+    parser.add_argument('character', choices=character.CLASSES, metavar='CLASS',
+                        help=f'starting class, one of {", ".join(character.CLASSES)}')
+    parser.add_argument('--tier', choices=TIERS, default='field',
+                        help='boss tier to rank against (default field)')
+    parser.add_argument('--by', choices=RANKINGS, default='damage',
+                        help='rank by expected damage per round or win probability '
+                             '(default damage)')
+    parser.add_argument('--top', type=int, default=10, help='number of loadouts (default 10)')
+    arguments = parser.parse_args()
+
+    try:
+        player = character.Character.create(arguments.character, arguments.character)
+        loadouts = rank_loadouts(player, arguments.tier, arguments.by, arguments.top)
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        sys.exit(1)
+    except data_bundle.DataValidationError as error:
+        print(f'\n{error}\nExiting...')
+        sys.exit(1)
+
+    score_name = 'Damage' if arguments.by == 'damage' else 'Win rate'
+    print(f'{"Right Hand".ljust(36)} {"Left Hand".ljust(36)} Attack Armor {score_name}')
+    for loadout in loadouts:
+        score = (f'{loadout.score:.2f}' if arguments.by == 'damage'
+                 else f'{loadout.score:.2%}')
+        print(f'{loadout.right_hand[:36].ljust(36)} {(loadout.left_hand or "-")[:36].ljust(36)} '
+              f'{loadout.attack:6} {loadout.armor:5} {score}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,564 @@
+"""
+mmap_catalog.py
+
+Listen up, brother! This module handles the catalog file format used for very large community data packs
+with hundreds of thousands of weapons and bosses. A catalog file is built once from a ';' separated weapon
+or boss file and then opened with mmap, so looking up a name or drawing a random row only touches the pages
+it needs and the memory used stays flat no matter how big the catalog gets.
+
+Catalog file layout (all numbers little-endian):
+    header:   magic b'ERMC', version, field count, record count, offset table position,
+              name index position
+    schema:   one byte per field, b's' for text or b'i' for a whole number
+    records:  each field in order, text as a 2 byte length followed by UTF-8 bytes and
+              whole numbers as 8 bytes
+    offsets:  the position of each record in file order (8 bytes each)
+    index:    the record numbers sorted by name (4 bytes each)
+
+A data pack is a directory with a weapons/ and a bosses/ directory holding one .catalog file for each of
+the game's weapon and boss files. Set the ELDEN_RING_DATA_PACK environment variable to the directory to
+play with it.
+
+Classes:
+    MmapCatalog:
+        A read-only, memory-mapped catalog with a sorted name index.
+
+    MmapWeaponCatalog:
+        A weapon catalog backed by the unupgraded and fully upgraded weapon catalog files.
+
+    MmapBossRoster:
+        A boss roster backed by the field, mini and main boss catalog files.
+
+Functions:
+    build_catalog(csv_path, catalog_path, header=None) -> int:
+        Builds a catalog file from a validated ';' separated weapon or boss file, brother!
+
+    build_data_pack(source_path, pack_path):
+        Builds the catalog files of a data pack from a directory of weapon and boss files.
+"""
+
+import csv
+import math
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+import data_bundle
+import dice
+import game_data
+
+
+CATALOG_MAGIC = b'ERMC'     # Marks the start of a catalog file.
+CATALOG_VERSION = 1         # Increase when the layout of the catalog changes.
+CATALOG_EXTENSION = '.catalog'
+
+# The schema of each known header row.
+SCHEMAS = {
+    ('Name', 'Type', 'Attack'): b'ssi',
+    ('Name', 'Health', 'Runes'): b'sii'
+}
+
+_HEADER = struct.Struct('<4sBBxxIQQ')
+_LENGTH = struct.Struct('<H')
+_NUMBER = struct.Struct('<q')
+
+
+def _encode_record(row, schema):
+    """_encode_record Encode the fields of a row following the schema.
+
+    Args:
+        row (tuple): The fields of the row, validated by
+        data_bundle.parse_row().
+        schema (bytes): The type of each field.
+
+    Returns:
+        bytes: The encoded record.
+    """
+    parts = []
+    for kind, value in zip(schema, row):
+        if kind == ord('s'):
+            encoded = value.encode('UTF-8')
+            parts.append(_LENGTH.pack(len(encoded)) + encoded)
+        else:
+            parts.append(_NUMBER.pack(value))
+    return b''.join(parts)
+
+
+def build_catalog(csv_path, catalog_path, header=None):
+    """build_catalog Build a catalog file from a ';' separated weapon or boss
+    file. The rows are streamed to the catalog file, only their names and
+    positions are kept in memory to build the sorted name index. Every row is
+    checked the same way as the game's own data files, see
+    data_bundle.parse_row(), and no catalog file is left behind if any row is
+    invalid.
+
+    Args:
+        csv_path (str): Path of the weapon or boss file to read.
+        catalog_path (str): Path of the catalog file to write.
+        header (list, optional): The header row the file must have, or None to
+        accept any known weapon or boss header. Defaults to None.
+
+    Raises:
+        data_bundle.DataValidationError: If the file's header row is not the
+        expected one or any of its rows are invalid.
+
+    Returns:
+        int: The number of records written.
+    """
+    errors = []
+    try:
+        with open(csv_path, 'r', encoding='UTF-8', newline='') as csv_file, \
+                open(catalog_path, 'wb') as catalog_file:
+            reader = csv.reader(csv_file, delimiter=';')
+            found = tuple(next(reader, ()))
+            if found not in SCHEMAS or (header is not None and list(found) != list(header)):
+                expected = [";".join(header)] if header is not None else \
+                    [";".join(known) for known in SCHEMAS]
+                errors.append(f'{csv_path}: header must be {" or ".join(expected)}')
+            else:
+                schema = SCHEMAS[found]
+                column_types = [str if kind == ord('s') else int for kind in schema]
+
+                # Leave room for the header, it is written once the positions are known.
+                catalog_file.write(bytes(_HEADER.size) + schema)
+
+                names = []
+                offsets = []
+                for line_number, row in enumerate(reader, start=2):
+                    if not row:
+                        continue
+                    values = data_bundle.parse_row(csv_path, line_number, row, found,
+                                                   column_types, errors)
+                    if values is None or errors:
+                        # Keep checking the rest of the file to report every
+                        # problem, but stop writing it.
+                        continue
+                    offsets.append(catalog_file.tell())
+                    names.append(values[0].encode('UTF-8'))
+                    catalog_file.write(_encode_record(values, schema))
+
+                if not offsets and not errors:
+                    errors.append(f'{csv_path}: no rows')
+
+            if not errors:
+                # Align the tables so they can be viewed as arrays of numbers.
+                catalog_file.write(bytes(-catalog_file.tell() % 8))
+                offsets_position = catalog_file.tell()
+                catalog_file.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+
+                # Sort by name, then by record number so the first row for a name
+                # is found first.
+                index = sorted(range(len(names)), key=lambda number: (names[number], number))
+                index_position = catalog_file.tell()
+                catalog_file.write(struct.pack(f'<{len(index)}I', *index))
+
+                catalog_file.seek(0)
+                catalog_file.write(_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(schema),
+                                                len(offsets), offsets_position, index_position))
+    except BaseException:
+        # Never leave a half written catalog file behind.
+        if os.path.exists(catalog_path):
+            os.remove(catalog_path)
+        raise
+
+    if errors:
+        os.remove(catalog_path)
+        raise data_bundle.DataValidationError(errors)
+    return len(offsets)
+
+
+def _check_classes(pack_path, errors):
+    """_check_classes Check that the starting weapons of every class are in
+    the weapon catalogs of a data pack, the same way the game's own weapon
+    files are checked, see data_bundle.check_equipment().
+
+    Args:
+        pack_path (str): The data pack directory.
+        errors (list): List to append any problems found to.
+    """
+    weapons = MmapWeaponCatalog(pack_path)
+    try:
+        for class_name, class_data in sorted(game_data.load_game_data()['classes'].items()):
+            data_bundle.check_equipment(os.path.join('classes', f'{class_name}.json'),
+                                        class_data['Equipment'], weapons, errors)
+    finally:
+        weapons.unupgraded().close()
+        weapons.upgraded().close()
+
+
+def build_data_pack(source_path, pack_path):
+    """build_data_pack Build the catalog files of a data pack from a directory
+    holding the game's weapon and boss files. The files are validated like the
+    game's own data files, and the starting weapons of every class must be in
+    the pack's weapon files. No catalog files are left behind if anything is
+    invalid.
+
+    Args:
+        source_path (str): The directory holding the weapons/ and bosses/
+        directories with the ';' separated files.
+        pack_path (str): The directory to write the data pack to.
+
+    Raises:
+        FileNotFoundError: If one of the weapon or boss files, or one of the
+        game's own data files, does not exist.
+        data_bundle.DataValidationError: If any of the files are invalid.
+
+    Returns:
+        dict: A dictionary of catalog paths to the number of records written.
+    """
+    counts = {}
+    errors = []
+    headers = {os.path.join('weapons', os.path.basename(game_data.UNUPGRADED_WEAPONS_FILE)):
+               data_bundle.WEAPON_HEADER,
+               os.path.join('weapons', os.path.basename(game_data.UPGRADED_WEAPONS_FILE)):
+               data_bundle.WEAPON_HEADER}
+    headers.update((os.path.join('bosses', tier['file']), data_bundle.BOSS_HEADER)
+                   for tier in game_data.BOSS_TIERS.values())
+    try:
+        for name, header in headers.items():
+            catalog_path = os.path.join(pack_path,
+                                        os.path.splitext(name)[0] + CATALOG_EXTENSION)
+            os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
+            try:
+                counts[catalog_path] = build_catalog(os.path.join(source_path, name),
+                                                     catalog_path, header)
+            except data_bundle.DataValidationError as error:
+                errors.extend(error.errors)
+
+        if not errors:
+            _check_classes(pack_path, errors)
+        if errors:
+            raise data_bundle.DataValidationError(errors)
+    except BaseException:
+        # A missing file or an invalid pack leaves no catalog files behind.
+        for catalog_path in counts:
+            os.remove(catalog_path)
+        raise
+    return counts
+
+
+class MmapCatalog(Sequence):
+    """A class used to read a catalog file through mmap. The catalog behaves
+    like a read-only list of its records in file order.
+
+    Attributes
+    ----------
+    _map: mmap.mmap
+        The memory map of the catalog file.
+    _schema: bytes
+        The type of each field.
+    _offsets: memoryview
+        The position of each record in file order.
+    _index: memoryview
+        The record numbers sorted by name.
+    _factory: callable
+        Called with the fields of a record to build the value returned for it.
+        The fields are returned as a tuple if it is None.
+
+    Methods
+    -------
+    get(name)
+        Returns the first record with the given name.
+    random_record()
+        Returns a random record.
+    close()
+        Closes the memory map.
+    """
+
+    def __init__(self, catalog_path, factory=None):
+        with open(catalog_path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, field_count, count, offsets_position, index_position = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            self._map.close()
+            raise ValueError(f'{catalog_path} is not a version {CATALOG_VERSION} catalog file.')
+
+        self._schema = self._map[_HEADER.size:_HEADER.size + field_count]
+        view = memoryview(self._map)
+        self._offsets = view[offsets_position:offsets_position + 8 * count].cast('Q')
+        self._index = view[index_position:index_position + 4 * count].cast('I')
+        view.release()
+        self._factory = factory
+
+    def _make(self, values):
+        """_make Build the value returned for a record from its fields.
+        """
+        return self._factory(*values) if self._factory else tuple(values)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, number):
+        if isinstance(number, slice):
+            return [self[i] for i in range(*number.indices(len(self)))]
+        return self._make(self._read_record(self._offsets[number]))
+
+    def __contains__(self, name):
+        return self._find(name) is not None
+
+    def _read_name(self, offset):
+        """_read_name Read the name, the first field, of the record at the
+        given position.
+        """
+        (length,) = _LENGTH.unpack_from(self._map, offset)
+        return self._map[offset + 2:offset + 2 + length]
+
+    def _read_record(self, offset):
+        """_read_record Read every field of the record at the given position.
+        """
+        values = []
+        for kind in self._schema:
+            if kind == ord('s'):
+                (length,) = _LENGTH.unpack_from(self._map, offset)
+                values.append(self._map[offset + 2:offset + 2 + length].decode('UTF-8'))
+                offset += 2 + length
+            else:
+                values.append(_NUMBER.unpack_from(self._map, offset)[0])
+                offset += 8
+        return values
+
+    def _find(self, name):
+        """_find Binary search the name index for the first record with the
+        given name.
+
+        Returns:
+            int: The position of the record, or None if there is no record with
+            the given name.
+        """
+        target = name.encode('UTF-8')
+        low, high = 0, len(self._index)
+        while low < high:
+            middle = (low + high) // 2
+            if self._read_name(self._offsets[self._index[middle]]) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._index):
+            offset = self._offsets[self._index[low]]
+            if self._read_name(offset) == target:
+                return offset
+        return None
+
+    def get(self, name):
+        """get Return the first record with the given name.
+
+        Args:
+            name (str): The name to look up.
+
+        Raises:
+            KeyError: If there is no record with the given name.
+
+        Returns:
+            The record built by the catalog's factory.
+        """
+        offset = self._find(name)
+        if offset is None:
+            raise KeyError(name)
+        return self._make(self._read_record(offset))
+
+    def random_record(self):
+        """random_record Return a random record. Every record is equally likely.
+
+        Raises:
+            IndexError: If the catalog is empty.
+
+        Returns:
+            The record built by the catalog's factory.
+        """
+        if not self:
+            raise IndexError('The catalog is empty.')
+        return self[dice.randbelow(len(self))]
+
+    def close(self):
+        """close Close the memory map of the catalog file.
+        """
+        self._offsets.release()
+        self._index.release()
+        self._map.close()
+
+
+class MmapWeaponCatalog:
+    """A class used in place of game_data.WeaponCatalog for data packs. The
+    weapons are looked up in the unupgraded and then the fully upgraded weapon
+    catalog files.
+
+    Attributes
+    ----------
+    _unupgraded: MmapCatalog
+        The unupgraded weapon catalog.
+    _upgraded: MmapCatalog
+        The fully upgraded weapon catalog.
+
+    Methods
+    -------
+    get(name)
+        Returns the weapon with the given name.
+    unupgraded()
+        Returns the unupgraded weapon catalog.
+    upgraded()
+        Returns the fully upgraded weapon catalog.
+    random_weapon(upgraded=False)
+        Returns a random weapon from one of the weapon catalogs.
+    """
+
+    def __init__(self, pack_path):
+        weapons_path = os.path.join(pack_path, 'weapons')
+        self._unupgraded = MmapCatalog(os.path.join(weapons_path, os.path.splitext(
+            os.path.basename(game_data.UNUPGRADED_WEAPONS_FILE))[0] + CATALOG_EXTENSION),
+                                       game_data.Weapon)
+        self._upgraded = MmapCatalog(os.path.join(weapons_path, os.path.splitext(
+            os.path.basename(game_data.UPGRADED_WEAPONS_FILE))[0] + CATALOG_EXTENSION),
+                                     game_data.Weapon)
+
+    def __contains__(self, name):
+        return name in self._unupgraded or name in self._upgraded
+
+    def __len__(self):
+        return len(self._unupgraded) + len(self._upgraded)
+
+    def get(self, name):
+        """get Return the weapon with the given name.
+
+        Args:
+            name (str): The name of the weapon.
+
+        Raises:
+            KeyError: If there is no weapon with the given name.
+
+        Returns:
+            game_data.Weapon: The weapon's name, type and attack.
+        """
+        try:
+            return self._unupgraded.get(name)
+        except KeyError:
+            return self._upgraded.get(name)
+
+    def unupgraded(self):
+        """unupgraded Return the unupgraded weapon catalog.
+
+        Returns:
+            MmapCatalog: Read-only list of game_data.Weapon tuples.
+        """
+        return self._unupgraded
+
+    def upgraded(self):
+        """upgraded Return the fully upgraded weapon catalog.
+
+        Returns:
+            MmapCatalog: Read-only list of game_data.Weapon tuples.
+        """
+        return self._upgraded
+
+    def random_weapon(self, upgraded=False):
+        """random_weapon Return a random weapon from the unupgraded or the fully
+        upgraded weapon catalog.
+
+        Args:
+            upgraded (bool, optional): Determines if the weapon should come from
+            the fully upgraded weapon catalog. Defaults to False.
+
+        Returns:
+            game_data.Weapon: The weapon's name, type and attack.
+        """
+        return (self._upgraded if upgraded else self._unupgraded).random_record()
+
+
+class MmapBossRoster:
+    """A class used in place of game_data.BossRoster for data packs. The tier's
+    health divisor, attack and armor are applied as each boss is read.
+
+    Attributes
+    ----------
+    _tiers: dict
+        A dictionary of tier names to their MmapCatalog.
+
+    Methods
+    -------
+    bosses(tier)
+        Returns the boss catalog of the tier.
+    get(tier, name)
+        Returns the boss with the given name from the tier.
+    random_boss(tier)
+        Returns a random boss from the tier.
+    """
+
+    def __init__(self, pack_path, tiers=None):
+        if tiers is None:
+            tiers = game_data.BOSS_TIERS
+
+        self._tiers = {}
+        for tier, settings in tiers.items():
+            def factory(name, health, runes, settings=settings):
+                return game_data.BossEntry(name, math.ceil(health / settings['health_divisor']),
+                                           runes, settings['attack'], settings['armor'])
+            catalog_path = os.path.join(pack_path, 'bosses', os.path.splitext(
+                settings['file'])[0] + CATALOG_EXTENSION)
+            self._tiers[tier] = MmapCatalog(catalog_path, factory)
+
+    def bosses(self, tier):
+        """bosses Return the boss catalog of the given tier.
+
+        Args:
+            tier (str): The boss tier, e.g. 'field', 'mini' or 'main'.
+
+        Returns:
+            MmapCatalog: Read-only list of game_data.BossEntry tuples.
+        """
+        return self._tiers[tier]
+
+    def get(self, tier, name):
+        """get Return the boss with the given name from the given tier.
+
+        Args:
+            tier (str): The boss tier, e.g. 'field', 'mini' or 'main'.
+            name (str): The name of the boss.
+
+        Raises:
+            KeyError: If there is no boss with the given name in the tier.
+
+        Returns:
+            game_data.BossEntry: The boss' name, health, runes, attack and armor.
+        """
+        return self._tiers[tier].get(name)
+
+    def random_boss(self, tier):
+        """random_boss Return a random boss from the given tier.
+
+        Args:
+            tier (str): The boss tier, e.g. 'field', 'mini' or 'main'.
+
+        Raises:
+            IndexError: If the tier has no bosses.
+
+        Returns:
+            game_data.BossEntry: The boss' name, health, runes, attack and armor.
+        """
+        return self._tiers[tier].random_record()
+
+
+def main():
+    """main Build a data pack from a directory holding weapons/ and bosses/
+    directories with ';' separated files.
+    """
+    if len(sys.argv) != 3:
+        print('Usage: python mmap_catalog.py SOURCE_DIRECTORY DATA_PACK_DIRECTORY')
+        sys.exit(1)
+
+    try:
+        counts = build_data_pack(sys.argv[1], sys.argv[2])
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        sys.exit(1)
+    except data_bundle.DataValidationError as error:
+        print(f'\n{error}\nExiting...')
+        sys.exit(1)
+
+    for catalog_path, count in counts.items():
+        print(f'{catalog_path}: {count} records')
+
+
+if __name__ == "__main__":
+    main()
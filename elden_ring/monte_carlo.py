@@ -0,0 +1,589 @@
+"""
+monte_carlo.py
+
+Listen up, brother! This module estimates win probabilities by simulating millions of solo boss fights at
+once with NumPy. Every fight is a slot in a set of arrays holding the player's and the boss' health,
+attack and armor. Each round resolves the player's attack and the boss' counter-attack for every fight
+still going with the same rules and damage tables as fight_engine.py: a d20 against the target's armor
+and, on a hit, math.ceil(attack * (d10 / 10)) damage. Fights that are over are dropped from the arrays
+as it goes.
+
+Run it from the elden_ring directory to print or save the win rates of every starting class against
+every boss in the boss lists:
+
+    python monte_carlo.py [SAMPLES] [OUTPUT_FILE.csv]
+
+Queries can also ask for a precision or a time budget instead of a number of samples, e.g. a win rate
+to within 0.5% at 95% confidence, or the best estimate in 50 ms. The fights are then drawn in batches
+until the confidence interval is narrow enough or the time is up, and when many matchups are estimated
+together the easy ones stop early so the later batches go to the close calls.
+
+Two loadouts of the same player, e.g. keeping the current Right Hand or equipping a drop, are compared on
+common random numbers: both fight the boss with the same dice outcomes in every fight, round after round,
+so the noise that both share cancels out of the difference. Antithetic pairs go further by fighting every
+set of dice a second time with each d20 and d10 turned upside down. The difference in win rate comes with
+a confidence interval from the paired fights, and needs far fewer fights for the same precision than
+simulating the two loadouts apart.
+
+NumPy is only needed for this module, it is never imported by the game itself.
+
+Classes:
+    Simulation:
+        A named tuple holding the outcome arrays of a batch of simulated fights.
+
+    MatrixRow:
+        A named tuple holding the win rates of every class against a single boss.
+
+    Estimate:
+        A named tuple holding a win rate estimate with its confidence interval.
+
+    Comparison:
+        A named tuple holding the difference in win rate between two loadouts.
+
+Functions:
+    simulate_fights(player_health, player_attack, player_armor, boss_health, boss_attack, boss_armor,
+                    seed=None) -> Simulation:
+        Simulates a batch of independent solo fights at once, brother!
+
+    class_fighters() -> list:
+        Returns a fight_engine.Fighter for every starting class at full health.
+
+    boss_rows() -> list:
+        Returns the tier, row number and entry of every boss in the boss lists.
+
+    win_rates(matchups, samples=10000, seed=None) -> list:
+        Returns the win rate of every player and boss pairing, brother!
+
+    win_matrix(samples=10000, seed=None) -> list:
+        Returns the win rates of every starting class against every boss, brother!
+
+    wilson_interval(wins, samples, confidence=0.95) -> tuple:
+        Returns the Wilson score confidence interval of a win rate.
+
+    estimate_win_rates(matchups, margin=0.005, confidence=0.95, time_budget=None,
+                       max_samples=MAX_SAMPLES, seed=None) -> list:
+        Estimates the win rate of every pairing to a margin or within a time budget, brother!
+
+    estimate_win_rate(player, boss, margin=0.005, confidence=0.95, time_budget=None,
+                      max_samples=MAX_SAMPLES, seed=None) -> Estimate:
+        Estimates the win rate of a single pairing to a margin or within a time budget, brother!
+
+    compare_fighters(first, second, boss, samples=10000, antithetic=False, confidence=0.95,
+                     seed=None) -> Comparison:
+        Compares the win rates of two versions of a player on common random numbers, brother!
+
+    compare_loadouts(player_obj, weapon_name, hand, boss, samples=10000, antithetic=False,
+                     confidence=0.95, seed=None) -> Comparison:
+        Compares a player's current loadout against equipping a weapon, brother!
+
+    main():
+        Prints the win rate matrix or writes it to a ';' separated file.
+"""
+
+import copy
+import math
+import statistics
+import sys
+import time
+from collections import namedtuple
+import character
+import fight_engine
+import game_data
+
+
+CHUNK_FIGHTS = 2000000    # Largest number of fights simulated at once.
+MIN_BATCH = 1000          # Fewest fights simulated for a pairing in each batch.
+MAX_SAMPLES = 10000000    # Most fights simulated for a pairing by an estimate.
+
+# won: a boolean array, True where the player felled the boss. rounds: an
+# integer array of the number of rounds each fight lasted.
+Simulation = namedtuple('Simulation', ['won', 'rounds'])
+
+# tier: 'field', 'mini' or 'main'. row: the row of the boss in its boss list,
+# since some boss names appear more than once. name: the boss' name. health:
+# the boss' scaled health. win_rates: a dictionary of class names to the
+# chance of felling the boss with a fresh character of that class.
+MatrixRow = namedtuple('MatrixRow', ['tier', 'row', 'name', 'health', 'win_rates'])
+
+# win_rate: the share of fights won. low and high: the confidence interval of
+# the win rate. samples: the number of fights simulated. converged: True if
+# the interval is within the margin asked for, False if the time budget or
+# the sample limit ran out first.
+Estimate = namedtuple('Estimate', ['win_rate', 'low', 'high', 'samples', 'converged'])
+
+# difference: the second win rate minus the first. low and high: the
+# confidence interval of the difference. first and second: the win rates of
+# each. samples: the number of fights simulated for each.
+Comparison = namedtuple('Comparison', ['difference', 'low', 'high', 'first', 'second', 'samples'])
+
+
+def simulate_fights(player_health, player_attack, player_armor,
+                    boss_health, boss_attack, boss_armor, seed=None):
+    """simulate_fights Simulate a batch of independent solo fights at once.
+    Each argument is a number or an array with one value per fight, and they
+    are broadcast against each other. The player attacks first every round,
+    and the boss hits back if it is still standing.
+
+    Args:
+        player_health (int or array): The players' starting health.
+        player_attack (int or array): The players' attack ratings.
+        player_armor (int or array): The players' armor.
+        boss_health (int or array): The bosses' starting health.
+        boss_attack (int or array): The bosses' attack.
+        boss_armor (int or array): The bosses' armor.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+
+    Returns:
+        Simulation: The outcome arrays of the fights.
+    """
+    import numpy as np
+
+    generator = np.random.default_rng(seed)
+    arrays = np.broadcast_arrays(player_health, player_attack, player_armor,
+                                 boss_health, boss_attack, boss_armor)
+    columns = [np.asarray(array, dtype=np.int64).ravel() for array in arrays]
+
+    # Every distinct attack and armor pairing gets a row of the damage tables
+    # from fight_engine.py, so an attack is one outcome from 0 to 199 looked
+    # up in the table of its fight.
+    stats = columns[1:3] + columns[4:6]
+    dims = [int(column.max(initial=0)) + 1 for column in stats]
+    keys, matchup = np.unique(np.ravel_multi_index(stats, dims), return_inverse=True)
+    matchups = np.stack(np.unravel_index(keys, dims), axis=1).tolist()
+    player_tables = np.array([fight_engine.damage_table(attack, boss_armor)
+                              for attack, _, _, boss_armor in matchups]).ravel()
+    boss_tables = np.array([fight_engine.damage_table(boss_attack, armor)
+                            for _, armor, boss_attack, _ in matchups]).ravel()
+    # Each fight's offset into the flattened tables.
+    matchup = matchup.ravel() * fight_engine.OUTCOMES
+
+    # The working arrays only hold the fights that are still going, with
+    # fight telling which fight each slot belongs to.
+    p_health = columns[0].copy()
+    b_health = columns[3].copy()
+    fight = np.arange(p_health.size)
+    won = np.zeros(p_health.size, dtype=bool)
+    rounds = np.zeros(p_health.size, dtype=np.int64)
+    turn = 0
+
+    while fight.size:
+        turn += 1
+
+        # Player attack phase.
+        b_health -= player_tables[matchup + generator.integers(0, fight_engine.OUTCOMES,
+                                                               size=fight.size)]
+        alive = b_health > 0
+        won[fight[~alive]] = True
+        rounds[fight[~alive]] = turn
+        p_health, b_health, matchup, fight = (
+            p_health[alive], b_health[alive], matchup[alive], fight[alive])
+
+        # Boss attack phase.
+        p_health -= boss_tables[matchup + generator.integers(0, fight_engine.OUTCOMES,
+                                                             size=fight.size)]
+        alive = p_health > 0
+        rounds[fight[~alive]] = turn
+        p_health, b_health, matchup, fight = (
+            p_health[alive], b_health[alive], matchup[alive], fight[alive])
+
+    shape = arrays[0].shape
+    return Simulation(won.reshape(shape), rounds.reshape(shape))
+
+
+def class_fighters():
+    """class_fighters Return every starting class at full health, in the order
+    of character.CLASSES.
+
+    Returns:
+        list: A fight_engine.Fighter for each class.
+    """
+    return [fight_engine.from_character(character.Character.get_template(name))
+            for name in character.CLASSES]
+
+
+def boss_rows():
+    """boss_rows Return every boss in the field, mini and main boss lists.
+
+    Returns:
+        list: The tier, row number and game_data.BossEntry of each boss.
+    """
+    roster = game_data.get_boss_roster()
+    return [(tier, row, entry)
+            for tier in game_data.BOSS_TIERS
+            for row, entry in enumerate(roster.bosses(tier))]
+
+
+def win_rates(matchups, samples=10000, seed=None):
+    """win_rates Estimate the chance of the player felling the boss in every
+    pairing of a list, from the player's and the boss' current health.
+
+    Args:
+        matchups (list): A list of (player, boss) pairs of fight_engine.Fighters.
+        samples (int, optional): The number of fights simulated for every
+        pairing. Defaults to 10000.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+
+    Returns:
+        list: The win rate of each pairing, in the order of matchups.
+    """
+    import numpy as np
+
+    generator = np.random.default_rng(seed)
+    # Every pairing gets samples slots, and the pairings are simulated in
+    # chunks to keep the arrays at a reasonable size.
+    per_chunk = max(1, CHUNK_FIGHTS // samples)
+    rates = []
+
+    for start in range(0, len(matchups), per_chunk):
+        chunk = matchups[start:start + per_chunk]
+        columns = [np.repeat([getattr(player, field) for player, _ in chunk], samples)
+                   for field in ('health', 'attack', 'armor')]
+        columns += [np.repeat([getattr(boss, field) for _, boss in chunk], samples)
+                    for field in ('health', 'attack', 'armor')]
+        won = simulate_fights(*columns, seed=generator).won.reshape(len(chunk), samples)
+        rates.extend(won.mean(axis=1).tolist())
+    return rates
+
+
+def win_matrix(samples=10000, seed=None):
+    """win_matrix Estimate the chance of every starting class felling every
+    boss in the boss lists, from a fresh character at full health.
+
+    Args:
+        samples (int, optional): The number of fights simulated for every
+        class and boss. Defaults to 10000.
+        seed (int, optional): The seed to roll with. Seeded by the OS if None.
+        Defaults to None.
+
+    Returns:
+        list: A MatrixRow for every boss, in the order of boss_rows().
+    """
+    fighters = class_fighters()
+    bosses = boss_rows()
+    matchups = [(player, fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor))
+                for _, _, entry in bosses for player in fighters]
+    rates = win_rates(matchups, samples, seed)
+
+    return [MatrixRow(tier, row, entry.name, entry.health,
+                      dict(zip(character.CLASSES, rates[index * len(fighters):
+                                                        (index + 1) * len(fighters)])))
+            for index, (tier, row, entry) in enumerate(bosses)]
+
+
+def wilson_interval(wins, samples, confidence=0.95):
+    """wilson_interval Return the Wilson score confidence interval of a win
+    rate. Unlike the usual normal interval it stays inside 0 to 1 and does not
+    shrink to nothing when every fight is won or lost.
+
+    Args:
+        wins (int): The number of fights won.
+        samples (int): The number of fights simulated.
+        confidence (float, optional): The confidence level. Defaults to 0.95.
+
+    Returns:
+        tuple: The low and high ends of the interval.
+    """
+    if not samples:
+        return 0.0, 1.0
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = wins / samples
+    scale = 1 + z * z / samples
+    center = (rate + z * z / (2 * samples)) / scale
+    spread = z * math.sqrt(rate * (1 - rate) / samples + z * z / (4 * samples * samples)) / scale
+    low = 0.0 if wins == 0 else max(center - spread, 0.0)
+    high = 1.0 if wins == samples else min(center + spread, 1.0)
+    return low, high
+
+
+def _within(wins, samples, margin, confidence):
+    """_within Return True if the confidence interval of a win rate is no wider
+    than the margin on either side.
+    """
+    low, high = wilson_interval(wins, samples, confidence)
+    return high - low <= 2 * margin
+
+
+def _batch_size(wins, samples, margin, z):
+    """_batch_size Return the number of fights to simulate next for a pairing:
+    about as many as the current win rate says are still needed to reach the
+    margin, but at least MIN_BATCH and at most as many as so far.
+    """
+    rate = (wins + 1) / (samples + 2)
+    needed = math.ceil(z * z * rate * (1 - rate) / (margin * margin))
+    return max(MIN_BATCH, min(needed - samples, samples))
+
+
+def estimate_win_rates(matchups, margin=0.005, confidence=0.95, time_budget=None,
+                       max_samples=MAX_SAMPLES, seed=None):
+    """estimate_win_rates Estimate the chance of the player felling the boss in
+    every pairing of a list, from the player's and the boss' current health.
+    The fights are simulated in batches, every pairing still short of the
+    margin getting a batch sized to what it still needs, until each pairing's
+    confidence interval is within the margin or the time budget runs out.
+
+    Args:
+        matchups (list): A list of (player, boss) pairs of fight_engine.Fighters.
+        margin (float, optional): The largest half-width of the confidence
+        interval, e.g. 0.005 for +-0.5%. Defaults to 0.005.
+        confidence (float, optional): The confidence level. Defaults to 0.95.
+        time_budget (float, optional): The most seconds to spend, or None for
+        no limit. At least one small batch is always simulated. Defaults to
+        None.
+        max_samples (int, optional): The most fights to simulate for a
+        pairing. Defaults to MAX_SAMPLES.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+
+    Returns:
+        list: An Estimate for each pairing, in the order of matchups.
+    """
+    import numpy as np
+
+    start = time.perf_counter()
+    generator = np.random.default_rng(seed)
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    wins = [0] * len(matchups)
+    samples = [0] * len(matchups)
+    open_matchups = list(range(len(matchups)))
+    fights_per_second = None
+
+    while open_matchups:
+        batch_start = time.perf_counter()
+        batches = [min(_batch_size(wins[index], samples[index], margin, z),
+                       max_samples - samples[index]) for index in open_matchups]
+
+        # Shrink the batches to what fits in the time left, going by how fast
+        # the last batch ran. The first batch under a time budget is a small
+        # one to see how fast the fights run.
+        if time_budget is not None and fights_per_second is None:
+            batches = [max(1, MIN_BATCH // len(open_matchups))] * len(open_matchups)
+        elif time_budget is not None:
+            left = time_budget - (time.perf_counter() - start)
+            fits = int(left * fights_per_second)
+            if fits < len(open_matchups):
+                break
+            if fits < sum(batches):
+                batches = [max(1, batch * fits // sum(batches)) for batch in batches]
+        batches = [min(batch, CHUNK_FIGHTS) for batch in batches]
+
+        # Simulate the batches of the open pairings together, in chunks to
+        # keep the arrays at a reasonable size.
+        first = 0
+        while first < len(open_matchups):
+            last = first + 1
+            total = batches[first]
+            while last < len(open_matchups) and total + batches[last] <= CHUNK_FIGHTS:
+                total += batches[last]
+                last += 1
+            chunk = open_matchups[first:last]
+            counts = batches[first:last]
+            columns = [np.repeat([getattr(matchups[index][0], field) for index in chunk], counts)
+                       for field in ('health', 'attack', 'armor')]
+            columns += [np.repeat([getattr(matchups[index][1], field) for index in chunk], counts)
+                        for field in ('health', 'attack', 'armor')]
+            won = simulate_fights(*columns, seed=generator).won
+            chunk_wins = np.add.reduceat(won, np.cumsum([0] + counts[:-1])).tolist()
+            for index, count, chunk_won in zip(chunk, counts, chunk_wins):
+                wins[index] += int(chunk_won)
+                samples[index] += count
+            first = last
+
+        # Pairings within the margin or out of samples are done.
+        open_matchups = [index for index in open_matchups
+                         if samples[index] < max_samples
+                         and not _within(wins[index], samples[index], margin, confidence)]
+        fights_per_second = sum(batches) / max(time.perf_counter() - batch_start, 1e-9)
+        if time_budget is not None and time.perf_counter() - start >= time_budget:
+            break
+
+    estimates = []
+    for index in range(len(matchups)):
+        low, high = wilson_interval(wins[index], samples[index], confidence)
+        estimates.append(Estimate(wins[index] / samples[index], low, high, samples[index],
+                                  _within(wins[index], samples[index], margin, confidence)))
+    return estimates
+
+
+def estimate_win_rate(player, boss, margin=0.005, confidence=0.95, time_budget=None,
+                      max_samples=MAX_SAMPLES, seed=None):
+    """estimate_win_rate Estimate the chance of the player felling the boss,
+    from the player's and the boss' current health, to within a margin or
+    within a time budget. See estimate_win_rates().
+
+    Args:
+        player (fight_engine.Fighter): The Fighter of the player.
+        boss (fight_engine.Fighter): The Fighter of the boss.
+        margin (float, optional): The largest half-width of the confidence
+        interval, e.g. 0.005 for +-0.5%. Defaults to 0.005.
+        confidence (float, optional): The confidence level. Defaults to 0.95.
+        time_budget (float, optional): The most seconds to spend, or None for
+        no limit. Defaults to None.
+        max_samples (int, optional): The most fights to simulate. Defaults to
+        MAX_SAMPLES.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+
+    Returns:
+        Estimate: The win rate estimate.
+    """
+    return estimate_win_rates([(player, boss)], margin, confidence, time_budget,
+                              max_samples, seed)[0]
+
+
+def _common_fights(players, boss, pairs, streams, generator):
+    """_common_fights Simulate every player against the boss on the same dice.
+    Every pair gets one d20 and d10 outcome for the players' attacks and one
+    for the boss' attacks each round, and with two streams the second fight
+    of the pair rolls each outcome upside down. Returns a boolean array of
+    shape (players, streams, pairs), True where the player felled the boss.
+    """
+    import numpy as np
+
+    player_tables = np.array([fight_engine.damage_table(player.attack, boss.armor)
+                              for player in players])
+    boss_tables = np.array([fight_engine.damage_table(boss.attack, player.armor)
+                            for player in players])
+    shape = (len(players), streams, pairs)
+    p_health = np.broadcast_to(np.array([player.health for player in players],
+                                        dtype=np.int64)[:, None, None], shape).copy()
+    b_health = np.full(shape, boss.health, dtype=np.int64)
+    going = (p_health > 0) & (b_health > 0)
+    won = b_health <= 0
+    # The working arrays only hold the pairs with a fight still going, with
+    # pair telling which pair each slot belongs to.
+    pair = np.arange(pairs)
+
+    while pair.size:
+        # Player attack phase.
+        rolls = generator.integers(0, fight_engine.OUTCOMES, size=pair.size)
+        outcomes = np.stack([rolls, fight_engine.OUTCOMES - 1 - rolls])[:streams]
+        b_health -= np.where(going, player_tables[:, outcomes], 0)
+        felled = going & (b_health <= 0)
+        won[:, :, pair] |= felled
+        going &= ~felled
+
+        # Boss attack phase.
+        rolls = generator.integers(0, fight_engine.OUTCOMES, size=pair.size)
+        outcomes = np.stack([rolls, fight_engine.OUTCOMES - 1 - rolls])[:streams]
+        p_health -= np.where(going, boss_tables[:, outcomes], 0)
+        going &= p_health > 0
+
+        keep = going.any(axis=(0, 1))
+        p_health, b_health, going, pair = (
+            p_health[:, :, keep], b_health[:, :, keep], going[:, :, keep], pair[keep])
+
+    return won
+
+
+def compare_fighters(first, second, boss, samples=10000, antithetic=False, confidence=0.95,
+                     seed=None):
+    """compare_fighters Compare the chance of two versions of a player felling
+    the boss, from their current health. Both fight with the same dice in
+    every fight, so the difference is far less noisy than from two separate
+    estimates.
+
+    Args:
+        first (fight_engine.Fighter): The first version of the player.
+        second (fight_engine.Fighter): The second version of the player.
+        boss (fight_engine.Fighter): The Fighter of the boss.
+        samples (int, optional): The number of fights simulated for each
+        version, rounded up to an even number with antithetic pairs. Defaults
+        to 10000.
+        antithetic (bool, optional): If True, every set of dice is fought a
+        second time rolled upside down. Defaults to False.
+        confidence (float, optional): The confidence level of the interval.
+        Defaults to 0.95.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+
+    Raises:
+        ValueError: If there are fewer than 2 samples to compare.
+
+    Returns:
+        Comparison: The difference in win rate and its confidence interval.
+    """
+    import numpy as np
+
+    streams = 2 if antithetic else 1
+    pairs = -(-samples // streams)
+    if pairs < 2:
+        raise ValueError('A comparison takes at least 2 samples')
+
+    generator = np.random.default_rng(seed)
+    won = _common_fights([first, second], boss, pairs, streams, generator)
+
+    # The fights of an antithetic pair are not independent, so every pair
+    # counts as a single sample of the difference.
+    differences = (won[1].astype(np.float64) - won[0]).mean(axis=0)
+    difference = float(differences.mean())
+    spread = (statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+              * float(differences.std(ddof=1)) / math.sqrt(pairs))
+    return Comparison(difference, max(difference - spread, -1.0), min(difference + spread, 1.0),
+                      float(won[0].mean()), float(won[1].mean()), pairs * streams)
+
+
+def compare_loadouts(player_obj, weapon_name, hand, boss, samples=10000, antithetic=False,
+                     confidence=0.95, seed=None):
+    """compare_loadouts Compare the chance of a player felling the boss with
+    their current loadout against equipping a weapon, from their current
+    health. Both the attack and the armor of the new loadout are compared, so
+    a weapon in place of a shield also loses the shield's armor. The player
+    is not changed. See compare_fighters().
+
+    Args:
+        player_obj (character.Character): The player.
+        weapon_name (str): The name of the weapon or shield to equip.
+        hand (str): 'Right Hand' or 'Left Hand'.
+        boss (fight_engine.Fighter or boss.Boss): The boss.
+        samples (int, optional): The number of fights simulated for each
+        loadout. Defaults to 10000.
+        antithetic (bool, optional): If True, every set of dice is fought a
+        second time rolled upside down. Defaults to False.
+        confidence (float, optional): The confidence level of the interval.
+        Defaults to 0.95.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+
+    Returns:
+        Comparison: The win rate with the weapon equipped minus the win rate
+        with the current loadout, and its confidence interval.
+    """
+    equipped = copy.deepcopy(player_obj)
+    equipped.equip(weapon_name, hand)
+    if not isinstance(boss, fight_engine.Fighter):
+        boss = fight_engine.from_boss(boss)
+    return compare_fighters(fight_engine.from_character(player_obj),
+                            fight_engine.from_character(equipped), boss, samples,
+                            antithetic, confidence, seed)
+
+
+def main():
+    """main Print the win rate of every starting class against every boss, or
+    write them to a ';' separated file if a file name is given.
+    """
+    try:
+        samples = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    except ValueError:
+        print('Usage: python monte_carlo.py [SAMPLES] [OUTPUT_FILE.csv]')
+        sys.exit(1)
+
+    matrix = win_matrix(samples)
+    lines = [';'.join(['Tier', 'Row', 'Name', 'Health'] + character.CLASSES)]
+    for matrix_row in matrix:
+        lines.append(';'.join([matrix_row.tier, str(matrix_row.row), matrix_row.name,
+                               str(matrix_row.health)] +
+                              [f'{matrix_row.win_rates[name]:.4f}' for name in character.CLASSES]))
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], 'w', encoding='UTF-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        print(f'Win rates of {len(character.CLASSES)} classes against {len(matrix)} bosses '
+              f'written to {sys.argv[2]}')
+    else:
+        print('\n'.join(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+pacing.py
+
+Listen up, brother! This module is the one place the Elden Ring CLI game waits from. battles.py, boss.py,
+character.py and elden_ring.py all pause through here to let the players read the rolls and the messages,
+so a whole session can be switched to run without any pauses in one call.
+
+Modes:
+    normal:
+        Sleeps for every pause with time.sleep. This is the default.
+
+    turbo:
+        Skips every pause, for demos and automated runs.
+
+    virtual:
+        Skips every pause but records it on a virtual clock, so tests can check the pauses the game
+        asked for and how long a session would have taken.
+
+The mode can also be chosen before the game starts with the ELDEN_RING_PACING environment variable,
+e.g. ELDEN_RING_PACING=turbo python elden_ring.py, or with the --turbo option of elden_ring.py.
+A value that cannot be used prints a warning and falls back to the 'normal' mode.
+
+Classes:
+    RealClock:
+        A clock that sleeps for every pause, or skips them in turbo mode.
+
+    VirtualClock:
+        A clock that records every pause on a virtual time line without sleeping.
+
+Functions:
+    set_mode(mode='normal'):
+        Switches every pause in the game to the given mode, brother!
+
+    set_clock(clock):
+        Switches every pause in the game to a clock of your own.
+
+    get_mode() -> str:
+        Returns the name of the current mode.
+
+    sleep(seconds):
+        Pauses the game for the given number of seconds, brother!
+
+    elapsed() -> float:
+        Returns the seconds the game has spent paused on the virtual clock.
+
+    delays() -> list:
+        Returns every pause recorded on the virtual clock.
+"""
+
+import os
+import sys
+import time
+
+
+MODES = ['normal', 'turbo', 'virtual']
+PACING_ENV = 'ELDEN_RING_PACING'
+
+
+class RealClock:
+    """A class used to pause the game with time.sleep.
+
+    Attributes
+    ----------
+    name: str
+        The name of the mode, 'normal' or 'turbo'.
+    _scale: float
+        The factor every pause is multiplied by, 0 in turbo mode.
+
+    Methods
+    -------
+    sleep(seconds)
+        Pauses for the given number of seconds.
+    """
+
+    def __init__(self, name, scale=1.0):
+        self.name = name
+        self._scale = scale
+
+    def sleep(self, seconds):
+        if self._scale and seconds > 0:
+            time.sleep(seconds * self._scale)
+
+
+class VirtualClock:
+    """A class used to record the pauses of the game on a virtual time line
+    without sleeping.
+
+    Attributes
+    ----------
+    name: str
+        The name of the mode, 'virtual'.
+    elapsed: float
+        The sum of every pause recorded, in seconds.
+    delays: list
+        Every pause recorded, in the order they were asked for.
+
+    Methods
+    -------
+    sleep(seconds)
+        Records a pause of the given number of seconds.
+    reset()
+        Clears every pause recorded.
+    """
+
+    def __init__(self):
+        self.name = 'virtual'
+        self.elapsed = 0.0
+        self.delays = []
+
+    def sleep(self, seconds):
+        self.delays.append(seconds)
+        self.elapsed += seconds
+
+    def reset(self):
+        self.elapsed = 0.0
+        self.delays = []
+
+
+def _make_clock(mode):
+    """_make_clock Create the clock of the given mode.
+
+    Args:
+        mode (str): The name of the mode.
+
+    Raises:
+        ValueError: If the mode is not known.
+
+    Returns:
+        RealClock or VirtualClock: The new clock.
+    """
+    if mode == 'normal':
+        return RealClock(mode)
+    if mode == 'turbo':
+        return RealClock(mode, 0.0)
+    if mode == 'virtual':
+        return VirtualClock()
+    raise ValueError(f'Unknown pacing mode: {mode}. Choose from {", ".join(MODES)}.')
+
+
+def _clock_from_environment():
+    """_clock_from_environment Create the clock named by the ELDEN_RING_PACING
+    environment variable, falling back to the 'normal' mode. A warning naming
+    the bad value is printed if the variable cannot be used.
+    """
+    mode = os.environ.get(PACING_ENV, 'normal')
+    try:
+        return _make_clock(mode)
+    except ValueError as error:
+        print(f"Warning: {PACING_ENV}={mode} cannot be used ({error}), "
+              "using the 'normal' mode instead.", file=sys.stderr)
+        return _make_clock('normal')
+
+
+_clock = _clock_from_environment()    # The clock used for every pause.
+
+
+def set_mode(mode='normal'):
+    """set_mode Switch every pause in the game to the given mode. Switching to
+    'virtual' starts a fresh virtual clock.
+
+    Args:
+        mode (str, optional): 'normal', 'turbo' or 'virtual'. Defaults to
+        'normal'.
+
+    Raises:
+        ValueError: If the mode is not known.
+    """
+    global _clock
+
+    _clock = _make_clock(mode)
+
+
+def set_clock(clock):
+    """set_clock Switch every pause in the game to a clock of your own, any
+    object with a name attribute and a sleep(seconds) method.
+
+    Args:
+        clock (object): The clock.
+    """
+    global _clock
+
+    _clock = clock
+
+
+def get_mode():
+    """get_mode Return the name of the current mode.
+
+    Returns:
+        str: The name of the mode, or of the clock set with set_clock().
+    """
+    return _clock.name
+
+
+def sleep(seconds):
+    """sleep Pause the game for the given number of seconds with the current
+    clock.
+
+    Args:
+        seconds (float): The length of the pause.
+    """
+    _clock.sleep(seconds)
+
+
+def elapsed():
+    """elapsed Return the seconds the game has spent paused on the virtual
+    clock.
+
+    Returns:
+        float: The seconds paused, 0 if the clock is not virtual.
+    """
+    return getattr(_clock, 'elapsed', 0.0)
+
+
+def delays():
+    """delays Return every pause recorded on the virtual clock.
+
+    Returns:
+        list: The pauses in seconds in the order they were asked for, empty if
+        the clock is not virtual.
+    """
+    return list(getattr(_clock, 'delays', []))
+
+
+if __name__ == "__main__":
+    print("This module is to be imported by battles.py, boss.py, character.py and elden_ring.py.")
@@ -0,0 +1,229 @@
+"""
+raid.py
+
+Listen up, brother! This module runs world boss raids: thousands of players against a single main boss
+with the same d20 and d10 rules and turn order as fight_engine.py and battles.py. Every raider still
+standing takes a turn each round in raider order, with the boss hitting back after every attack that does
+not fell it. A raid goes on until the boss or every raider falls, or, with a raid leader, until the boss
+or the leader falls, the same as the host of a party fight.
+
+The raiders' health, attack and armor are held as NumPy arrays, and each round is resolved in one step:
+every raider's attack and the boss' counter-attack are drawn at once and looked up in the damage tables
+from fight_engine.py, then a running total of the damage finds the raider who fells the boss, so only
+the raiders before them take their turns. A round costs a few array operations whatever the size of
+the raid.
+
+Run it from the elden_ring directory to raid a main boss with random starting classes:
+
+    python raid.py [RAIDERS] [BOSS_NAME]
+
+NumPy is only needed for this module, it is never imported by the game itself.
+
+Classes:
+    RaidResult:
+        A named tuple holding the outcome of a raid.
+
+Functions:
+    simulate_raid(player_health, player_attack, player_armor, boss, seed=None,
+                  leader=False) -> RaidResult:
+        Runs a raid of players held as arrays against a boss, brother!
+
+    raid(players, boss, seed=None, leader=False) -> RaidResult:
+        Runs a raid of fight_engine.Fighters or characters against a boss, brother!
+
+    raiders(count, classes=None, seed=None) -> tuple:
+        Returns the health, attack and armor arrays of raiders of random starting classes.
+
+    world_boss(boss_name=None, raiders=1) -> fight_engine.Fighter:
+        Returns a main boss with its health scaled up for a raid.
+
+    main():
+        Runs a raid and prints the outcome.
+"""
+
+import sys
+import time
+from collections import namedtuple
+import character
+import fight_engine
+import game_data
+
+
+# won: True if the boss was felled. rounds: the number of rounds fought.
+# boss_health: the boss' health at the end, not floored at 0. player_health
+# and damage_dealt: integer arrays in the order of the raiders, with the
+# player health floored at 0.
+RaidResult = namedtuple('RaidResult', ['won', 'rounds', 'boss_health', 'player_health',
+                                       'damage_dealt'])
+
+
+def _tables(values, table):
+    """_tables Return the flattened damage tables of every distinct value and
+    each raider's offset into them.
+    """
+    import numpy as np
+
+    distinct, index = np.unique(values, return_inverse=True)
+    tables = np.array([table(int(value)) for value in distinct], dtype=np.int64).ravel()
+    return tables, index.ravel() * fight_engine.OUTCOMES
+
+
+def simulate_raid(player_health, player_attack, player_armor, boss, seed=None, leader=False):
+    """simulate_raid Run a raid of players held as arrays against a boss. The
+    raid is lost when every raider has no health left, or as soon as the first
+    raider has no health left if they lead the raid.
+
+    Args:
+        player_health (array): The raiders' starting health.
+        player_attack (array): The raiders' attack ratings.
+        player_armor (array): The raiders' armor.
+        boss (fight_engine.Fighter): The Fighter of the boss.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+        leader (bool, optional): If True, the first raider is the host of the
+        raid, the same as a party fight. Defaults to False.
+
+    Raises:
+        ValueError: If there are no raiders.
+
+    Returns:
+        RaidResult: The outcome of the raid.
+    """
+    import numpy as np
+
+    generator = np.random.default_rng(seed)
+    health = np.array(player_health, dtype=np.int64).ravel()
+    if not health.size:
+        raise ValueError('A raid takes at least 1 raider')
+    attack_tables, attack_offset = _tables(
+        np.asarray(player_attack).ravel(),
+        lambda attack: fight_engine.damage_table(attack, boss.armor))
+    hit_tables, hit_offset = _tables(
+        np.asarray(player_armor).ravel(),
+        lambda armor: fight_engine.damage_table(boss.attack, armor))
+    dealt = np.zeros(health.size, dtype=np.int64)
+    boss_health = boss.health
+    rounds = 0
+
+    # Only the raiders still standing take a turn, in raider order.
+    standing = np.flatnonzero(health > 0)
+    while boss_health > 0 and standing.size and (not leader or standing[0] == 0):
+        rounds += 1
+        outcomes = generator.integers(0, fight_engine.OUTCOMES, size=(2, standing.size))
+        damage = attack_tables[attack_offset[standing] + outcomes[0]]
+        hits = hit_tables[hit_offset[standing] + outcomes[1]]
+
+        # The boss is felled by the first attack that brings the total damage
+        # of the round up to its health, and nobody after it takes a turn.
+        total = np.cumsum(damage)
+        felled_by = int(np.searchsorted(total, boss_health))
+        attackers = min(felled_by + 1, standing.size)
+
+        # The leader attacks first. If the boss survives and the leader falls
+        # to its counter-attack, the raid is over before anyone else attacks.
+        if leader and felled_by > 0 and health[0] <= hits[0]:
+            attackers = 1
+        turns = standing[:attackers]
+        dealt[turns] += damage[:attackers]
+        boss_health -= int(total[attackers - 1])
+
+        # Everyone who attacked without felling the boss takes its hit back.
+        hit_back = attackers if boss_health > 0 else attackers - 1
+        health[standing[:hit_back]] -= hits[:hit_back]
+        np.maximum(health, 0, out=health)
+        standing = standing[health[standing] > 0]
+
+    return RaidResult(boss_health <= 0, rounds, boss_health, health, dealt)
+
+
+def raid(players, boss, seed=None, leader=False):
+    """raid Run a raid of players against a boss.
+
+    Args:
+        players (list): The fight_engine.Fighters or character.Character
+        objects of the raiders.
+        boss (fight_engine.Fighter or boss.Boss): The boss.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to roll with. Seeded by the OS if None. Defaults to None.
+        leader (bool, optional): If True, the first raider is the host of the
+        raid, the same as a party fight. Defaults to False.
+
+    Returns:
+        RaidResult: The outcome of the raid.
+    """
+    players = [player if isinstance(player, fight_engine.Fighter)
+               else fight_engine.from_character(player) for player in players]
+    if not isinstance(boss, fight_engine.Fighter):
+        boss = fight_engine.from_boss(boss)
+    return simulate_raid([player.health for player in players],
+                         [player.attack for player in players],
+                         [player.armor for player in players], boss, seed, leader)
+
+
+def raiders(count, classes=None, seed=None):
+    """raiders Return fresh raiders of random starting classes at full health.
+
+    Args:
+        count (int): The number of raiders.
+        classes (list, optional): The classes to pick from. Picks from every
+        class in character.CLASSES if None. Defaults to None.
+        seed (int or numpy.random.Generator, optional): The seed or the
+        generator to pick with. Seeded by the OS if None. Defaults to None.
+
+    Returns:
+        tuple: The health, attack and armor arrays of the raiders.
+    """
+    import numpy as np
+
+    templates = [fight_engine.from_character(character.Character.get_template(name))
+                 for name in classes or character.CLASSES]
+    picks = np.random.default_rng(seed).integers(0, len(templates), size=count)
+    return tuple(np.array([getattr(template, field) for template in templates],
+                          dtype=np.int64)[picks]
+                 for field in ('health', 'attack', 'armor'))
+
+
+def world_boss(boss_name=None, raiders=1):
+    """world_boss Return a main boss from the main boss list with its health
+    multiplied by the number of raiders, so a big raid does not fell it in a
+    single round.
+
+    Args:
+        boss_name (str, optional): The name of the boss. Picks a random main
+        boss if None. Defaults to None.
+        raiders (int, optional): The number of raiders. Defaults to 1.
+
+    Raises:
+        KeyError: If the boss is not in the main boss list.
+
+    Returns:
+        fight_engine.Fighter: The boss.
+    """
+    roster = game_data.get_boss_roster()
+    entry = roster.get('main', boss_name) if boss_name else roster.random_boss('main')
+    return fight_engine.Fighter(entry.name, entry.health * raiders, entry.attack, entry.armor)
+
+
+def main():
+    """main Raid a main boss with raiders of random starting classes and print
+    the outcome.
+    """
+    try:
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+        boss_fighter = world_boss(sys.argv[2] if len(sys.argv) > 2 else None, count)
+    except (ValueError, KeyError):
+        print('Usage: python raid.py [RAIDERS] [BOSS_NAME]')
+        sys.exit(1)
+
+    print(f'{count} raiders VS {boss_fighter.name} ({boss_fighter.health} health)')
+    start = time.perf_counter()
+    result = simulate_raid(*raiders(count), boss_fighter)
+    elapsed = time.perf_counter() - start
+    print(f'{"ENEMY FELLED" if result.won else "YOU DIED"} after {result.rounds} rounds '
+          f'in {elapsed:.3f}s')
+    print(f'{int((result.player_health > 0).sum())} of {count} raiders still standing, '
+          f'top damage {int(result.damage_dealt.max())}')
+
+
+if __name__ == "__main__":
+    main()
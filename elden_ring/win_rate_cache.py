@@ -0,0 +1,218 @@
+"""
+win_rate_cache.py
+
+Listen up, brother! This module keeps the win rate of every starting class against every boss in the
+boss lists in a cache file on disk, so the whole matrix does not have to be worked out again after every
+data edit. Every cell of the matrix is stored under a key made from the content hashes of everything it
+depends on:
+
+    - the class .json file, from the source hashes kept in the game data bundle,
+    - the rows of the weapons in the class' hands,
+    - the boss row with its tier's health, attack and armor.
+
+When a class file, a weapon row or a boss row changes, only the cells whose key changed are worked out
+again, and every other cell is read from the cache. The win rates are solved exactly with exact_solver.py
+by default, or estimated with monte_carlo.py if a number of samples is given. Each method keeps its own
+cells.
+
+Run it from the elden_ring directory to print or save the matrix:
+
+    python win_rate_cache.py [--samples SAMPLES] [OUTPUT_FILE.csv]
+
+Functions:
+    class_key(class_name) -> str:
+        Returns the content hash of a class and the weapons in its hands, brother!
+
+    boss_key(tier, entry) -> str:
+        Returns the content hash of a boss row with its tier's stats.
+
+    cached_win_matrix(samples=None, seed=None, cache_path=CACHE_PATH) -> tuple:
+        Returns the win rate matrix, working out only the cells that are not in the cache, brother!
+
+    main():
+        Prints the win rate matrix or writes it to a ';' separated file.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import character
+import data_bundle
+import fight_engine
+import game_data
+import monte_carlo
+
+
+CACHE_PATH = os.path.join(data_bundle.DATA_PATH, 'win-rates.cache')
+CACHE_VERSION = 1   # Increase when the fight rules change, so every cell is worked out again.
+
+
+def _digest(values):
+    """_digest Return the SHA-256 hex digest of a list of JSON values.
+    """
+    return hashlib.sha256(json.dumps(values).encode('UTF-8')).hexdigest()
+
+
+def class_key(class_name):
+    """class_key Return the content hash of a class: the hash of its .json
+    file and the rows of the weapons in its hands.
+
+    Args:
+        class_name (str): The name of the class, e.g. 'Samurai'.
+
+    Returns:
+        str: The SHA-256 hex digest of the class.
+    """
+    data = game_data.load_game_data()
+    class_file = os.path.join('classes', class_name.lower() + '.json')
+    equipment = data['classes'][class_name.lower()]['Equipment']
+    weapons = game_data.get_weapon_catalog()
+    hands = [list(weapons.get(equipment[hand])) if equipment[hand] else None
+             for hand in ('Right Hand', 'Left Hand')]
+    return _digest([data['sources'][class_file], hands])
+
+
+def boss_key(tier, entry):
+    """boss_key Return the content hash of a boss row with its tier's health,
+    attack and armor applied.
+
+    Args:
+        tier (str): 'field', 'mini' or 'main'.
+        entry (game_data.BossEntry): The boss.
+
+    Returns:
+        str: The SHA-256 hex digest of the boss.
+    """
+    return _digest([tier] + list(entry))
+
+
+def _load_cache(cache_path):
+    """_load_cache Return the cells of every method in the cache file, or an
+    empty cache if the file is missing, damaged or from an older version.
+    """
+    try:
+        with open(cache_path, 'r', encoding='UTF-8') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('methods', {})
+
+
+def _save_cache(cache_path, methods):
+    """_save_cache Write the cells of every method to the cache file.
+    """
+    # Write to a temporary file first so a half written cache is never read.
+    temp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'w', encoding='UTF-8') as file:
+            json.dump({'version': CACHE_VERSION, 'methods': methods}, file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # The matrix is still returned if the cache cannot be written, e.g.
+        # from a read-only install.
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def cached_win_matrix(samples=None, seed=None, cache_path=CACHE_PATH):
+    """cached_win_matrix Return the chance of every starting class felling
+    every boss in the boss lists, from a fresh character at full health. Only
+    the cells that are not in the cache are worked out, then the cache is
+    updated. Cells that no longer belong to the matrix are dropped from it.
+
+    Args:
+        samples (int, optional): The number of fights simulated with
+        monte_carlo.py for every cell. The cells are solved exactly with
+        exact_solver.py if None. Defaults to None.
+        seed (int, optional): The seed to roll with when simulating. Seeded by
+        the OS if None. Defaults to None.
+        cache_path (str, optional): Path of the cache file, or None to work
+        out every cell without a cache. Defaults to CACHE_PATH.
+
+    Returns:
+        tuple: A list of monte_carlo.MatrixRow in the order of
+        monte_carlo.boss_rows(), and the number of cells that were worked out.
+    """
+    method = 'exact' if samples is None else f'monte-carlo:{samples}'
+    methods = _load_cache(cache_path) if cache_path is not None else {}
+    cached = methods.get(method, {})
+
+    fighters = dict(zip(character.CLASSES, monte_carlo.class_fighters()))
+    class_keys = {name: class_key(name) for name in character.CLASSES}
+    bosses = monte_carlo.boss_rows()
+    cells = {}
+    missing = {}
+    for tier, _, entry in bosses:
+        boss_fighter = fight_engine.Fighter(entry.name, entry.health, entry.attack, entry.armor)
+        for name in character.CLASSES:
+            key = f'{class_keys[name]}:{boss_key(tier, entry)}'
+            if key in cached:
+                cells[key] = cached[key]
+            else:
+                missing[key] = (fighters[name], boss_fighter)
+
+    if missing:
+        matchups = list(missing.values())
+        if samples is None:
+            # Imported here since the exact solver is only needed for this method.
+            import exact_solver
+            rates = [exact_solver.solve_fight([player], boss_fighter).win_probability
+                     for player, boss_fighter in matchups]
+        else:
+            rates = monte_carlo.win_rates(matchups, samples, seed)
+        cells.update(zip(missing, rates))
+
+    if cache_path is not None and (missing or len(cells) != len(cached)):
+        methods[method] = cells
+        _save_cache(cache_path, methods)
+
+    matrix = [monte_carlo.MatrixRow(tier, row, entry.name, entry.health,
+                                    {name: cells[f'{class_keys[name]}:{boss_key(tier, entry)}']
+                                     for name in character.CLASSES})
+              for tier, row, entry in bosses]
+    return matrix, len(missing)
+
+
+def main():
+    """main Print the win rate of every starting class against every boss, or
+    write them to a ';' separated file if a file name is given.
+    """
+    parser = argparse.ArgumentParser(
+        description='Win rates of every class against every boss, brother!')
+    parser.add_argument('--samples', type=int,
+                        help='simulate this many fights per cell instead of solving exactly')
+    parser.add_argument('output', nargs='?', help="';' separated file to write the matrix to")
+    arguments = parser.parse_args()
+
+    try:
+        matrix, worked_out = cached_win_matrix(arguments.samples)
+    except FileNotFoundError as error:
+        print(f'\nFile {error.filename} not found! Exiting...')
+        sys.exit(1)
+    except data_bundle.DataValidationError as error:
+        print(f'\n{error}\nExiting...')
+        sys.exit(1)
+
+    lines = [';'.join(['Tier', 'Row', 'Name', 'Health'] + character.CLASSES)]
+    for matrix_row in matrix:
+        lines.append(';'.join([matrix_row.tier, str(matrix_row.row), matrix_row.name,
+                               str(matrix_row.health)] +
+                              [f'{matrix_row.win_rates[name]:.4f}' for name in character.CLASSES]))
+
+    cells = len(matrix) * len(character.CLASSES)
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='UTF-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        print(f'Win rates of {len(character.CLASSES)} classes against {len(matrix)} bosses '
+              f'written to {arguments.output}')
+    else:
+        print('\n'.join(lines))
+    print(f'{worked_out} of {cells} cells worked out, {cells - worked_out} read from the cache.')
+
+
+if __name__ == "__main__":
+    main()
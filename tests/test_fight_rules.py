@@ -0,0 +1,142 @@
+"""
+test_fight_rules.py
+
+Listen up, brother! These tests lock in the rules every fight follows, whoever resolves it: the Host ->
+Boss -> Summon -> Boss turn order, the fight ending as soon as the host falls, and the exact solver agreeing
+with the fight engine. The interactive fights run on pacing.py's virtual clock, so they finish at once.
+
+Run them from the repository root:
+
+    python -m pytest tests
+"""
+
+import itertools
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'elden_ring')))
+
+import battles
+import boss
+import character
+import dice
+import fight_engine
+import pacing
+
+
+BOSS = fight_engine.BOSS
+MISS = 0                                # d20 = 1, misses any armor above 1.
+MAX_HIT = fight_engine.OUTCOMES - 1     # d20 = 20 and d10 = 10.
+
+
+@pytest.fixture
+def virtual_clock():
+    """Run the test on a fresh virtual clock and put the normal clock back."""
+    pacing.set_mode('virtual')
+    yield
+    pacing.set_mode('normal')
+
+
+def _events(players, boss_fighter, rng):
+    """Return every Attack of a fight and its FightResult."""
+    events = fight_engine.fight_events(players, boss_fighter, rng)
+    attacks = []
+    while True:
+        try:
+            attacks.append(next(events))
+        except StopIteration as stop:
+            return attacks, stop.value
+
+
+def test_turn_order_host_boss_summon_boss():
+    players = [fight_engine.Fighter('Host', 500, 10, 11),
+               fight_engine.Fighter('Summon', 500, 10, 11),
+               fight_engine.Fighter('Summon 2', 500, 10, 11)]
+    attacks, _ = _events(players, fight_engine.Fighter('Boss', 300, 10, 12), random.Random(7))
+
+    expected = itertools.cycle([(0, BOSS), (BOSS, 0), (1, BOSS), (BOSS, 1), (2, BOSS), (BOSS, 2)])
+    for attack, (attacker, target) in zip(attacks, expected):
+        assert (attack.attacker, attack.target) == (attacker, target)
+
+
+def test_turn_order_skips_fallen_summons():
+    health = [10, 0, 10]
+    turns = fight_engine.turn_order(health)
+    assert [next(turns) for _ in range(4)] == [(1, 0), (1, 2), (2, 0), (2, 2)]
+
+
+def test_fight_ends_when_host_falls():
+    players = [fight_engine.Fighter('Host', 10, 10, 1),
+               fight_engine.Fighter('Summon', 500, 10, 1)]
+    boss_fighter = fight_engine.Fighter('Boss', 1000, 1000, 20)
+    attacks, result = _events(players, boss_fighter, random.Random(3))
+
+    # Every boss attack hits armor 1, so the host falls to the first one and
+    # the summon never gets a turn.
+    assert [(attack.attacker, attack.target) for attack in attacks] == [(0, BOSS), (BOSS, 0)]
+    assert not result.won
+    assert result.player_health == (0, 500)
+    assert fight_engine.resolve_fight(players, boss_fighter, random.Random(3)) == result
+
+
+@pytest.mark.parametrize('size', [1, 2, 3])
+def test_resolve_fight_matches_fight_events(size):
+    players = [fight_engine.Fighter('Host', 300, 40, 13), fight_engine.Fighter('Summon', 200, 30, 11),
+               fight_engine.Fighter('Summon 2', 150, 50, 11)][:size]
+    boss_fighter = fight_engine.Fighter('Boss', 900, 45, 12)
+    for seed in range(50):
+        _, result = _events(players, boss_fighter, random.Random(seed))
+        assert fight_engine.resolve_fight(players, boss_fighter, random.Random(seed)) == result
+
+
+def test_fight_already_over_lasts_no_rounds():
+    host = fight_engine.Fighter('Host', 100, 10, 10)
+    felled = fight_engine.Fighter('Boss', 0, 10, 10)
+    assert fight_engine.resolve_fight([host], felled).rounds == 0
+    assert fight_engine.resolve_fight([host, host], felled).rounds == 0
+
+
+@pytest.mark.parametrize('players, boss_fighter', [
+    ([fight_engine.Fighter('Host', 200, 40, 11)], fight_engine.Fighter('Boss', 800, 60, 12)),
+    ([fight_engine.Fighter('Host', 150, 35, 13), fight_engine.Fighter('Summon', 150, 35, 11)],
+     fight_engine.Fighter('Boss', 1200, 70, 12)),
+])
+def test_exact_solver_agrees_with_fight_engine(players, boss_fighter):
+    pytest.importorskip('numpy')
+    import exact_solver
+
+    samples = 20000
+    rng = random.Random(11)
+    wins = sum(fight_engine.resolve_fight(players, boss_fighter, rng).won for _ in range(samples))
+    probability = exact_solver.solve_fight(players, boss_fighter).win_probability
+
+    # Within 4 standard errors of the simulated win rate.
+    margin = 4 * (probability * (1 - probability) / samples) ** 0.5
+    assert abs(wins / samples - probability) <= margin
+
+
+def test_boss_fight_order_and_host_death_exit(virtual_clock, monkeypatch, capsys):
+    # Every player attack misses and every boss attack hits as hard as it can.
+    rolls = itertools.cycle([MISS, MAX_HIT])
+    monkeypatch.setattr(dice, 'randbelow', lambda n: next(rolls))
+    monkeypatch.setattr('builtins.input', lambda *args: '')
+
+    players = [character.Character.create('Vagabond', 'Host', stats={'Vig': 2}),
+               character.Character.create('Vagabond', 'Summon', stats={'Vig': 50})]
+    boss_obj = boss.Boss.create()
+    with pytest.raises(SystemExit) as exit_info:
+        battles.boss_fight(players, boss_obj, 'tutorial')
+
+    assert exit_info.value.code == 0
+    output = capsys.readouterr().out
+    assert 'YOU DIED' in output and 'ENEMY FELLED' not in output
+    phases = [line for line in output.splitlines() if line.endswith('attack phase.')]
+    assert phases[:4] == ['Host attack phase.', 'Boss attack phase.',
+                          'Summon attack phase.', 'Boss attack phase.']
+    assert players[0].get_health() <= 0 < players[1].get_health()
+
+    # The pauses were recorded on the virtual clock instead of slept.
+    assert pacing.delays() and pacing.elapsed() > 0